@@ -0,0 +1,259 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import shutil
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Dict, List, Optional, TYPE_CHECKING
+
+from semanticabi.BlockPipeline import BlockPipeline, BlockRows
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.abi.SemanticAbi import TypedSemanticAbi
+from semanticabi.metadata.EvmChain import EvmChain
+from semanticabi.sink.ParquetSink import ParquetSink
+
+if TYPE_CHECKING:
+    from semanticabi.BlockFetcher import BlockFetcher
+
+MANIFEST_NAME = '_manifest.json'
+STAGING_DIRECTORY = '_staging'
+
+
+@dataclass(frozen=True)
+class WorkUnit:
+    """
+    Contiguous range of blocks processed and committed together.
+    """
+    # inclusive
+    start: int
+    # exclusive
+    end: int
+
+    @property
+    def id(self) -> str:
+        # zero padded so files from units sort by block
+        return f'{self.start:010d}-{self.end:010d}'
+
+    @property
+    def blocks(self) -> range:
+        return range(self.start, self.end)
+
+    @staticmethod
+    def split(start: int, end: int, size: int) -> List[WorkUnit]:
+        """
+        Split the range of blocks into units of a fixed size.
+        """
+        return [WorkUnit(unit_start, min(unit_start + size, end)) for unit_start in range(start, end, size)]
+
+
+class BackfillManifest:
+    """
+    Local record of the units of a backfill and which have been committed along with their files. The units are
+    fixed when the manifest is created so a restart always resumes with the same plan, and every update is written to
+    a temporary file and renamed so a crash can't leave a corrupt manifest.
+    """
+
+    path: str
+    start: int
+    end: int
+    units: List[WorkUnit]
+    # files relative to the output root by id of completed units
+    completed: Dict[str, List[str]]
+
+    @staticmethod
+    def load_or_create(path: str, start: int, end: int, units: List[WorkUnit]) -> BackfillManifest:
+        """
+        Load the manifest if it exists for the same range, otherwise create it with the given units.
+        """
+        if not os.path.exists(path):
+            manifest = BackfillManifest(path, start, end, units, {})
+            manifest.save()
+            return manifest
+
+        with open(path, 'r') as file:
+            manifest_json = json.load(file)
+
+        if manifest_json['start'] != start or manifest_json['end'] != end:
+            raise Exception(
+                f'Manifest at {path} is for blocks {manifest_json["start"]} to {manifest_json["end"]}, not {start} to {end}.'
+            )
+
+        return BackfillManifest(
+            path,
+            start,
+            end,
+            [WorkUnit(unit[0], unit[1]) for unit in manifest_json['units']],
+            manifest_json['completed']
+        )
+
+    def __init__(self, path: str, start: int, end: int, units: List[WorkUnit], completed: Dict[str, List[str]]):
+        self.path = path
+        self.start = start
+        self.end = end
+        self.units = units
+        self.completed = completed
+
+    @property
+    def remaining(self) -> List[WorkUnit]:
+        return [unit for unit in self.units if unit.id not in self.completed]
+
+    def complete(self, unit: WorkUnit, files: List[str]):
+        self.completed[unit.id] = files
+        self.save()
+
+    def save(self):
+        temp_path = f'{self.path}.tmp'
+        with open(temp_path, 'w') as file:
+            json.dump({
+                'start': self.start,
+                'end': self.end,
+                'units': [[unit.start, unit.end] for unit in self.units],
+                'completed': self.completed
+            }, file)
+            file.flush()
+            os.fsync(file.fileno())
+
+        os.replace(temp_path, self.path)
+
+
+class Backfill:
+    """
+    Transform a range of blocks into partitioned Parquet, resumable at the granularity of work units. Each unit is
+    written to a staging directory and only moved into place once complete, with files named by unit so a unit that
+    is retried replaces rather than duplicates output. Units are committed to the manifest after their files are in
+    place so only missing units are processed on restart. A unit that fails deletes any files its sink was still
+    writing.
+    """
+
+    _fetcher: BlockFetcher
+    _chain: EvmChain
+    _abi_json: TypedSemanticAbi
+    # shared by all units for their schema, fetch plan and transforming in this process
+    _transformer: SemanticTransformer
+    _output_root: str
+    _manifest_path: str
+
+    _workers: int
+    _processes: int
+    _fetch_concurrency: int
+    _sink_kwargs: Dict[str, any]
+
+    def __init__(
+        self,
+        fetcher: BlockFetcher,
+        chain: EvmChain,
+        abi_json: TypedSemanticAbi,
+        output_root: str,
+        *,
+        # defaults to a manifest in the output root
+        manifest_path: Optional[str] = None,
+        # units processed at once
+        workers: int = 4,
+        # processes shared by all units for transforming, 0 to transform on threads of this process
+        processes: int = 4,
+        # blocks fetched at once for each unit
+        fetch_concurrency: int = 4,
+        # passed to the ParquetSink for each unit
+        **sink_kwargs
+    ):
+        self._fetcher = fetcher
+        self._chain = chain
+        self._abi_json = abi_json
+        self._transformer = SemanticTransformer(abi_json)
+        self._output_root = output_root
+        self._manifest_path = os.path.join(output_root, MANIFEST_NAME) if manifest_path is None else manifest_path
+
+        self._workers = workers
+        self._processes = processes
+        self._fetch_concurrency = fetch_concurrency
+        self._sink_kwargs = sink_kwargs
+
+    async def run(self, start: int, end: int, unit_size: int = 1000) -> BackfillManifest:
+        """
+        Backfill blocks from start (inclusive) to end (exclusive), resuming from the manifest if there is one.
+        """
+        return await self.run_units(start, end, WorkUnit.split(start, end, unit_size))
+
+    async def run_units(self, start: int, end: int, units: List[WorkUnit]) -> BackfillManifest:
+        """
+        Backfill with a specific set of units covering the range, processed in the order given by workers that each
+        pull the next unit once done.
+        """
+        os.makedirs(self._output_root, exist_ok=True)
+        manifest = BackfillManifest.load_or_create(self._manifest_path, start, end, units)
+
+        queue: asyncio.Queue = asyncio.Queue()
+        for unit in manifest.remaining:
+            queue.put_nowait(unit)
+
+        executor: Optional[Executor] = None
+        if self._processes > 0:
+            executor = BlockPipeline.process_pool([self._abi_json], self._processes)
+
+        async def work():
+            while not queue.empty():
+                unit = queue.get_nowait()
+                manifest.complete(unit, await self._run_unit(unit, executor))
+
+        workers = [asyncio.create_task(work()) for _ in range(self._workers)]
+        try:
+            await asyncio.gather(*workers)
+        except BaseException:
+            for worker in workers:
+                worker.cancel()
+            raise
+        finally:
+            self._transformer.close()
+            if executor is not None:
+                # waiting for the processes to exit would otherwise block the event loop
+                await asyncio.to_thread(executor.shutdown, cancel_futures=True)
+
+        return manifest
+
+    async def _run_unit(self, unit: WorkUnit, executor: Optional[Executor]) -> List[str]:
+        """
+        Process a unit into staging, then move its files into place returning their paths relative to the output root.
+        """
+        staging_root = os.path.join(self._output_root, STAGING_DIRECTORY, unit.id)
+        # clear anything left from a previous attempt
+        shutil.rmtree(staging_root, ignore_errors=True)
+
+        sink = ParquetSink.from_transformer(staging_root, self._transformer, file_prefix=unit.id, **self._sink_kwargs)
+
+        def write(block_number: int, rows: BlockRows):
+            sink.write(rows[0])
+
+        pipeline = BlockPipeline(
+            self._fetcher,
+            self._chain,
+            [self._abi_json],
+            write,
+            fetch_concurrency=self._fetch_concurrency,
+            processes=self._processes,
+            executor=executor,
+            transformers=[self._transformer]
+        )
+        try:
+            await pipeline.run(unit.blocks)
+            await asyncio.to_thread(sink.close)
+        except BaseException:
+            try:
+                sink.abort()
+            except Exception as e:
+                # the original failure is what matters, files left in staging are cleared on the next attempt
+                logging.error(f'Failed to abort unit {unit.id}: {e}')
+            raise
+
+        files: List[str] = []
+        for staged_path in sink.written:
+            file = os.path.relpath(staged_path, staging_root)
+            path = os.path.join(self._output_root, file)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(staged_path, path)
+            files.append(file)
+
+        shutil.rmtree(staging_root, ignore_errors=True)
+        return files
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import json
 from contextlib import AsyncExitStack
 from enum import Enum
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 import aiohttp
+from Crypto.Hash import keccak
 from aiohttp import ClientSession
 
-from semanticabi.metadata.EthBlockJson import EthBlockJson, BlockInfoJson
+from semanticabi.FetchPlan import FetchPlan
+from semanticabi.common.JsonDecoder import JsonDecoder
+from semanticabi.common.ValueConverter import ValueConverter
+from semanticabi.metadata.EthBlockJson import EthBlockJson, BlockInfoJson, GethTraceRootJson, BlockTransactionJson
 from semanticabi.metadata.EthReceipt import EthReceipt
 
 
@@ -19,52 +24,113 @@ class BlockFetcher:
     """
     _node_url: str
     _node_type: NodeType
+    _json_decoder: JsonDecoder
+    _max_connections: int
+    _trace_transactions_threshold: Optional[int]
+    _trace_concurrency: int
+    _block_trace_timeout: float
+    _transaction_trace_timeout: float
+    _transaction_trace_retries: int
 
     _exit_stack: AsyncExitStack
     _session: ClientSession
 
-    def __init__(self, node_url: str, node_type: NodeType):
+    def __init__(
+        self,
+        node_url: str,
+        node_type: NodeType,
+        json_decoder: Optional[JsonDecoder] = None,
+        *,
+        # eth RPC calls are usually fast, small queries and will run up against rate limiters so default to 1
+        max_connections: int = 1,
+        # for geth, trace each transaction individually for blocks with more transactions than this or if tracing the
+        # entire block times out, if None always trace the block in a single call
+        trace_transactions_threshold: Optional[int] = None,
+        # max number of transactions traced at once when tracing individually, the connections are raised to at least
+        # this many if a threshold is set
+        trace_concurrency: int = 8,
+        # seconds allowed to trace an entire block on geth
+        block_trace_timeout: float = 500,
+        # seconds allowed to trace a single transaction on geth, and how many more times to try one that failed
+        transaction_trace_timeout: float = 60,
+        transaction_trace_retries: int = 2
+    ):
         self._node_url = node_url
         self._node_type = node_type
+        # use the fastest decoder available if not specified
+        self._json_decoder = JsonDecoder.default() if json_decoder is None else json_decoder
+        self._max_connections = max_connections
+        self._trace_transactions_threshold = trace_transactions_threshold
+        self._trace_concurrency = trace_concurrency
+        self._block_trace_timeout = block_trace_timeout
+        self._transaction_trace_timeout = transaction_trace_timeout
+        self._transaction_trace_retries = transaction_trace_retries
         self._exit_stack = AsyncExitStack()
 
     async def __aenter__(self) -> BlockFetcher:
+        max_connections = self._max_connections
+        if self._trace_transactions_threshold is not None:
+            # otherwise transactions would be traced one at a time whatever the concurrency
+            max_connections = max(max_connections, self._trace_concurrency)
+
         self._session = await self._exit_stack.enter_async_context(ClientSession(
-            # eth RPC calls are usually fast, small queries and will run up against rate limiters so default to 1
-            connector=aiohttp.TCPConnector(limit=1)
+            connector=aiohttp.TCPConnector(limit=max_connections)
         ))
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         await self._session.__aexit__(exc_type, exc_val, exc_tb)
 
-    async def fetch_block(self, block_number: int) -> EthBlockJson:
+    async def latest_block_number(self) -> int:
         """
-        Fetch a block with receipts and traces from the node
+        Number of the most recent block the node has.
         """
-        async with self._session.post(self._node_url, data=json.dumps({
-            'jsonrpc': '2.0',
-            'method': 'eth_getBlockByNumber',
-            'params': [hex(block_number), True],
-            'id': 1
-        })) as response:
-            if not response.ok:
-                raise Exception(f'Failed to fetch block {block_number}: {response.status} {response.reason}')
+        return ValueConverter.hex_to_int(await self._call('eth_blockNumber', [], 'latest block number'))
+
+    async def fetch_header(self, block_number: int) -> BlockInfoJson:
+        """
+        Fetch just the block with transaction hashes instead of full transactions, a cheap call to size up a block.
+        """
+        header: BlockInfoJson = await self._call(
+            'eth_getBlockByNumber', [hex(block_number), False], f'block header {block_number}'
+        )
+        if header is None:
+            raise Exception(f'Block {block_number} not found.')
 
-            response_json = await response.json()
-            block_info_json: BlockInfoJson = response_json['result']
+        return header
+
+    async def fetch_block(self, block_number: int, plan: Optional[FetchPlan] = None) -> EthBlockJson:
+        """
+        Fetch a block with receipts and traces from the node. If given a plan, only fetch what's needed with traces
+        omitted from the block if not needed.
+        """
+        plan = FetchPlan.all() if plan is None else plan
 
-            receipts = await self._get_block_receipts(block_number) if self._node_type == NodeType.ERIGON else \
-                await self._get_transaction_receipts(block_info_json)
+        block_info_json: BlockInfoJson = await self._call(
+            'eth_getBlockByNumber', [hex(block_number), True], f'block {block_number}'
+        )
+        if block_info_json is None:
+            raise Exception(f'Block {block_number} not found.')
 
+        traces: Optional[List[any]] = None
+        if plan.traces:
             traces = await self.trace_block_erigon(block_number) if self._node_type == NodeType.ERIGON else \
-                await self._trace_block_geth(block_number)
+                await self._trace_block_geth(block_info_json)
+
+        if self._node_type == NodeType.ERIGON:
+            # a single call for all receipts is cheap enough to always make
+            receipts = await self._get_block_receipts(block_number)
+        elif plan.logs or traces is None:
+            receipts = await self._get_transaction_receipts(block_info_json)
+        else:
+            # geth receipts are a call per transaction, if logs aren't needed what's left can be built from the traces
+            receipts = BlockFetcher._receipts_from_geth_traces(block_info_json, traces)
 
-            return EthBlockJson(
-                block=block_info_json,
-                receipts=receipts,
-                traces=traces
-            )
+        block_json = EthBlockJson(block=block_info_json, receipts=receipts)
+        if traces is not None:
+            block_json['traces'] = traces
+
+        return block_json
 
     async def _get_transaction_receipts(
         self,
@@ -85,85 +151,162 @@ class BlockFetcher:
         """
         Get a receipt for a single transaction
         """
-        async with self._session.post(
-            self._node_url,
-            headers={'content-type': 'application/json'},
-            data=json.dumps({
-                'jsonrpc': '2.0',
-                'method': 'eth_getTransactionReceipt',
-                'params': [transaction_hash],
-                'id': 1
+        return await self._call(
+            'eth_getTransactionReceipt', [transaction_hash], f'transaction receipt for transaction {transaction_hash}'
+        )
+
+    @staticmethod
+    def _receipts_from_geth_traces(block: BlockInfoJson, traces: List[GethTraceRootJson]) -> List[EthReceipt]:
+        """
+        Build receipts without logs from the "callTracer" root of each transaction. The root gas used matches the
+        receipt and status is left empty to be derived from the root trace error.
+        """
+        receipts: List[EthReceipt] = []
+        for transaction, trace in zip(block['transactions'], traces):
+            root = trace.get('result', {})
+            receipts.append({
+                'blockHash': block['hash'],
+                'blockNumber': block['number'],
+                'transactionHash': transaction['hash'],
+                'transactionIndex': transaction['transactionIndex'],
+                'from': transaction['from'],
+                'to': transaction['to'],
+                'contractAddress': BlockFetcher._created_contract_address(transaction)
+                    if transaction['to'] is None else None,
+                'gasUsed': root.get('gasUsed'),
+                'status': None,
+                'logs': []
             })
-        ) as response:
-            if not response.ok:
-                raise Exception(f'Failed to transaction receipt for transaction {transaction_hash}: {response.status} {response.reason}')
 
-            receipt = await response.json()
+        return receipts
 
-            return receipt['result']
+    @staticmethod
+    def _created_contract_address(transaction: BlockTransactionJson) -> str:
+        """
+        Address of the contract deployed by a transaction, computed from the sender and nonce since the root trace of
+        a failed deployment won't have it.
+        """
+        sender = bytes.fromhex(transaction['from'][2:])
+        nonce = ValueConverter.hex_to_int(transaction['nonce'])
+        nonce_bytes = nonce.to_bytes((nonce.bit_length() + 7) // 8, 'big')
+
+        # RLP encode [sender, nonce], which is always short enough for single byte list and string prefixes
+        if nonce == 0:
+            encoded_nonce = b'\x80'
+        elif nonce < 0x80:
+            encoded_nonce = nonce_bytes
+        else:
+            encoded_nonce = bytes([0x80 + len(nonce_bytes)]) + nonce_bytes
+        payload = bytes([0x80 + len(sender)]) + sender + encoded_nonce
+
+        address_hash = keccak.new(digest_bits=256)
+        address_hash.update(bytes([0xc0 + len(payload)]) + payload)
+        return '0x' + address_hash.digest()[12:].hex()
 
     async def _get_block_receipts(self, block_number: int) -> List[EthReceipt]:
         """
         Get all receipts for a block in a single call, this is only supported on erigon clients.
         """
-        async with self._session.post(
-            self._node_url,
-            headers={'content-type': 'application/json'},
-            data=json.dumps({
-                'jsonrpc': '2.0',
-                'method': 'eth_getBlockReceipts',
-                'params': [hex(block_number)],
-                'id': 1
-            })
-        ) as response:
-            if not response.ok:
-                raise Exception(f'Failed to fetch block receipts for {block_number}: {response.status} {response.reason}')
+        return await self._call('eth_getBlockReceipts', [hex(block_number)], f'block receipts for {block_number}')
 
-            receipts = await response.json()
+    async def _trace_block_geth(self, block: BlockInfoJson) -> List[GethTraceRootJson]:
+        """
+        Gets the transaction trace with the "callTracer" for a block. If adaptive tracing is enabled with a transaction
+        threshold, large blocks or blocks that time out are traced per transaction instead.
+        """
+        block_number = ValueConverter.hex_to_int(block['number'])
+        params = [hex(block_number), self._geth_tracer_config(self._block_trace_timeout)]
+        description = f'block traces for {block_number}'
 
-            return receipts['result']
+        if self._trace_transactions_threshold is None:
+            return await self._call('debug_traceBlockByNumber', params, description)
 
-    async def _trace_block_geth(self, block_number: int) -> List[Dict[str, any]]:
+        if len(block['transactions']) > self._trace_transactions_threshold:
+            return await self._trace_transactions_geth(block['transactions'])
+
+        try:
+            return await self._call('debug_traceBlockByNumber', params, description, self._block_trace_timeout)
+        except (asyncio.TimeoutError, RpcException):
+            # either the client gave up or the node reported the trace timed out, split the work up by transaction
+            return await self._trace_transactions_geth(block['transactions'])
+
+    async def _trace_transactions_geth(self, transactions: List[BlockTransactionJson]) -> List[GethTraceRootJson]:
         """
-        Gets the transaction trace with the "callTracer" for a block.
+        Trace each transaction individually with bounded concurrency, returning them in transaction order in the same
+        shape as tracing the entire block. Transactions that fail to trace are retried, if one still fails the error
+        names the transaction rather than failing later on a missing trace.
         """
-        async with self._session.post(
-            self._node_url,
-            headers={'content-type': 'application/json'},
-            data=json.dumps({
-                'jsonrpc': '2.0',
-                'method': 'debug_traceBlockByNumber',
-                'params': [hex(block_number), {'tracer': 'callTracer', 'timeout': '500s'}],
-                'id': 1
-            })
-        ) as response:
-            if not response.ok:
-                raise Exception(f'Failed to fetch block traces for {block_number}: {response.status} {response.reason}')
+        semaphore = asyncio.Semaphore(self._trace_concurrency)
+        tracer_config = self._geth_tracer_config(self._transaction_trace_timeout)
 
-            traces = await response.json()
+        async def trace(transaction_hash: str) -> GethTraceRootJson:
+            description = f'transaction trace for {transaction_hash}'
+            async with semaphore:
+                for attempt in range(self._transaction_trace_retries + 1):
+                    try:
+                        return {'result': await self._call(
+                            'debug_traceTransaction',
+                            [transaction_hash, tracer_config],
+                            description,
+                            self._transaction_trace_timeout
+                        )}
+                    except asyncio.TimeoutError:
+                        if attempt == self._transaction_trace_retries:
+                            raise Exception(f'Failed to fetch {description}: timed out')
+                    except RpcException:
+                        if attempt == self._transaction_trace_retries:
+                            raise
 
-            return traces['result']
+        # gather preserves the order of the transactions
+        return list(await asyncio.gather(*[trace(transaction['hash']) for transaction in transactions]))
+
+    @staticmethod
+    def _geth_tracer_config(timeout: float) -> Dict[str, any]:
+        return {'tracer': 'callTracer', 'timeout': f'{int(timeout)}s'}
 
     async def trace_block_erigon(self, block_number: int) -> List[Dict[str, any]]:
         """
         Call the erigon `trace_block` function.
         """
+        return await self._call('trace_block', [hex(block_number)], f'block traces for {block_number}')
+
+    async def _call(self, method: str, params: List[any], description: str, timeout: Optional[float] = None) -> any:
+        """
+        Make a JSON-RPC call to the node, returning the decoded result. Uses the session's timeout unless one is given.
+        """
+        request_kwargs = {} if timeout is None else {'timeout': aiohttp.ClientTimeout(total=timeout)}
         async with self._session.post(
             self._node_url,
             headers={'content-type': 'application/json'},
             data=json.dumps({
                 'jsonrpc': '2.0',
-                'method': 'trace_block',
-                'params': [hex(block_number)],
+                'method': method,
+                'params': params,
                 'id': 1
-            })
+            }),
+            **request_kwargs
         ) as response:
             if not response.ok:
-                raise Exception(f'Failed to fetch block traces for {block_number}: {response.status} {response.reason}')
+                raise Exception(f'Failed to fetch {description}: {response.status} {response.reason}')
+
+            # decode the raw bytes directly since faster decoders can skip building an intermediate string
+            response_json = self._json_decoder.loads(await response.read())
+            if 'error' in response_json:
+                raise RpcException(description, response_json['error'])
+
+            return response_json['result']
+
+
+class RpcException(Exception):
+    """
+    Exception that gets thrown if the node responds with a JSON-RPC error.
+    """
 
-            traces = await response.json()
+    message: str
 
-            return traces['result']
+    def __init__(self, description: str, error: Dict[str, any]):
+        self.message = error.get('message', str(error))
+        super().__init__(f'Failed to fetch {description}: {self.message}')
 
 
 class NodeType(Enum):
@@ -0,0 +1,226 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import shutil
+import uuid
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Dict, Optional, TYPE_CHECKING
+
+from semanticabi.FetchPlan import FetchPlan
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.abi.SemanticAbi import TypedSemanticAbi
+from semanticabi.metadata.ColumnarEthBlock import ColumnarEthBlock
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EthBlockJson import EthBlockJson
+from semanticabi.metadata.EvmChain import EvmChain
+
+if TYPE_CHECKING:
+    # only needed to fetch, so aiohttp isn't loaded by workers that only transform
+    from semanticabi.BlockFetcher import BlockFetcher
+
+# rows for each ABI in the order they were given to the pipeline
+BlockRows = List[List[Dict[str, any]]]
+# called with the block number and rows for each ABI, blocks are not guaranteed to be written in order
+BlockWriter = Callable[[int, BlockRows], None]
+
+
+class BlockPipeline:
+    """
+    Fetch, transform and write blocks in stages connected by bounded queues so network, CPU and disk work overlap.
+    Fetching runs on the event loop, parsing and transforming on a pool of processes, and writing on its own task with
+    slow stages applying backpressure to the ones before it.
+    """
+
+    _fetcher: BlockFetcher
+    _chain: EvmChain
+    _abi_jsons: List[TypedSemanticAbi]
+    _writer: BlockWriter
+    _transformers: List[SemanticTransformer]
+    _plan: FetchPlan
+
+    _fetch_concurrency: int
+    _processes: int
+    _queue_size: int
+    _executor: Optional[Executor]
+    _shared_directory: Optional[str]
+
+    def __init__(
+        self,
+        fetcher: BlockFetcher,
+        chain: EvmChain,
+        abi_jsons: List[TypedSemanticAbi],
+        writer: BlockWriter,
+        *,
+        # blocks fetched at once, the fetcher's max_connections should be at least as large
+        fetch_concurrency: int = 4,
+        # processes to parse and transform blocks in, 0 to transform on a thread of this process
+        processes: int = 4,
+        # max blocks waiting between each stage
+        queue_size: int = 8,
+        # pool from process_pool to share between pipelines, processes is then the number of concurrent transforms
+        executor: Optional[Executor] = None,
+        # if set, parse each block once into tables shared through this directory, ideally in /dev/shm, and transform
+        # each ABI in a separate process attached to the shared block
+        shared_directory: Optional[str] = None,
+        # transformers already built for the ABIs to reuse for the fetch plan and transforming in this process
+        transformers: Optional[List[SemanticTransformer]] = None
+    ):
+        if shared_directory is not None and executor is None and processes == 0:
+            raise Exception('Blocks can only be shared with a pool of processes to transform them.')
+
+        self._fetcher = fetcher
+        self._chain = chain
+        self._abi_jsons = abi_jsons
+        self._writer = writer
+        self._transformers = [SemanticTransformer(abi_json) for abi_json in abi_jsons] \
+            if transformers is None else transformers
+        self._plan = FetchPlan.from_transformers(self._transformers)
+
+        self._fetch_concurrency = fetch_concurrency
+        self._processes = processes
+        self._queue_size = queue_size
+        self._executor = executor
+        self._shared_directory = shared_directory
+
+    @staticmethod
+    def process_pool(abi_jsons: List[TypedSemanticAbi], processes: int) -> ProcessPoolExecutor:
+        """
+        Pool of processes with transformers for the ABIs that can be shared between pipelines.
+        """
+        return ProcessPoolExecutor(processes, initializer=_init_worker, initargs=(abi_jsons,))
+
+    async def run(self, block_numbers: Iterable[int]):
+        """
+        Run the pipeline until all blocks have been written, stopping everything if any stage fails.
+        """
+        numbers = iter(block_numbers)
+        fetched: asyncio.Queue = asyncio.Queue(self._queue_size)
+        transformed: asyncio.Queue = asyncio.Queue(self._queue_size)
+
+        executor: Optional[Executor] = self._executor
+        inline: Optional[_BlockTransformer] = None
+        if executor is None and self._processes > 0:
+            executor = BlockPipeline.process_pool(self._abi_jsons, self._processes)
+        elif executor is None:
+            inline = _BlockTransformer(self._transformers)
+
+        transform_concurrency = max(self._processes, 1)
+        fetchers = [asyncio.create_task(self._fetch(numbers, fetched)) for _ in range(self._fetch_concurrency)]
+        transformers = [
+            asyncio.create_task(self._transform(fetched, transformed, executor, inline))
+            for _ in range(transform_concurrency)
+        ]
+        writer = asyncio.create_task(self._write(transformed))
+
+        # once a stage finishes, signal each worker of the next stage that there's nothing left
+        stages = fetchers + transformers + [
+            writer,
+            asyncio.create_task(_close_after(fetchers, fetched, transform_concurrency)),
+            asyncio.create_task(_close_after(transformers, transformed, 1))
+        ]
+
+        try:
+            await asyncio.gather(*stages)
+        except BaseException:
+            for stage in stages:
+                stage.cancel()
+            raise
+        finally:
+            # only shut down pools owned by this pipeline, waiting for the processes off the event loop
+            if executor is not None and executor is not self._executor:
+                await asyncio.to_thread(executor.shutdown, cancel_futures=True)
+
+    async def _fetch(self, numbers: Iterator[int], fetched: asyncio.Queue):
+        # numbers are shared between fetchers, which is safe since they all run on the event loop
+        while (block_number := next(numbers, None)) is not None:
+            await fetched.put((block_number, await self._fetcher.fetch_block(block_number, self._plan)))
+
+    async def _transform(
+        self,
+        fetched: asyncio.Queue,
+        transformed: asyncio.Queue,
+        executor: Optional[Executor],
+        inline: Optional[_BlockTransformer]
+    ):
+        loop = asyncio.get_running_loop()
+        while (item := await fetched.get()) is not _DONE:
+            block_number, block_json = item
+            if executor is None:
+                # off the event loop so fetching continues while transforming
+                rows = await asyncio.to_thread(inline.transform, self._chain, block_json)
+            elif self._shared_directory is not None:
+                rows = await self._transform_shared(executor, block_number, block_json)
+            else:
+                rows = await loop.run_in_executor(executor, _transform_in_worker, self._chain, block_json)
+
+            await transformed.put((block_number, rows))
+
+    async def _transform_shared(self, executor: Executor, block_number: int, block_json: EthBlockJson) -> BlockRows:
+        """
+        Parse the block once into shared tables, then transform each ABI in parallel against the same copy.
+        """
+        directory = os.path.join(self._shared_directory, f'{block_number}-{uuid.uuid4().hex}')
+        await asyncio.to_thread(_share_block, self._chain, block_json, directory)
+
+        loop = asyncio.get_running_loop()
+        try:
+            return list(await asyncio.gather(*[
+                loop.run_in_executor(executor, _transform_shared_in_worker, self._chain, directory, abi_i)
+                for abi_i in range(len(self._abi_jsons))
+            ]))
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
+    async def _write(self, transformed: asyncio.Queue):
+        while (item := await transformed.get()) is not _DONE:
+            # writes are usually blocking IO so keep them off the event loop
+            await asyncio.to_thread(self._writer, *item)
+
+
+class _BlockTransformer:
+    """
+    Parse and transform a block with every ABI in the pipeline.
+    """
+
+    _transformers: List[SemanticTransformer]
+
+    def __init__(self, transformers: List[SemanticTransformer]):
+        self._transformers = transformers
+
+    def transform(self, chain: EvmChain, block_json: EthBlockJson) -> BlockRows:
+        block = EthBlock(chain, block_json)
+        return [transformer.transform(block) for transformer in self._transformers]
+
+    def transform_shared(self, chain: EvmChain, directory: str, abi_i: int) -> List[Dict[str, any]]:
+        return self._transformers[abi_i].transform(ColumnarEthBlock.attach(chain, directory))
+
+
+# sentinel marking the end of a queue
+_DONE = object()
+
+# transformers built once per worker process
+_worker_transformer: Optional[_BlockTransformer] = None
+
+
+def _init_worker(abi_jsons: List[TypedSemanticAbi]):
+    global _worker_transformer
+    _worker_transformer = _BlockTransformer([SemanticTransformer(abi_json) for abi_json in abi_jsons])
+
+
+def _transform_in_worker(chain: EvmChain, block_json: EthBlockJson) -> BlockRows:
+    return _worker_transformer.transform(chain, block_json)
+
+
+def _transform_shared_in_worker(chain: EvmChain, directory: str, abi_i: int) -> List[Dict[str, any]]:
+    return _worker_transformer.transform_shared(chain, directory, abi_i)
+
+
+def _share_block(chain: EvmChain, block_json: EthBlockJson, directory: str):
+    ColumnarEthBlock.from_block(EthBlock(chain, block_json)).tables.share(directory)
+
+
+async def _close_after(tasks: List[asyncio.Task], queue: asyncio.Queue, workers: int):
+    await asyncio.gather(*tasks)
+    for _ in range(workers):
+        await queue.put(_DONE)
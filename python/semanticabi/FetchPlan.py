@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List
+
+from semanticabi.SemanticTransformer import SemanticTransformer
+
+
+@dataclass(frozen=True)
+class FetchPlan:
+    """
+    What parts of a block need to be fetched from a node for a set of transformers. Traces are by far the most
+    expensive calls so are skipped unless a transformer needs function calls, with receipts skipped where possible if
+    no logs are needed.
+    """
+
+    # logs are only available in receipts
+    logs: bool
+    traces: bool
+
+    @staticmethod
+    def all() -> FetchPlan:
+        """
+        Fetch everything, the behavior if no plan is given.
+        """
+        return FetchPlan(True, True)
+
+    @staticmethod
+    def from_transformer(transformer: SemanticTransformer) -> FetchPlan:
+        return FetchPlan(transformer.requires_logs, transformer.requires_traces)
+
+    @staticmethod
+    def from_transformers(transformers: List[SemanticTransformer]) -> FetchPlan:
+        """
+        Plan for transforming the same block with multiple transformers.
+        """
+        return FetchPlan(
+            any(transformer.requires_logs for transformer in transformers),
+            any(transformer.requires_traces for transformer in transformers)
+        )
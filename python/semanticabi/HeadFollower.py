@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from dataclasses import dataclass
+from enum import Enum
+from typing import AsyncIterator, Deque, Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from semanticabi.FetchPlan import FetchPlan
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EvmChain import EvmChain
+
+if TYPE_CHECKING:
+    from semanticabi.BlockFetcher import BlockFetcher
+
+# uniquely identifies a row across blocks, including orphaned ones
+RowKey = Tuple[str, str, str, str]
+ROW_KEY_COLUMNS: Tuple[str, ...] = ('blockHash', 'transactionHash', 'itemType', 'internalIndex')
+
+
+class HeadEventType(Enum):
+    # rows transformed from a new block
+    ROWS = 'rows'
+    # rows from a block that was orphaned by a reorg and should be removed
+    RETRACT = 'retract'
+
+
+@dataclass
+class HeadEvent:
+    type: HeadEventType
+    block_number: int
+    block_hash: str
+    # keys of the rows added or retracted
+    keys: List[RowKey]
+    # full rows, only for new blocks
+    rows: List[Dict[str, any]]
+
+
+@dataclass
+class _WindowBlock:
+    number: int
+    hash: str
+    parent_hash: str
+    keys: List[RowKey]
+
+
+class HeadFollower:
+    """
+    Follows the head of a chain, transforming each new block as it arrives. Hashes of recent blocks are kept in a
+    bounded window to detect reorgs by a mismatched parent hash, in which case the rows of orphaned blocks are
+    retracted before the rows of the new canonical blocks are emitted. A reorg is only unrecoverable if it orphans
+    blocks that were emitted but have since left the window.
+    """
+
+    _fetcher: BlockFetcher
+    _chain: EvmChain
+    _transformer: SemanticTransformer
+    _plan: FetchPlan
+    _poll_interval: float
+    _window: Deque[_WindowBlock]
+
+    _next_block: Optional[int]
+    # first block emitted, nothing before it needs to be retracted
+    _first_block: Optional[int]
+    # hash the next block's parent must have when the window has been emptied by a reorg
+    _anchor_hash: Optional[str]
+
+    def __init__(
+        self,
+        fetcher: BlockFetcher,
+        chain: EvmChain,
+        transformer: SemanticTransformer,
+        *,
+        # block to start at, defaults to the current head
+        start_block: Optional[int] = None,
+        # max depth of a reorg that can be handled
+        window: int = 64,
+        # seconds to wait before checking for a new head when caught up
+        poll_interval: float = 0.5
+    ):
+        self._fetcher = fetcher
+        self._chain = chain
+        self._transformer = transformer
+        self._plan = FetchPlan.from_transformer(transformer)
+        self._poll_interval = poll_interval
+        self._window = deque(maxlen=window)
+
+        self._next_block = start_block
+        self._first_block = None
+        self._anchor_hash = None
+
+    async def follow(self) -> AsyncIterator[HeadEvent]:
+        """
+        Yield rows for each new block and retractions on reorgs indefinitely. Any threads the transformer started are
+        shut down once following stops.
+        """
+        try:
+            async for event in self._follow():
+                yield event
+        finally:
+            self._transformer.close()
+
+    async def _follow(self) -> AsyncIterator[HeadEvent]:
+        if self._next_block is None:
+            self._next_block = await self._fetcher.latest_block_number()
+        if self._first_block is None:
+            self._first_block = self._next_block
+
+        while True:
+            if self._next_block > await self._fetcher.latest_block_number():
+                await asyncio.sleep(self._poll_interval)
+                continue
+
+            block = EthBlock(self._chain, await self._fetcher.fetch_block(self._next_block, self._plan))
+            parent_hash = block.block['parentHash'].lower()
+
+            expected_parent_hash = self._window[-1].hash if len(self._window) > 0 else self._anchor_hash
+            if expected_parent_hash is not None and expected_parent_hash != parent_hash:
+                if len(self._window) == 0:
+                    # the block the chain was reconnected to has since been orphaned as well
+                    raise self._too_deep()
+
+                # the parent was orphaned, retract it and walk back until the new block connects
+                orphaned = self._window.pop()
+                self._next_block = orphaned.number
+                yield HeadEvent(HeadEventType.RETRACT, orphaned.number, orphaned.hash, orphaned.keys, [])
+
+                if len(self._window) == 0:
+                    await self._reconnect(orphaned)
+                continue
+
+            rows = self._transformer.transform(block)
+            keys = [HeadFollower.row_key(row) for row in rows]
+            block_hash = block.block['hash'].lower()
+
+            self._window.append(_WindowBlock(block.number, block_hash, parent_hash, keys))
+            self._next_block = block.number + 1
+            yield HeadEvent(HeadEventType.ROWS, block.number, block_hash, keys, rows)
+
+    async def _reconnect(self, orphaned: _WindowBlock):
+        """
+        After retracting every block in the window, check if the parent of the oldest one is still canonical so the
+        chain can continue from it.
+        """
+        if orphaned.number <= self._first_block:
+            # the parent was never emitted, so whatever the new chain is can be followed
+            self._anchor_hash = None
+            return
+
+        header = await self._fetcher.fetch_header(orphaned.number - 1)
+        if header['hash'].lower() != orphaned.parent_hash:
+            # the parent was emitted and orphaned too, but its rows are no longer in the window to retract
+            raise self._too_deep()
+
+        self._anchor_hash = orphaned.parent_hash
+
+    def _too_deep(self) -> Exception:
+        return Exception(f'Reorg at block {self._next_block} is deeper than the window of {self._window.maxlen} blocks.')
+
+    @staticmethod
+    def row_key(row: Dict[str, any]) -> RowKey:
+        return tuple(row[column] for column in ROW_KEY_COLUMNS)
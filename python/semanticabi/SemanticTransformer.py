@@ -1,31 +1,54 @@
 from __future__ import annotations
 
+import os
+import threading
+from concurrent.futures import Executor, ThreadPoolExecutor
+from enum import Enum
 from functools import cached_property
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
 from pyarrow import DataType
 
 from semanticabi.abi.InvalidAbiException import InvalidAbiException
 from semanticabi.abi.SemanticAbi import SemanticAbi, TypedSemanticAbi
 from semanticabi.abi.item.Expressions import Expressions
-from semanticabi.abi.item.SemanticAbiItem import SemanticAbiItem
+from semanticabi.abi.item.Matches import MatchItemType
+from semanticabi.abi.item.SemanticAbiItem import SemanticAbiItem, SemanticAbiEvent, SemanticAbiFunction
 from semanticabi.common.column.DatasetColumn import DatasetColumn
 from semanticabi.metadata.EthBlock import EthBlock
-from semanticabi.metadata.EthLog import EthLog
-from semanticabi.metadata.EthTraces import EthTrace
+from semanticabi.metadata.EthTransaction import EthTransaction
 from semanticabi.metadata.EvmChain import EvmChain
 from semanticabi.steps.AbiSchema import AbiSchema
 from semanticabi.steps.DefaultColumnsStep import DefaultColumnsStep
 from semanticabi.steps.ExplodeIndexStep import ExplodeIndexStep
 from semanticabi.steps.ExplodeStep import ExplodeStep
 from semanticabi.steps.ExpressionListStep import ExpressionListStep
+from semanticabi.steps.FilterStep import FilterStep
 from semanticabi.steps.FlattenParametersStep import FlattenParametersStep
 from semanticabi.steps.InitStep import InitStep
 from semanticabi.steps.MatchStep import AbiMatchSteps, MatchStep
+from semanticabi.steps.PipelineExecutor import PipelineExecutor
+from semanticabi.steps.ProjectStep import ProjectStep
+from semanticabi.steps.RowFilter import RowFilter, TypedRowFilter
 from semanticabi.steps.Step import Step
 from semanticabi.steps.TransformErrorStep import TransformErrorStep
 
 
+class ExecutionMode(Enum):
+    """
+    How the transactions of a block are transformed.
+    """
+    # one after another on the calling thread
+    SERIAL = 'serial'
+    # contiguous shards of transactions on a pool of threads, only faster on free-threaded builds of python like 3.13t
+    # since transforming is pure python that otherwise holds the GIL
+    THREADS = 'threads'
+
+
+# shards per core so threads that finish early pick up more work
+SHARDS_PER_THREAD = 4
+
+
 class SemanticTransformer:
     """
     Given a Semantic ABI definition, this will build the necessary transformation pipeline to transform a block with
@@ -34,12 +57,47 @@ class SemanticTransformer:
     """
     _abi: SemanticAbi
     _pipeline_by_topic: Dict[str, Step]
+    _executor_by_topic: Dict[str, PipelineExecutor]
+    # executors without padding for the columns of other pipelines
+    _item_executor_by_topic: Dict[str, PipelineExecutor]
+    # signature of the primary item of each pipeline
+    _signature_by_topic: Dict[str, str]
+    # position of each pipeline to transform the topics of a transaction in the same order
+    _topic_order: Dict[str, int]
     _schema: AbiSchema
+    # hashes of primary events found in logs and primary functions found in traces
+    _log_topics: List[str]
+    _trace_topics: List[str]
+
+    # what parts of a block are needed to transform, used to skip fetching the rest
+    requires_logs: bool
+    requires_traces: bool
 
-    def __init__(self, abi_json: TypedSemanticAbi):
+    # if token transfers of the block are matched against
+    _matches_transfers: bool
+
+    # pool for the threads execution mode when not given one, created on first use and never pickled
+    _thread_pool: Optional[ThreadPoolExecutor]
+    _thread_pool_lock: threading.Lock
+
+    def __init__(
+        self,
+        abi_json: TypedSemanticAbi,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[TypedRowFilter]] = None
+    ):
         """
         Constructs a SemanticTransformer given a JSON representation of a Semantic ABI. Throws an InvalidAbiException
-        if there are any problems with the ABI that would prevent it from being able to construct a valid schema
+        if there are any problems with the ABI that would prevent it from being able to construct a valid schema.
+
+        If columns are given, the schema is limited to them and the transform error column, and only what's needed to
+        produce them is decoded, flattened and evaluated.
+
+        If filters are given as (column, operator, value), only rows matching all of them are kept. Filters on
+        parameters are applied right after flattening so rows that don't match never get exploded, matched or have
+        expressions evaluated, the rest are applied once all the columns are available. Rows of items that fail to
+        transform before being filtered are kept with their transform error, unless the topics of a log already rule
+        out an equality filter on an indexed parameter.
         """
         self._abi = SemanticAbi(abi_json)
 
@@ -48,31 +106,101 @@ class SemanticTransformer:
             + SemanticTransformer._get_primary_items(self._abi.functions_by_hash)
 
         match_steps: AbiMatchSteps = AbiMatchSteps.from_abi(self._abi, primary_items)
+        row_filters: List[RowFilter] = [] if filters is None else [RowFilter.from_tuple(f) for f in filters]
 
         self._pipeline_by_topic: Dict[str, Step] = {
-            item.raw_item.hash: SemanticTransformer._build_pipeline(self._abi, item, match_steps)
+            item.raw_item.hash: SemanticTransformer._build_pipeline(self._abi, item, match_steps, row_filters)
             for item in primary_items
         }
 
+        unknown_filters = [
+            str(row_filter) for row_filter in row_filters
+            if not any(step.schema.has_column(row_filter.column) for step in self._pipeline_by_topic.values())
+        ]
+        if len(unknown_filters) > 0:
+            raise InvalidAbiException(f'Unknown columns in filters: {",".join(unknown_filters)}')
+
+        if columns is not None:
+            self._pipeline_by_topic = {
+                topic: ProjectStep(step, set(columns)) for topic, step in self._pipeline_by_topic.items()
+            }
+
+        self._log_topics = [item.raw_item.hash for item in primary_items if isinstance(item, SemanticAbiEvent)]
+        self._trace_topics = [item.raw_item.hash for item in primary_items if isinstance(item, SemanticAbiFunction)]
+
         self._schema = SemanticTransformer._union_schemas([step.schema for step in self._pipeline_by_topic.values()])
+        if columns is not None:
+            unknown_columns = [column for column in columns if not self._schema.has_column(column)]
+            if len(unknown_columns) > 0:
+                raise InvalidAbiException(f'Unknown columns in projection: {",".join(unknown_columns)}')
+
+        self._executor_by_topic = {
+            topic: PipelineExecutor(step, self._schema) for topic, step in self._pipeline_by_topic.items()
+        }
+        self._item_executor_by_topic = {
+            topic: PipelineExecutor(step) for topic, step in self._pipeline_by_topic.items()
+        }
+        self._topic_order = {topic: i for i, topic in enumerate(self._executor_by_topic)}
+        self._signature_by_topic = {item.raw_item.hash: item.raw_item.signature for item in primary_items}
+
+        match_types: Set[MatchItemType] = set(
+            match.type
+            for item in primary_items if item.properties.matches is not None
+            for match in item.properties.matches.matches
+        )
+        # token transfers are decoded from logs while function calls can only be found in traces
+        self.requires_logs = any(isinstance(item, SemanticAbiEvent) for item in primary_items) \
+            or MatchItemType.EVENT in match_types \
+            or MatchItemType.TRANSFER in match_types
+        self.requires_traces = any(isinstance(item, SemanticAbiFunction) for item in primary_items) \
+            or MatchItemType.FUNCTION in match_types
+        self._matches_transfers = MatchItemType.TRANSFER in match_types
+
+        self._thread_pool = None
+        self._thread_pool_lock = threading.Lock()
 
     @staticmethod
     def _get_primary_items(items_by_topic: Dict[str, SemanticAbiItem]) -> List[SemanticAbiItem]:
         return [item for item in items_by_topic.values() if item.properties.is_primary]
 
     @staticmethod
-    def _build_pipeline(abi: SemanticAbi, item: SemanticAbiItem, match_steps: AbiMatchSteps) -> Step:
+    def _build_pipeline(
+        abi: SemanticAbi,
+        item: SemanticAbiItem,
+        match_steps: AbiMatchSteps,
+        row_filters: List[RowFilter]
+    ) -> Step:
         """
         Construct the set of steps for transforming a primary abi item
         """
-        step: Step = InitStep(abi, item)
+        # filter as early as possible unless an expression could overwrite the column
+        expression_names = {
+            expression.name
+            for expressions in [item.properties.expressions, abi.expressions] if expressions is not None
+            for expression in expressions.expressions
+        }
+
+        step: Step = InitStep(abi, item, [row_filter for row_filter in row_filters if row_filter.column not in expression_names])
         step = DefaultColumnsStep(step)
         step = FlattenParametersStep(step)
+
+        early_filters = [
+            row_filter for row_filter in row_filters
+            if step.schema.has_column(row_filter.column) and row_filter.column not in expression_names
+        ]
+        if len(early_filters) > 0:
+            step = FilterStep(step, early_filters)
+
         step = ExplodeStep(step)
         step = MatchStep(step, match_steps.steps_for_match_list(item.properties.matches.matches) if item.properties.matches is not None else [])
         step = ExplodeIndexStep(step)
         step = ExpressionListStep(step, item.properties.expressions if item.properties.expressions is not None else Expressions([]))
         step = ExpressionListStep(step, abi.expressions)
+
+        late_filters = [row_filter for row_filter in row_filters if row_filter not in early_filters]
+        if len(late_filters) > 0:
+            step = FilterStep(step, late_filters)
+
         step = TransformErrorStep(step)
         return step
 
@@ -99,34 +227,148 @@ class SemanticTransformer:
         """
         return self._schema
 
-    def transform(self, block: EthBlock) -> List[Dict[str, any]]:
+    @cached_property
+    def schema_by_item(self) -> Dict[str, AbiSchema]:
+        """
+        Schema of each primary item by signature, with only the columns of that item.
+        """
+        return {
+            self._signature_by_topic[topic]: step.schema for topic, step in self._pipeline_by_topic.items()
+        }
+
+    def transform(
+        self,
+        block: EthBlock,
+        execution_mode: ExecutionMode = ExecutionMode.SERIAL,
+        executor: Optional[Executor] = None
+    ) -> List[Dict[str, any]]:
         """
         Given a block, goes through each transaction, finding any that have logs or traces that match any of the
-        primary item topics, and transforms those primary items into rows
+        primary item topics, and transforms those primary items into rows. Rows are in the same order regardless of the
+        execution mode. Threads are from the executor if given, otherwise a pool kept by the transformer.
         """
         results: List[Dict[str, any]] = []
+        # rows are padded with None for any columns only in other pipelines
+        for _, rows in self._transform(block, self._executor_by_topic, execution_mode, executor):
+            results.extend(rows)
+
+        return results
+
+    def transform_by_item(
+        self,
+        block: EthBlock,
+        execution_mode: ExecutionMode = ExecutionMode.SERIAL,
+        executor: Optional[Executor] = None
+    ) -> Dict[str, List[Dict[str, any]]]:
+        """
+        Transform a block into rows for each primary item by signature with the columns of its schema in
+        schema_by_item, instead of padding every row to the union schema. Rows of each item are in the same order as
+        transform.
+        """
+        results: Dict[str, List[Dict[str, any]]] = {signature: [] for signature in self._signature_by_topic.values()}
+        for topic, rows in self._transform(block, self._item_executor_by_topic, execution_mode, executor):
+            results[self._signature_by_topic[topic]].extend(rows)
 
+        return results
+
+    def _transform(
+        self,
+        block: EthBlock,
+        executor_by_topic: Dict[str, PipelineExecutor],
+        execution_mode: ExecutionMode,
+        executor: Optional[Executor]
+    ) -> List[Tuple[str, List[Dict[str, any]]]]:
+        """
+        Topic and rows of each primary item in each transaction of the block.
+        """
         if not self.is_valid_for_chain(block.chain):
-            return results
+            return []
 
-        for transaction in block.transactions:
-            logs_by_topic: Dict[str, List[EthLog]] = transaction.logs_by_topic
-            traces_by_topic: Dict[str, List[EthTrace]] = transaction.traces_by_topic
+        # find transactions with primary items across the whole block at once instead of walking each one
+        topics_by_transaction: Dict[int, Set[str]] = block.tables.topics_by_transaction(
+            self._log_topics, self._trace_topics, self._abi.contract_addresses
+        )
+        tx_indices: List[int] = sorted(topics_by_transaction)
+        if execution_mode == ExecutionMode.SERIAL or len(tx_indices) < 2:
+            return list(self._transform_transactions(block, executor_by_topic, topics_by_transaction, tx_indices))
 
-            for topic, step in self._pipeline_by_topic.items():
-                if topic not in logs_by_topic and topic not in traces_by_topic:
-                    continue
+        # create what's shared across transactions up front rather than racing each other to
+        _ = block.transactions, block.hex_interner, block.batch_decoded, block.decode_memo
+        if self._matches_transfers:
+            block.decode_transfers()
 
-                step_result: List[Dict[str, any]] = step.transform(block, transaction)
-                if len(step_result) > 0:
-                    for row in step_result:
-                        # Pad out any missing columns with None
-                        for column in self._schema.columns():
-                            if column.name not in row:
-                                row[column.name] = None
-                    results.extend(step_result)
+        num_shards = min(len(tx_indices), SHARDS_PER_THREAD * (os.cpu_count() or 1))
+        shard_size = -(-len(tx_indices) // num_shards)
+        shards = [tx_indices[i:i + shard_size] for i in range(0, len(tx_indices), shard_size)]
 
-        return results
+        pool = self._get_thread_pool() if executor is None else executor
+        # map keeps the shards in order so the rows are the same as transforming serially
+        return [
+            result
+            for shard_results in pool.map(
+                lambda shard: list(self._transform_transactions(block, executor_by_topic, topics_by_transaction, shard)),
+                shards
+            )
+            for result in shard_results
+        ]
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        with self._thread_pool_lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(thread_name_prefix='SemanticTransformer')
+
+            return self._thread_pool
+
+    def close(self) -> None:
+        """
+        Shut down the pool of threads kept for the threads execution mode if one was created. The transformer can still
+        be used and creates another pool if needed.
+        """
+        with self._thread_pool_lock:
+            thread_pool, self._thread_pool = self._thread_pool, None
+
+        if thread_pool is not None:
+            thread_pool.shutdown()
+
+    def __enter__(self) -> SemanticTransformer:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def __getstate__(self) -> Dict[str, any]:
+        state = self.__dict__.copy()
+        del state['_thread_pool']
+        del state['_thread_pool_lock']
+        return state
+
+    def __setstate__(self, state: Dict[str, any]):
+        self.__dict__.update(state)
+        self._thread_pool = None
+        self._thread_pool_lock = threading.Lock()
+
+    def _transform_transactions(
+        self,
+        block: EthBlock,
+        executor_by_topic: Dict[str, PipelineExecutor],
+        topics_by_transaction: Dict[int, Set[str]],
+        tx_indices: List[int]
+    ) -> Iterator[Tuple[str, List[Dict[str, any]]]]:
+        transactions: List[EthTransaction] = block.transactions
+        for tx_index in tx_indices:
+            transaction: EthTransaction = transactions[tx_index]
+            # only the pipelines of topics in the transaction, which are always primary items, in pipeline order
+            for topic in sorted(topics_by_transaction[tx_index], key=self._topic_order.__getitem__):
+                yield topic, executor_by_topic[topic].transform(block, transaction)
+
+    def count(self, block: EthBlock) -> Dict[str, int]:
+        """
+        Number of logs and traces of each primary item by hash in the block without transforming them.
+        """
+        if not self.is_valid_for_chain(block.chain):
+            return {}
+
+        return block.tables.count_by_topic(self._log_topics, self._trace_topics, self._abi.contract_addresses)
 
     def is_valid_for_chain(self, chain: EvmChain) -> bool:
         """
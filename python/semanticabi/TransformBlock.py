@@ -3,13 +3,12 @@ import json
 import sys
 from argparse import ArgumentParser
 
-import pyarrow
-from pyarrow.lib import Table
-
 from semanticabi.BlockFetcher import BlockFetcher, NodeType
+from semanticabi.FetchPlan import FetchPlan
 from semanticabi.SemanticTransformer import SemanticTransformer
 from semanticabi.metadata.EthBlock import EthBlock
 from semanticabi.metadata.EvmChain import EvmChain
+from semanticabi.sink.ArrowTableBuilder import ArrowTableBuilder
 
 
 async def fetch_and_transform_block(
@@ -19,19 +18,17 @@ async def fetch_and_transform_block(
     chain: EvmChain,
     abi_path: str
 ):
-    async with BlockFetcher(node_url, node_type) as block_fetcher:
-        block_json = await block_fetcher.fetch_block(block_number)
-
-    block: EthBlock = EthBlock(chain, block_json)
-
     with open(abi_path) as file:
         abi = json.loads(file.read())
     transformer = SemanticTransformer(abi)
-    results = transformer.transform(block)
 
-    pyarrow_schema = pyarrow.schema(transformer.metadata)
+    async with BlockFetcher(node_url, node_type) as block_fetcher:
+        block_json = await block_fetcher.fetch_block(block_number, FetchPlan.from_transformer(transformer))
+
+    block: EthBlock = EthBlock(chain, block_json)
+    results = transformer.transform(block)
 
-    table = Table.from_pylist(mapping=results, schema=pyarrow_schema)
+    table = ArrowTableBuilder.from_transformer(transformer).build(results)
     print(table.to_pandas().to_string())
 
 
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+from functools import cache
+from importlib import metadata
+from typing import Dict, List, Optional
+
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.abi.SemanticAbi import TypedSemanticAbi
+from semanticabi.steps.RowFilter import TypedRowFilter
+
+# bump when the pickled form of a transformer changes in a way the source digest doesn't catch
+CACHE_VERSION = 1
+# distributions whose objects are pickled in a transformer or that decide how it transforms
+CACHED_DEPENDENCIES = ['pyarrow', 'eth-abi', 'antlr4-python3-runtime']
+
+
+@cache
+def source_digest() -> str:
+    """
+    SHA-256 of the sources of the package, since cached transformers are pickles of its internal objects that can load
+    fine with any change to them but fail or silently differ when transforming.
+    """
+    package_directory = os.path.dirname(os.path.abspath(__file__))
+    paths = sorted(
+        os.path.join(directory, name)
+        for directory, _, names in os.walk(package_directory)
+        for name in names if name.endswith('.py')
+    )
+
+    digest = hashlib.sha256()
+    for path in paths:
+        digest.update(os.path.relpath(path, package_directory).encode())
+        with open(path, 'rb') as file:
+            digest.update(hashlib.sha256(file.read()).digest())
+
+    return digest.hexdigest()
+
+
+@cache
+def dependency_versions() -> Dict[str, Optional[str]]:
+    """
+    Installed version of each dependency of cached transformers, None if it isn't installed.
+    """
+    versions = {}
+    for name in CACHED_DEPENDENCIES:
+        try:
+            versions[name] = metadata.version(name)
+        except metadata.PackageNotFoundError:
+            versions[name] = None
+
+    return versions
+
+
+def code_digest() -> str:
+    """
+    SHA-256 of the package sources and dependency versions, what cached transformers must have been built with.
+    """
+    key = json.dumps({'source': source_digest(), 'dependencies': dependency_versions()}, sort_keys=True)
+    return hashlib.sha256(key.encode()).hexdigest()
+
+
+class TransformerCache:
+    """
+    Local directory of compiled SemanticTransformers keyed by a digest of the ABI JSON, columns and filters they were
+    constructed with. Loading a cached transformer unpickles it without parsing expressions, hashing signatures or
+    building and validating schemas again, which adds up when every worker constructs hundreds of them.
+
+    Entries are also keyed by a digest of the package sources and the versions of dependencies whose objects are
+    pickled, so any change to the code or upgrade ignores older ones. They're
+    written to a temporary file and renamed so concurrent workers never read a partial one, and any entry that can't be
+    loaded is rebuilt.
+
+    Loading an entry unpickles it, which can run arbitrary code, so the directory must only be writable by trusted
+    users.
+    """
+
+    _directory: str
+
+    def __init__(self, directory: str):
+        self._directory = directory
+
+    @staticmethod
+    def digest(
+        abi_json: TypedSemanticAbi,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[TypedRowFilter]] = None
+    ) -> str:
+        """
+        SHA-256 of the arguments to construct a transformer, the same regardless of the order of keys in the ABI.
+        """
+        key = json.dumps(
+            {'abi': abi_json, 'columns': columns, 'filters': filters},
+            sort_keys=True,
+            separators=(',', ':'),
+            # sets of values for filters
+            default=lambda value: sorted(value) if isinstance(value, (set, frozenset)) else str(value)
+        )
+        return hashlib.sha256(key.encode()).hexdigest()
+
+    def path(self, digest: str) -> str:
+        # pickles aren't guaranteed to load across python versions
+        python_version = f'{sys.version_info.major}{sys.version_info.minor}'
+        return os.path.join(
+            self._directory, f'{digest}-v{CACHE_VERSION}-{code_digest()[:16]}-py{python_version}.pickle'
+        )
+
+    def get(
+        self,
+        abi_json: TypedSemanticAbi,
+        columns: Optional[List[str]] = None,
+        filters: Optional[List[TypedRowFilter]] = None
+    ) -> SemanticTransformer:
+        """
+        Load the transformer from the cache, otherwise construct and cache it.
+        """
+        path = self.path(TransformerCache.digest(abi_json, columns, filters))
+        if os.path.exists(path):
+            try:
+                with open(path, 'rb') as file:
+                    return pickle.load(file)
+            except Exception:
+                # corrupt or from incompatible code, rebuild it
+                pass
+
+        transformer = SemanticTransformer(abi_json, columns, filters)
+        self._write(path, transformer)
+        return transformer
+
+    def _write(self, path: str, transformer: SemanticTransformer):
+        os.makedirs(self._directory, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self._directory, prefix='.', suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as file:
+                pickle.dump(transformer, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temp_path, path)
+        except BaseException:
+            os.remove(temp_path)
+            raise
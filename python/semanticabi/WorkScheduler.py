@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import List, Tuple, TYPE_CHECKING
+
+from semanticabi.Backfill import WorkUnit
+from semanticabi.FetchPlan import FetchPlan
+from semanticabi.common.ValueConverter import ValueConverter
+from semanticabi.metadata.EthBlockJson import BlockInfoJson
+
+if TYPE_CHECKING:
+    from semanticabi.BlockFetcher import BlockFetcher
+
+
+@dataclass(frozen=True)
+class BlockCostModel:
+    """
+    Estimates the relative cost of fetching and transforming a block from its header. Transactions drive receipts
+    and transform work, gas drives the depth of traces, and the payload size drives transfer and parsing.
+    """
+
+    base: float = 1.0
+    per_transaction: float = 1.0
+    per_million_gas: float = 4.0
+    per_kilobyte: float = 0.05
+
+    @staticmethod
+    def for_plan(plan: FetchPlan) -> BlockCostModel:
+        """
+        Without traces gas has little effect on the cost of a block.
+        """
+        return BlockCostModel() if plan.traces else BlockCostModel(per_million_gas=0.5)
+
+    def cost(self, header: BlockInfoJson) -> float:
+        return self.base \
+            + self.per_transaction * len(header['transactions']) \
+            + self.per_million_gas * ValueConverter.hex_to_int(header['gasUsed']) / 1_000_000 \
+            + self.per_kilobyte * ValueConverter.hex_to_int(header['size']) / 1024
+
+
+class WorkScheduler:
+    """
+    Splits a range of blocks into work units of roughly equal estimated cost rather than equal numbers of blocks,
+    since blocks range from a handful of transactions to thousands with deep traces. Units are ordered from most to
+    least expensive so that workers pulling from a shared queue, like those in Backfill.run_units, finish together
+    instead of idling behind a large unit at the tail.
+    """
+
+    _fetcher: BlockFetcher
+    _cost_model: BlockCostModel
+    _header_concurrency: int
+
+    def __init__(
+        self,
+        fetcher: BlockFetcher,
+        cost_model: BlockCostModel = BlockCostModel(),
+        *,
+        # headers fetched at once, bounded by the fetcher's max_connections
+        header_concurrency: int = 16
+    ):
+        self._fetcher = fetcher
+        self._cost_model = cost_model
+        self._header_concurrency = header_concurrency
+
+    async def estimate(self, start: int, end: int) -> List[float]:
+        """
+        Estimated cost of each block from start (inclusive) to end (exclusive).
+        """
+        semaphore = asyncio.Semaphore(self._header_concurrency)
+
+        async def estimate_block(block_number: int) -> float:
+            async with semaphore:
+                return self._cost_model.cost(await self._fetcher.fetch_header(block_number))
+
+        return list(await asyncio.gather(*[estimate_block(block_number) for block_number in range(start, end)]))
+
+    async def schedule(self, start: int, end: int, target_cost: float) -> List[WorkUnit]:
+        """
+        Estimate the cost of each block and pack them into units, most expensive first.
+        """
+        return [unit for unit, _ in WorkScheduler.pack(start, await self.estimate(start, end), target_cost)]
+
+    @staticmethod
+    def pack(start: int, costs: List[float], target_cost: float) -> List[Tuple[WorkUnit, float]]:
+        """
+        Pack contiguous blocks into units up to the target cost, returning units with their cost from most to least
+        expensive. A block costing more than the target gets a unit to itself.
+        """
+        units: List[Tuple[WorkUnit, float]] = []
+
+        unit_start = start
+        unit_cost = 0.0
+        for i, cost in enumerate(costs):
+            block_number = start + i
+            if block_number > unit_start and unit_cost + cost > target_cost:
+                units.append((WorkUnit(unit_start, block_number), unit_cost))
+                unit_start = block_number
+                unit_cost = 0.0
+
+            unit_cost += cost
+
+        if len(costs) > 0:
+            units.append((WorkUnit(unit_start, start + len(costs)), unit_cost))
+
+        # stable so equal costs stay in block order
+        return sorted(units, key=lambda unit_and_cost: -unit_and_cost[1])
@@ -2,15 +2,17 @@ from __future__ import annotations
 
 import json
 from dataclasses import dataclass
-from typing import Dict, List, Optional
-
-from web3 import Web3
-from web3.contract import Contract
+from typing import Dict, List, Optional, TYPE_CHECKING
 
 from semanticabi.metadata.EthTraces import EthTrace
 from semanticabi.abi.Decoded import DecodedTuple
 from semanticabi.abi.item.AbiItem import AbiEvent, AbiFunction
 
+if TYPE_CHECKING:
+    # web3 is slow to import and only needed to call contracts with a client that already has it loaded
+    from web3 import Web3
+    from web3.contract import Contract
+
 
 class Abi:
     """
@@ -180,7 +182,7 @@ class AbiWithClient:
     def __init__(self, abi: Abi, address: str, client: Web3):
         self.abi = abi
         self.contract = client.eth.contract(
-            address=Web3.to_checksum_address(address),
+            address=client.to_checksum_address(address),
             abi=abi.abi
         )
 
@@ -0,0 +1,263 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+import numpy
+
+from semanticabi.abi.Decoded import DecodedTuple
+from semanticabi.abi.item.AbiItem import AbiEvent
+from semanticabi.abi.item.Parameter import Parameter, PrimitiveParameter
+
+WORD_SIZE = 32
+
+_INT_TYPE = re.compile(r'^(u?)int(\d*)$')
+_BYTES_TYPE = re.compile(r'^bytes(\d+)$')
+
+# event layout and the contract addresses of the ABI decoding it, empty for any
+BatchDecodedKey = Tuple[Tuple[str, Tuple[bool, ...]], FrozenSet[str]]
+# decoded input values of each log by its hex log index, only for logs that could be batch decoded
+BatchDecoded = Dict[str, List[any]]
+
+
+@dataclass(frozen=True)
+class _Slot:
+    """
+    Where a parameter sits in the words of a log, indexed parameters in topic order followed by the data.
+    """
+    name: str
+    # uint, int, address, bool or bytes
+    kind: str
+    # bits for integers, bytes for fixed bytes
+    size: int
+    word: int
+
+    @staticmethod
+    def of(parameter: Parameter, word: int) -> Optional[_Slot]:
+        """
+        Slot for the parameter if it's a static elementary type, otherwise None.
+        """
+        if not isinstance(parameter, PrimitiveParameter) or parameter.is_array:
+            return None
+
+        signature = parameter.signature
+        if signature in ('address', 'bool'):
+            return _Slot(parameter.name, signature, 0, word)
+        elif (int_match := _INT_TYPE.match(signature)) is not None:
+            bits = int(int_match.group(2) or 256)
+            return _Slot(parameter.name, 'uint' if int_match.group(1) == 'u' else 'int', bits, word)
+        elif (bytes_match := _BYTES_TYPE.match(signature)) is not None:
+            return _Slot(parameter.name, 'bytes', int(bytes_match.group(1)), word)
+
+        return None
+
+
+@dataclass
+class BatchDecoded:
+    """
+    Parameters of a batch of logs decoded into columns. Integers up to 64 bits are native arrays, wider integers are
+    4 big endian uint64 limbs per value with the most significant first, addresses and fixed bytes are byte slices.
+    Values of logs that aren't valid are undefined.
+    """
+    # if each log could be decoded, the rest need to go through eth_abi to get the same result or error
+    valid: numpy.ndarray
+    columns: Dict[str, numpy.ndarray]
+
+
+class BatchEventDecoder:
+    """
+    Decodes many logs of an event with only static types at once. Every parameter sits in its own 32 byte word of
+    either the topics or the data, so the logs are concatenated into a single buffer and each parameter decoded as a
+    column with vector operations instead of calling eth_abi for each log.
+
+    Logs are only marked valid if eth_abi would decode them to the same values, anything else like the wrong number of
+    topics, short data or non-empty padding is left for eth_abi to decode or raise the usual error.
+    """
+
+    event: AbiEvent
+    _slots: List[_Slot]
+    _num_indexed: int
+    _num_data: int
+
+    @staticmethod
+    def supports(event: AbiEvent) -> bool:
+        """
+        If all parameters of the event have static elementary types.
+        """
+        return all(_Slot.of(parameter, 0) is not None for parameter in event.inputs.parameters())
+
+    def __init__(self, event: AbiEvent):
+        if not BatchEventDecoder.supports(event):
+            raise Exception(f'Event {event.signature} has parameters that are not static elementary types.')
+
+        self.event = event
+
+        indexed = event.inputs.parameters(True)
+        unindexed = event.inputs.parameters(False)
+        words: Dict[str, int] = {parameter.name: i for i, parameter in enumerate(indexed + unindexed)}
+        self._slots = [_Slot.of(parameter, words[parameter.name]) for parameter in event.inputs.parameters()]
+        self._num_indexed = len(indexed)
+        self._num_data = len(unindexed)
+
+    def decode(self, logs: Sequence[Dict[str, any]]) -> List[Optional[DecodedTuple]]:
+        """
+        Decode each log the same as AbiEvent.decode, or None for logs that need to be decoded individually.
+        """
+        return self.decode_topics_and_data([log['topics'] for log in logs], [log['data'] for log in logs])
+
+    def decode_topics_and_data(
+        self,
+        topics: Sequence[Sequence[str]],
+        data: Sequence[Optional[str]]
+    ) -> List[Optional[DecodedTuple]]:
+        parameters = self.event.inputs.parameters()
+        return [
+            DecodedTuple.from_parameters_and_values(None, parameters, values) if values is not None else None
+            for values in self.decode_values(topics, data)
+        ]
+
+    def decode_values(self, topics: Sequence[Sequence[str]], data: Sequence[Optional[str]]) -> List[Optional[List[any]]]:
+        """
+        Decoded values of each log in the order of the parameters like AbiEvent.decode_values, or None for logs that
+        need to be decoded individually.
+        """
+        decoded = self.decode_columns(topics, data)
+
+        values = [self.to_python(slot, decoded.columns[slot.name]) for slot in self._slots]
+        return [
+            [column[i] for column in values] if valid else None
+            for i, valid in enumerate(decoded.valid.tolist())
+        ]
+
+    def decode_json(self, logs: Sequence[Dict[str, any]]) -> List[Optional[Dict[str, any]]]:
+        """
+        Decode each log straight to the JSON of the decoded parameters like DecodedTuple.to_json, skipping the
+        intermediate decoded objects.
+        """
+        decoded = self.decode_columns([log['topics'] for log in logs], [log['data'] for log in logs])
+
+        names = [slot.name for slot in self._slots]
+        values = []
+        for slot in self._slots:
+            column = self.to_python(slot, decoded.columns[slot.name])
+            values.append([value.hex() for value in column] if slot.kind == 'bytes' else column)
+
+        return [
+            dict(zip(names, [column[i] for column in values])) if valid else None
+            for i, valid in enumerate(decoded.valid.tolist())
+        ]
+
+    def decode_columns(self, topics: Sequence[Sequence[str]], data: Sequence[Optional[str]]) -> BatchDecoded:
+        """
+        Decode the topics and data of logs into columns by parameter name.
+        """
+        num_logs = len(topics)
+        num_words = self._num_indexed + self._num_data
+
+        valid = numpy.zeros(num_logs, dtype=bool)
+        words = numpy.zeros((num_logs, num_words, WORD_SIZE), dtype=numpy.uint8)
+
+        rows_hex = [self._row_hex(log_topics, log_data) for log_topics, log_data in zip(topics, data)]
+        valid_i = [i for i, row_hex in enumerate(rows_hex) if row_hex is not None]
+        if len(valid_i) > 0 and num_words > 0:
+            try:
+                buffer = bytes.fromhex(''.join(rows_hex[i] for i in valid_i))
+            except ValueError:
+                # some row isn't hex, find the ones that are so the rest can still be decoded together
+                valid_i = [i for i in valid_i if _is_hex(rows_hex[i])]
+                buffer = bytes.fromhex(''.join(rows_hex[i] for i in valid_i))
+
+            words[valid_i] = numpy.frombuffer(buffer, dtype=numpy.uint8).reshape(len(valid_i), num_words, WORD_SIZE)
+        valid[valid_i] = True
+
+        columns: Dict[str, numpy.ndarray] = {}
+        for slot in self._slots:
+            word = words[:, slot.word, :]
+            column, slot_valid = BatchEventDecoder._decode_word(slot, word)
+            columns[slot.name] = column
+            valid &= slot_valid
+
+        return BatchDecoded(valid, columns)
+
+    @staticmethod
+    def to_python(slot: _Slot, column: numpy.ndarray) -> List[any]:
+        """
+        Values of a decoded column as the same python types eth_abi returns.
+        """
+        if slot.kind in ('uint', 'int'):
+            if slot.size <= 64:
+                return column.tolist()
+
+            limbs = column.astype(object)
+            values = (limbs[:, 0] << 192) | (limbs[:, 1] << 128) | (limbs[:, 2] << 64) | limbs[:, 3]
+            if slot.kind == 'int':
+                # padding was checked to be sign extended so the whole word is two's complement
+                values = numpy.where(values >= 2 ** 255, values - 2 ** 256, values)
+            return values.tolist()
+        elif slot.kind == 'address':
+            addresses = numpy.ascontiguousarray(column).tobytes().hex()
+            return [f'0x{addresses[i * 40:(i + 1) * 40]}' for i in range(len(column))]
+        elif slot.kind == 'bool':
+            return column.tolist()
+        else:
+            values = numpy.ascontiguousarray(column).tobytes()
+            return [values[i * slot.size:(i + 1) * slot.size] for i in range(len(column))]
+
+    def _row_hex(self, topics: Sequence[str], data: Optional[str]) -> Optional[str]:
+        """
+        Hex of the words of a log if it has the expected shape, otherwise None.
+        """
+        data_length = 2 + 2 * WORD_SIZE * self._num_data
+        if len(topics) != self._num_indexed + 1 or data is None or len(data) < data_length:
+            return None
+
+        indexed = topics[1:]
+        if any(topic is None or len(topic) != 2 + 2 * WORD_SIZE for topic in indexed):
+            return None
+
+        # trailing data is ignored the same as eth_abi
+        return ''.join(topic[2:] for topic in indexed) + data[2:data_length]
+
+    @staticmethod
+    def _decode_word(slot: _Slot, word: numpy.ndarray) -> Tuple[numpy.ndarray, numpy.ndarray]:
+        """
+        Decode a column of words returning the values and which had valid padding.
+        """
+        if slot.kind == 'uint':
+            padding = WORD_SIZE - slot.size // 8
+            valid = ~word[:, :padding].any(axis=1)
+            return _integer_column(word, slot.size, False), valid
+        elif slot.kind == 'int':
+            padding = WORD_SIZE - slot.size // 8
+            if padding == 0:
+                valid = numpy.ones(len(word), dtype=bool)
+            else:
+                # padding must be the sign extension of the value
+                negative = (word[:, padding] & 0x80) != 0
+                expected = numpy.where(negative, 0xff, 0x00).astype(numpy.uint8)
+                valid = (word[:, :padding] == expected[:, None]).all(axis=1)
+            return _integer_column(word, slot.size, True), valid
+        elif slot.kind == 'address':
+            return word[:, 12:], ~word[:, :12].any(axis=1)
+        elif slot.kind == 'bool':
+            return word[:, -1] == 1, ~word[:, :-1].any(axis=1) & (word[:, -1] <= 1)
+        else:
+            return word[:, :slot.size], ~word[:, slot.size:].any(axis=1)
+
+
+def _integer_column(word: numpy.ndarray, bits: int, signed: bool) -> numpy.ndarray:
+    if bits <= 64:
+        # the last 8 bytes include any sign extension so can be read directly
+        values = numpy.ascontiguousarray(word[:, -8:]).view('>i8' if signed else '>u8').ravel()
+        return values.astype(numpy.int64 if signed else numpy.uint64)
+
+    return numpy.ascontiguousarray(word).view('>u8').reshape(len(word), 4).astype(numpy.uint64)
+
+
+def _is_hex(value: str) -> bool:
+    try:
+        bytes.fromhex(value)
+        return True
+    except ValueError:
+        return False
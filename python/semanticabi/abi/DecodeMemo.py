@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from typing import Collection, Dict, List, Optional, Tuple
+
+from semanticabi.abi.Decoded import DecodedTuple
+from semanticabi.abi.item.AbiItem import AbiEvent
+
+# event layout, positions of the projected parameters or None for all, and the id of the log
+_Key = Tuple[Tuple[str, Tuple[bool, ...]], Optional[Tuple[int, ...]], int]
+
+
+class DecodeMemo:
+    """
+    Logs decoded for a block, shared by every ABI transforming it so a log of an event declared by many ABIs is only
+    decoded once. Values are kept by position rather than as DecodedTuples so ABIs naming the parameters differently
+    share them too, each building its own DecodedTuple on top. Logs that fail to decode keep their error to raise again.
+    """
+
+    # the log is kept with its values so its id can't be reused while memoized
+    _decoded: Dict[_Key, Tuple[Dict[str, any], List[any] | Exception]]
+
+    def __init__(self):
+        self._decoded = {}
+
+    def decode(self, event: AbiEvent, log: Dict[str, any], parameters: Optional[Collection[str]] = None) -> DecodedTuple:
+        """
+        Decode the log the same as AbiEvent.decode, only decoding the first time for each event layout and projection.
+        """
+        parameters_i = None
+        if parameters is not None:
+            parameters_i = tuple(i for i, p in enumerate(event.inputs.parameters()) if p.name in parameters)
+
+        key = (event.layout, parameters_i, id(log))
+        memoized = self._decoded.get(key)
+        if memoized is None:
+            try:
+                values = event.decode_values(log, parameters)
+            except Exception as e:
+                values = e
+            memoized = self._decoded[key] = (log, values)
+
+        values = memoized[1]
+        if isinstance(values, Exception):
+            raise values
+
+        parameters = event.inputs.parameters() if parameters_i is None \
+            else [event.inputs.parameters()[i] for i in parameters_i]
+        return DecodedTuple.from_parameters_and_values(None, parameters, values)
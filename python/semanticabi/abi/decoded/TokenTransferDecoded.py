@@ -8,6 +8,7 @@ from typing import Literal, Optional, List, Dict
 from eth_abi.exceptions import DecodingError
 
 from semanticabi.abi.Abi import DecodedLog, Abi
+from semanticabi.abi.item.AbiItem import AbiEvent
 from semanticabi.metadata.EthLog import EthLog
 from semanticabi.metadata.EthTransferable import EthTransferable
 from semanticabi.metadata.EthTokenType import EthTokenType
@@ -65,8 +66,14 @@ class TokenTransferDecoded(EthTransferable):
 
     @staticmethod
     def of(log: EthLog, log_i: int, decoded_log: DecodedLog) -> List[TokenTransferDecoded]:
-        decoded = decoded_log.data.to_json()
-        event_name = decoded_log.event.name
+        return TokenTransferDecoded.from_json(log, log_i, decoded_log.event, decoded_log.data.to_json())
+
+    @staticmethod
+    def from_json(log: EthLog, log_i: int, event: AbiEvent, decoded: Dict[str, any]) -> List[TokenTransferDecoded]:
+        """
+        Transfers from the decoded parameters of a transfer event.
+        """
+        event_name = event.name
 
         def make(value: int, token_id: Optional[int], token_type: EthTokenType, internal_index: int | float):
             return TokenTransferDecoded(
@@ -82,7 +89,7 @@ class TokenTransferDecoded(EthTransferable):
             )
 
         if event_name == 'Transfer':
-            if decoded_log.event.extra['standard'] == 'Erc721':
+            if event.extra['standard'] == 'Erc721':
                 return [make(1, decoded['tokenId'], EthTokenType.ERC721, log_i)]
             else:
                 return [make(decoded['value'], None, EthTokenType.ERC20, log_i)]
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from semanticabi.abi.Abi import Abi
+from semanticabi.abi.BatchEventDecoder import BatchEventDecoder, WORD_SIZE
+from semanticabi.abi.decoded.TokenTransferDecoded import TokenTransferDecoded
+from semanticabi.abi.item.AbiItem import AbiEvent
+from semanticabi.metadata.EthLog import EthLog
+
+_TOPIC = re.compile(r'0x[0-9a-fA-F]{64}')
+_HEX = re.compile(r'0x(?:[0-9a-fA-F]{2})*')
+
+
+@dataclass(frozen=True)
+class _Field:
+    name: str
+    # only address, uint256 and uint256[] are used by transfer events
+    type: str
+    indexed: bool
+    # topic after the signature if indexed, otherwise word in the head of the data
+    position: int
+
+
+class _TransferEvent:
+    """
+    Layout of a transfer event to slice its parameters out of topics and data.
+    """
+
+    event: AbiEvent
+    fields: List[_Field]
+    num_indexed: int
+    num_data: int
+    # events with only static types can also be decoded in batches
+    batch_decoder: Optional[BatchEventDecoder]
+
+    def __init__(self, event: AbiEvent):
+        self.event = event
+
+        indexed = [parameter.name for parameter in event.inputs.parameters(True)]
+        unindexed = [parameter.name for parameter in event.inputs.parameters(False)]
+        self.fields = [
+            _Field(
+                parameter.name,
+                parameter.signature,
+                parameter.is_indexed,
+                indexed.index(parameter.name) if parameter.is_indexed else unindexed.index(parameter.name)
+            )
+            for parameter in event.inputs.parameters()
+        ]
+        for field in self.fields:
+            if field.type not in ('address', 'uint256', 'uint256[]'):
+                raise Exception(f'Unsupported type {field.type} for transfer event {event.signature}.')
+
+        self.num_indexed = len(indexed)
+        self.num_data = len(unindexed)
+        self.batch_decoder = BatchEventDecoder(event) if BatchEventDecoder.supports(event) else None
+
+    def decode(self, topics: Sequence[str], data: Optional[str]) -> Optional[Dict[str, any]]:
+        """
+        Decode to the same values as eth_abi, or None if eth_abi would fail from missing topics, short data, non-empty
+        padding or malformed hex.
+        """
+        # extra topics are ignored by eth_abi as long as there are enough
+        if len(topics) - 1 < self.num_indexed:
+            return None
+
+        data_bytes = b''
+        if self.num_data > 0:
+            if data is None or _HEX.fullmatch(data) is None:
+                return None
+            data_bytes = bytes.fromhex(data[2:])
+            if len(data_bytes) < WORD_SIZE * self.num_data:
+                return None
+
+        decoded: Dict[str, any] = {}
+        for field in self.fields:
+            if field.indexed:
+                topic = topics[1 + field.position]
+                if topic is None or _TOPIC.fullmatch(topic) is None:
+                    return None
+                word = bytes.fromhex(topic[2:])
+            else:
+                word = data_bytes[WORD_SIZE * field.position:WORD_SIZE * (field.position + 1)]
+
+            if field.type == 'address':
+                if any(word[:12]):
+                    return None
+                decoded[field.name] = f'0x{word[12:].hex()}'
+            elif field.type == 'uint256':
+                decoded[field.name] = int.from_bytes(word, 'big')
+            else:
+                values = _uint256_array(data_bytes, int.from_bytes(word, 'big'))
+                if values is None:
+                    return None
+                decoded[field.name] = values
+
+        return decoded
+
+
+class TokenTransferDecoder:
+    """
+    Decodes the token transfer events of TokenTransferDecoded.SIGNATURES by slicing their topics and data directly
+    instead of through the generic ABI decoder. Transfer(address,address,uint256) is shared by ERC20 and both forms of
+    ERC721 which are resolved by the number of topics. Logs that can't be decoded return no transfers the same as
+    decoding with the ABI and ignoring the error, without raising and catching an exception for each one.
+    """
+
+    _events_by_signature: Dict[str, List[_TransferEvent]]
+
+    def __init__(self, abi: Abi):
+        self._events_by_signature = {}
+        for signature in TokenTransferDecoded.SIGNATURES:
+            events = abi.events.get(signature[2:], [])
+            if len(events) > 0:
+                self._events_by_signature[signature] = [_TransferEvent(event) for event in events]
+
+    def decode(self, log: EthLog, log_i: int) -> List[TokenTransferDecoded]:
+        """
+        Transfers from a log, empty if it isn't a transfer or can't be decoded.
+        """
+        event = self._resolve(log['topics'])
+        if event is None:
+            return []
+
+        decoded = event.decode(log['topics'], log['data'])
+        if decoded is None or not _is_valid_transfer(event, decoded):
+            return []
+
+        return TokenTransferDecoded.from_json(log, log_i, event.event, decoded)
+
+    def decode_logs(self, logs_by_transaction: Sequence[Sequence[EthLog]]) -> List[List[TokenTransferDecoded]]:
+        """
+        Transfers of each list of logs, usually those of each transaction in a block, batch decoding events with only
+        static types together across all of them.
+        """
+        # where each transfer log is as the transaction index and log index within the transaction
+        logs_by_event: Dict[int, Tuple[_TransferEvent, List[Tuple[int, int]]]] = {}
+        for tx_i, logs in enumerate(logs_by_transaction):
+            for log_i, log in enumerate(logs):
+                event = self._resolve(log['topics'])
+                if event is not None:
+                    logs_by_event.setdefault(id(event), (event, []))[1].append((tx_i, log_i))
+
+        decoded_by_log: Dict[Tuple[int, int], Optional[Dict[str, any]]] = {}
+        for event, positions in logs_by_event.values():
+            logs = [logs_by_transaction[tx_i][log_i] for tx_i, log_i in positions]
+            batch_decoded = [None] * len(logs)
+            if event.batch_decoder is not None:
+                batch_decoded = event.batch_decoder.decode_json(logs)
+
+            for position, log, log_batch_decoded in zip(positions, logs, batch_decoded):
+                # anything the batch couldn't decode, like extra topics eth_abi would ignore, is decoded on its own
+                decoded_by_log[position] = event.decode(log['topics'], log['data']) \
+                    if log_batch_decoded is None else log_batch_decoded
+
+        transfers: List[List[TokenTransferDecoded]] = []
+        for tx_i, logs in enumerate(logs_by_transaction):
+            transaction_transfers: List[TokenTransferDecoded] = []
+            for log_i, log in enumerate(logs):
+                decoded = decoded_by_log.get((tx_i, log_i))
+                if decoded is None:
+                    continue
+
+                event = self._resolve(log['topics'])
+                if _is_valid_transfer(event, decoded):
+                    transaction_transfers.extend(TokenTransferDecoded.from_json(log, log_i, event.event, decoded))
+            transfers.append(transaction_transfers)
+
+        return transfers
+
+    def _resolve(self, topics: Sequence[str]) -> Optional[_TransferEvent]:
+        if len(topics) == 0:
+            return None
+
+        events = self._events_by_signature.get(topics[0])
+        if events is None:
+            return None
+        elif len(events) == 1:
+            return events[0]
+
+        # events sharing a signature are told apart by the number of indexed parameters
+        for event in events:
+            if len(topics) - 1 == event.num_indexed:
+                return event
+
+        return None
+
+
+def _uint256_array(data: bytes, offset: int) -> Optional[Tuple[int, ...]]:
+    if offset + WORD_SIZE > len(data):
+        return None
+
+    length = int.from_bytes(data[offset:offset + WORD_SIZE], 'big')
+    start = offset + WORD_SIZE
+    if start + WORD_SIZE * length > len(data):
+        return None
+
+    # arrays are tuples like eth_abi
+    return tuple(
+        int.from_bytes(data[i:i + WORD_SIZE], 'big') for i in range(start, start + WORD_SIZE * length, WORD_SIZE)
+    )
+
+
+def _is_valid_transfer(event: _TransferEvent, decoded: Dict[str, any]) -> bool:
+    """
+    Batch transfers need at least one id and a value for each.
+    """
+    if event.event.name != 'TransferBatch':
+        return True
+
+    return 0 < len(decoded['ids']) <= len(decoded['values'])
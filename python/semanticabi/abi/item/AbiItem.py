@@ -1,13 +1,13 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 from functools import cached_property
-from typing import Dict
+from typing import Collection, Dict, List, Optional, Tuple
 
 import eth_abi
 from Crypto.Hash import keccak
 
 from semanticabi.abi.Decoded import DecodedTuple
-from semanticabi.abi.item.Parameter import Parameters
+from semanticabi.abi.item.Parameter import Parameter, Parameters
 from semanticabi.abi.item.ItemType import ItemType
 
 
@@ -48,7 +48,7 @@ class AbiItem(ABC):
         pass
 
     @abstractmethod
-    def decode(self, item_json: Dict[str, any]) -> DecodedTuple:
+    def decode(self, item_json: Dict[str, any], parameters: Optional[Collection[str]] = None) -> DecodedTuple:
         pass
 
 
@@ -85,29 +85,16 @@ class AbiFunction(AbiItem):
         # functions only use the first 8 hex digits
         return item_hash.hexdigest()[0:8]
 
-    def decode(self, input: str) -> DecodedTuple:
-        return DecodedTuple.from_parameters_and_values(
-            None,
-            self.inputs.parameters(),
-            eth_abi.decode(
-                # build out the signatures to decode
-                self.inputs.signatures(),
-                # use input encoded as hex stripping the 0x and function signature
-                bytearray.fromhex(input[10:])
-            )
-        )
+    def decode(self, input: str, parameters: Optional[Collection[str]] = None) -> DecodedTuple:
+        """
+        Decode the input, optionally only the given top level parameters.
+        """
+        # use input encoded as hex stripping the 0x and function signature
+        return _decode_projected(self.inputs.parameters(), bytearray.fromhex(input[10:]), parameters)
 
-    def decode_output(self, output: str) -> DecodedTuple:
-        return DecodedTuple.from_parameters_and_values(
-            None,
-            self.outputs.parameters(),
-            eth_abi.decode(
-                # build out the signatures to decode
-                self.outputs.signatures(),
-                # use output encoded as hex stripping the 0x
-                bytearray.fromhex(output[2:])
-            )
-        )
+    def decode_output(self, output: str, parameters: Optional[Collection[str]] = None) -> DecodedTuple:
+        # use output encoded as hex stripping the 0x
+        return _decode_projected(self.outputs.parameters(), bytearray.fromhex(output[2:]), parameters)
 
 
 class AbiEvent(AbiItem):
@@ -142,7 +129,28 @@ class AbiEvent(AbiItem):
 
         return True
 
-    def decode(self, item: Dict[str, any]) -> DecodedTuple:
+    @cached_property
+    def layout(self) -> Tuple[str, Tuple[bool, ...]]:
+        """
+        Canonical signature and which parameters are indexed, the same for events declared in different ABIs that
+        would decode a log to the same values even if their parameters are named differently.
+        """
+        return self.signature, tuple(parameter.is_indexed for parameter in self.inputs.parameters())
+
+    def decode(self, item: Dict[str, any], parameters: Optional[Collection[str]] = None) -> DecodedTuple:
+        """
+        Decode the log, optionally only the given top level parameters.
+        """
+        return DecodedTuple.from_parameters_and_values(
+            None,
+            _projected(self.inputs.parameters(), parameters),
+            self.decode_values(item, parameters)
+        )
+
+    def decode_values(self, item: Dict[str, any], parameters: Optional[Collection[str]] = None) -> List[any]:
+        """
+        Decoded values of the log in the order of the parameters, optionally only the given top level parameters.
+        """
         # we'll be decoding out of order due to indexed vs unindexed parameters, map them so we can reorder at the end
         decoded = {}
 
@@ -160,14 +168,42 @@ class AbiEvent(AbiItem):
             decoded[parameter.name] = decoded_values[parameter_i]
 
         # decode the rest of the data blob
-        decoded_values = eth_abi.decode(self.inputs.signatures(False), bytearray.fromhex(item['data'][2:]))
-        for parameter_i, parameter in enumerate(self.inputs.parameters(False)):
+        unindexed = self.inputs.parameters(False)
+        decoded_values = eth_abi.decode(_signatures(unindexed, parameters), bytearray.fromhex(item['data'][2:]))
+        for parameter_i, parameter in enumerate(unindexed):
             decoded[parameter.name] = decoded_values[parameter_i]
 
-        return DecodedTuple.from_parameters_and_values(
-            None,
-            self.inputs.parameters(),
-            # reorder decoded values to match the signature
-            [decoded[parameter.name] for parameter in self.inputs.parameters()]
-        )
+        # reorder decoded values to match the signature
+        return [decoded[parameter.name] for parameter in _projected(self.inputs.parameters(), parameters)]
+
+
+def _decode_projected(parameters: List[Parameter], data: bytes, names: Optional[Collection[str]]) -> DecodedTuple:
+    decoded_values = eth_abi.decode(_signatures(parameters, names), data)
+    if names is None:
+        return DecodedTuple.from_parameters_and_values(None, parameters, decoded_values)
+
+    projected = _projected(parameters, names)
+    projected_values = [value for parameter, value in zip(parameters, decoded_values) if parameter.name in names]
+    return DecodedTuple.from_parameters_and_values(None, projected, projected_values)
+
+
+def _signatures(parameters: List[Parameter], names: Optional[Collection[str]]) -> List[str]:
+    """
+    Signatures to decode the parameters with. Dynamic parameters that aren't in names only have their offset in the
+    head so are decoded as that, skipping their contents entirely.
+    """
+    if names is None:
+        return [parameter.signature for parameter in parameters]
+
+    return [
+        parameter.signature if parameter.name in names or not parameter.is_dynamic else 'uint256'
+        for parameter in parameters
+    ]
+
+
+def _projected(parameters: List[Parameter], names: Optional[Collection[str]]) -> List[Parameter]:
+    if names is None:
+        return parameters
+
+    return [parameter for parameter in parameters if parameter.name in names]
 
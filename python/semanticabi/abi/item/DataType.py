@@ -29,6 +29,10 @@ class DataType(Enum):
         self.type_name = type_name
         self.build_dataset_column = dataset_column_type_fn
 
+    def __reduce_ex__(self, protocol):
+        # values hold lambdas so pickle by name instead of by value
+        return getattr, (DataType, self.name)
+
     @staticmethod
     def get(type_name: str) -> DataType:
         """
@@ -38,6 +38,14 @@ class Parameter(ABC):
     def signature(self) -> str:
         pass
 
+    @property
+    @abstractmethod
+    def is_dynamic(self) -> bool:
+        """
+        If the encoded value is stored after the head with only its offset in the head.
+        """
+        pass
+
 
 class PrimitiveParameter(Parameter):
     """
@@ -73,6 +81,11 @@ class PrimitiveParameter(Parameter):
     def signature(self) -> str:
         return self._primitive_type
 
+    @property
+    def is_dynamic(self) -> bool:
+        # fixed size arrays are only dynamic if their elements are
+        return '[]' in self._primitive_type or self._primitive_type.split('[')[0] in ('bytes', 'string')
+
 
 class TupleParameter(Parameter):
     """
@@ -118,6 +131,10 @@ class TupleParameter(Parameter):
             signature += '[]'
         return signature
 
+    @cached_property
+    def is_dynamic(self) -> bool:
+        return self.is_array or any(component.is_dynamic for component in self.components)
+
 
 class Parameters:
     """
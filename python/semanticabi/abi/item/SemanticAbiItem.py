@@ -2,8 +2,9 @@ from __future__ import annotations
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from functools import cached_property
-from typing import TypedDict, List, Optional, Dict
+from typing import Collection, TypedDict, List, Optional, Dict
 
+from semanticabi.abi.DecodeMemo import DecodeMemo
 from semanticabi.abi.Decoded import DecodedTuple
 from semanticabi.abi.InvalidAbiException import InvalidAbiException
 from semanticabi.abi.item.AbiItem import AbiItem, AbiEvent, AbiFunction
@@ -107,7 +108,10 @@ class SemanticAbiItem(ABC):
         pass
 
     @abstractmethod
-    def decode(self, event_or_trace: EthLog | EthTrace) -> DecodedResult:
+    def decode(self, event_or_trace: EthLog | EthTrace, parameters: Optional[Collection[str]] = None) -> DecodedResult:
+        """
+        Decode the log or trace, optionally only the given top level input and output parameters.
+        """
         pass
 
 
@@ -135,13 +139,21 @@ class SemanticAbiEvent(SemanticAbiItem):
     def output_parameters(self) -> Optional[SemanticParameters]:
         return None
 
-    def decode(self, event: EthLog) -> DecodedResult:
+    def decode(
+        self,
+        event: EthLog,
+        parameters: Optional[Collection[str]] = None,
+        memo: Optional[DecodeMemo] = None
+    ) -> DecodedResult:
+        """
+        Decode the log, optionally sharing the decoded values with other ABIs through the memo.
+        """
         # Can't do isinstance(event, EthLog) because isinstance doesn't work on TypedDicts, which EthLog is
         if isinstance(event, EthTrace):
             raise Exception("Can only decode logs")
 
         return DecodedResult(
-            self.event.decode(event),
+            self.event.decode(event, parameters) if memo is None else memo.decode(self.event, event, parameters),
             None
         )
 
@@ -184,7 +196,7 @@ class SemanticAbiFunction(SemanticAbiItem):
     def output_parameters(self) -> Optional[SemanticParameters]:
         return self._output_parameters
 
-    def decode(self, trace: EthTrace) -> DecodedResult:
+    def decode(self, trace: EthTrace, parameters: Optional[Collection[str]] = None) -> DecodedResult:
         if not isinstance(trace, EthTrace):
             raise Exception("Can only decode traces")
 
@@ -192,9 +204,9 @@ class SemanticAbiFunction(SemanticAbiItem):
         decoded_output = None
         # output is only valid and non-empty if more than 2 characters since the first 2 are 0x
         if output is not None and len(output) > 2:
-            decoded_output = self.function.decode_output(output)
+            decoded_output = self.function.decode_output(output, parameters)
 
         return DecodedResult(
-            self.function.decode(trace.input),
+            self.function.decode(trace.input, parameters),
             decoded_output
         )
@@ -0,0 +1,32 @@
+from typing import Dict, Optional
+
+from semanticabi.common.column.HexNormalize import HexNormalize
+
+
+class HexInterner:
+    """
+    Normalizes each distinct hex string like an address or hash once, returning the same string for equal values so
+    the rows of a block share a single copy. Meant to live as long as a block since the same addresses show up across
+    its transactions, but not much longer as there's no eviction.
+    """
+
+    _normalized: Dict[str, str]
+
+    def __init__(self):
+        self._normalized = {}
+
+    def normalize(self, value: Optional[str]) -> Optional[str]:
+        if value is None:
+            return None
+
+        normalized = self._normalized.get(value)
+        if normalized is None:
+            normalized = HexNormalize.normalize(value)
+            # map the normalized value to itself so values already normalized elsewhere are also shared
+            normalized = self._normalized.setdefault(normalized, normalized)
+            self._normalized[value] = normalized
+
+        return normalized
+
+    def __len__(self) -> int:
+        return len(set(self._normalized.values()))
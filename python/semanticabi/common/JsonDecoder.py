@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import gzip
+import json
+from abc import ABC, abstractmethod
+from typing import Dict, Callable, List
+
+
+class JsonDecoder(ABC):
+    """
+    Decodes JSON payloads like blocks with receipts and traces or node RPC responses. Traced blocks can be megabytes of
+    hex strings, so the stdlib decoder can be swapped for one of the faster optional backends if they are installed.
+    """
+
+    @staticmethod
+    def available() -> List[str]:
+        """
+        Names of the backends that can be used in this environment, fastest first.
+        """
+        return [name for name, decoder_f in _BACKENDS.items() if decoder_f() is not None]
+
+    @staticmethod
+    def of(name: str) -> JsonDecoder:
+        """
+        Get the decoder for a backend by name, throwing if it's unknown or not installed.
+        """
+        if name not in _BACKENDS:
+            raise ValueError(f'Unknown JSON decoder backend: {name}')
+
+        decoder = _BACKENDS[name]()
+        if decoder is None:
+            raise ValueError(f'JSON decoder backend \'{name}\' is not installed')
+
+        return decoder
+
+    @staticmethod
+    def default() -> JsonDecoder:
+        """
+        The fastest decoder available, falling back to the stdlib.
+        """
+        return JsonDecoder.of(JsonDecoder.available()[0])
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        pass
+
+    @abstractmethod
+    def loads(self, payload: bytes | str) -> any:
+        """
+        Decode a JSON document from either raw bytes or a string.
+        """
+        pass
+
+    def load(self, path: str) -> any:
+        """
+        Decode a JSON file, decompressing it first if it's gzipped.
+        """
+        opener = gzip.open if path.endswith('.gz') else open
+        with opener(path, 'rb') as file:
+            return self.loads(file.read())
+
+
+class StdlibJsonDecoder(JsonDecoder):
+
+    @property
+    def name(self) -> str:
+        return 'json'
+
+    def loads(self, payload: bytes | str) -> any:
+        return json.loads(payload)
+
+
+class OrjsonDecoder(JsonDecoder):
+
+    def __init__(self):
+        import orjson
+        self._loads = orjson.loads
+
+    @property
+    def name(self) -> str:
+        return 'orjson'
+
+    def loads(self, payload: bytes | str) -> any:
+        return self._loads(payload)
+
+
+class MsgspecDecoder(JsonDecoder):
+
+    def __init__(self):
+        import msgspec
+        # reuse a single decoder since msgspec caches internal state on it
+        self._decoder = msgspec.json.Decoder()
+
+    @property
+    def name(self) -> str:
+        return 'msgspec'
+
+    def loads(self, payload: bytes | str) -> any:
+        return self._decoder.decode(payload)
+
+
+def _optional(decoder_f: Callable[[], JsonDecoder]) -> Callable[[], JsonDecoder | None]:
+    """
+    Wrap the constructor of a decoder with an optional dependency so it returns None if it's not installed.
+    """
+    def construct():
+        try:
+            return decoder_f()
+        except ImportError:
+            return None
+
+    return construct
+
+
+# ordered by preference with the stdlib always available as the fallback
+_BACKENDS: Dict[str, Callable[[], JsonDecoder | None]] = {
+    'orjson': _optional(OrjsonDecoder),
+    'msgspec': _optional(MsgspecDecoder),
+    'json': StdlibJsonDecoder
+}
@@ -17,7 +17,8 @@ class HexNormalize(DatasetColumnTransform):
 
     @staticmethod
     def normalize(hex: str) -> str:
-        return hex.lower()
+        # avoid copying values that are already lowercase, which for hex means there are no uppercase digits
+        return hex if hex.islower() else hex.lower()
 
     def transform(self, blob: Dict[str, any], key: str) -> any:
         key = key if self.source_col is None else self.source_col
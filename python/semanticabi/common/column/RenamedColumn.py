@@ -15,6 +15,13 @@ class RenamedColumn(DatasetColumn):
         self._original_column = original_column
         self._name = name
 
+    @property
+    def original_column(self) -> DatasetColumn:
+        """
+        The column being renamed, which has any attributes specific to its column type
+        """
+        return self._original_column
+
     @property
     def data_type(self) -> DataType:
         return self._original_column.data_type
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Callable, Type
+
+from semanticabi.common.TransformException import TransformException
+
+
+class CompiledExpression(ABC):
+    """
+    Node of an expression compiled from its parse tree that can be evaluated without walking the tree again, and unlike
+    the parse tree, pickled.
+    """
+
+    @abstractmethod
+    def evaluate(self, variables: Dict[str, any]) -> any:
+        pass
+
+
+@dataclass(frozen=True)
+class Constant(CompiledExpression):
+    value: any
+
+    def evaluate(self, variables: Dict[str, any]) -> any:
+        return self.value
+
+
+@dataclass(frozen=True)
+class Variable(CompiledExpression):
+    name: str
+
+    def evaluate(self, variables: Dict[str, any]) -> any:
+        value: any = variables.get(self.name)
+        if value is None:
+            raise TransformException('Unknown variable: ' + self.name)
+
+        return value
+
+
+@dataclass(frozen=True)
+class BinaryOperation(CompiledExpression):
+    # functions from the operator module so they can be pickled
+    operator: Callable[[any, any], any]
+    left: CompiledExpression
+    right: CompiledExpression
+
+    def evaluate(self, variables: Dict[str, any]) -> any:
+        return self.operator(self.left.evaluate(variables), self.right.evaluate(variables))
+
+
+@dataclass(frozen=True)
+class Failure(CompiledExpression):
+    """
+    Part of an expression that couldn't be compiled, raising the error each time it's evaluated like it would have been
+    when evaluating the parse tree.
+    """
+    exception_type: Type[Exception]
+    message: str
+
+    def evaluate(self, variables: Dict[str, any]) -> any:
+        raise self.exception_type(self.message)
@@ -0,0 +1,91 @@
+import operator
+
+from semanticabi.common.TransformException import TransformException
+from semanticabi.common.expression.CompiledExpression import CompiledExpression, Constant, Variable, \
+    BinaryOperation, Failure
+from semanticabi.common.expression.parser.ExpressionParser import ExpressionParser
+from semanticabi.common.expression.parser.ExpressionVisitor import ExpressionVisitor
+
+
+class ExpressionCompileVisitor(ExpressionVisitor):
+    """
+    Visitor that compiles the parse tree of an expression into a CompiledExpression so it's only walked once instead of
+    for every row it's evaluated on.
+    """
+
+    def visit(self, tree) -> CompiledExpression:
+        if tree is None:
+            # a part missing from an expression that didn't parse, failing the same as visiting it used to
+            return Failure(AttributeError, "'NoneType' object has no attribute 'accept'")
+
+        return super().visit(tree)
+
+    def defaultResult(self) -> CompiledExpression:
+        # what's left of anything that failed to parse
+        return Constant(None)
+
+    def visitPowExpression(self, ctx: ExpressionParser.PowExpressionContext):
+        return BinaryOperation(operator.pow, self.visit(ctx.expression(0)), self.visit(ctx.expression(1)))
+
+    def visitMultExpression(self, ctx: ExpressionParser.MultExpressionContext):
+        if ctx.MULT() is not None:
+            return BinaryOperation(operator.mul, self.visit(ctx.expression(0)), self.visit(ctx.expression(1)))
+        elif ctx.DIV() is not None:
+            return BinaryOperation(operator.truediv, self.visit(ctx.expression(0)), self.visit(ctx.expression(1)))
+        else:
+            return Failure(Exception, 'Unknown operator: ' + str(ctx.getText()))
+
+    def visitAddExpression(self, ctx: ExpressionParser.AddExpressionContext):
+        if ctx.PLUS() is not None:
+            return BinaryOperation(operator.add, self.visit(ctx.expression(0)), self.visit(ctx.expression(1)))
+        elif ctx.MINUS() is not None:
+            return BinaryOperation(operator.sub, self.visit(ctx.expression(0)), self.visit(ctx.expression(1)))
+        elif ctx.CONCAT() is not None:
+            return BinaryOperation(operator.add, self.visit(ctx.expression(0)), self.visit(ctx.expression(1)))
+        else:
+            return Failure(Exception, 'Unknown operator: ' + str(ctx.getText()))
+
+    def visitSignedAtom(self, ctx: ExpressionParser.SignedAtomContext):
+        if ctx.MINUS() is not None:
+            return BinaryOperation(operator.mul, Constant(-1), self.visit(ctx.signedAtom()))
+        elif ctx.PLUS() is not None:
+            return self.visit(ctx.signedAtom())
+
+        return self.visit(ctx.atom())
+
+    def visitAtom(self, ctx: ExpressionParser.AtomContext):
+        if ctx.expression() is not None:
+            return self.visit(ctx.expr)
+
+        return self.visitChildren(ctx)
+
+    def visitNumber(self, ctx: ExpressionParser.NumberContext):
+        if ctx.NUMBER() is not None:
+            value = ctx.NUMBER().getText()
+            try:
+                return Constant(ExpressionCompileVisitor._string_to_number(value))
+            except TransformException as e:
+                return Failure(TransformException, str(e))
+        else:
+            return Failure(Exception, 'Unknown number format: ' + str(ctx.getText()))
+
+    def visitVariable(self, ctx: ExpressionParser.VariableContext):
+        return Variable(ctx.VARIABLE().getText())
+
+    def visitString(self, ctx: ExpressionParser.StringContext):
+        # Strip off the leading and trailing single quotes
+        return Constant(ctx.STRING().getText()[1:-1])
+
+    @staticmethod
+    def _string_to_number(value: str) -> int | float:
+        """
+        Convert a string to a number
+        """
+
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return float(value)
+            except ValueError:
+                raise TransformException(f'Could not convert {value} to a number')
@@ -2,7 +2,8 @@ from typing import Dict, Set
 
 from antlr4 import *
 
-from semanticabi.common.expression.ExpressionEvalVisitor import ExpressionEvalVisitor
+from semanticabi.common.expression.CompiledExpression import CompiledExpression
+from semanticabi.common.expression.ExpressionCompileVisitor import ExpressionCompileVisitor
 from semanticabi.common.expression.ExpressionVariableListener import ExpressionVariableListener
 from semanticabi.common.expression.parser.ExpressionLexer import ExpressionLexer
 from semanticabi.common.expression.parser.ExpressionParser import ExpressionParser
@@ -10,27 +11,30 @@ from semanticabi.common.expression.parser.ExpressionParser import ExpressionPars
 
 class ExpressionEvaluator:
     """
-    Given an expression from a semantic abi, evaluates it given the appropriate variable context
+    Given an expression from a semantic abi, evaluates it given the appropriate variable context. The expression is
+    parsed once and compiled so evaluating it doesn't parse it again, and it can be pickled.
     """
     _expression: str
-    _parser: ExpressionParser
+    _compiled: CompiledExpression
+    _column_names: Set[str]
 
     def __init__(self, expression: str):
         self._expression = expression
         lexer = ExpressionLexer(InputStream(self._expression))
         stream = CommonTokenStream(lexer)
-        self._parser = ExpressionParser(stream)
+        tree = ExpressionParser(stream).expression()
+
+        listener = ExpressionVariableListener()
+        ParseTreeWalker().walk(listener, tree)
+        self._column_names = listener.variable_names()
+
+        self._compiled = ExpressionCompileVisitor().visit(tree)
 
     def evaluate(self, variables: Dict[str, any]) -> any:
-        self._parser.reset()
-        return ExpressionEvalVisitor(variables).visit(self._parser.expression())
+        return self._compiled.evaluate(variables)
 
     def column_names(self) -> Set[str]:
         """
         Get the column names used in the expression
         """
-        self._parser.reset()
-        listener = ExpressionVariableListener()
-        walker = ParseTreeWalker()
-        walker.walk(listener, self._parser.expression())
-        return listener.variable_names()
+        return set(self._column_names)
@@ -0,0 +1,458 @@
+from __future__ import annotations
+
+import json
+import os
+from collections.abc import MutableMapping
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Collection, Dict, Iterator, List, Optional, Set, Tuple
+
+import numpy
+import pyarrow
+import pyarrow.compute
+import pyarrow.ipc
+
+from semanticabi.metadata.EthTraces import EthTrace
+from semanticabi.metadata.EthTransaction import EthTransaction
+
+# columns used internally and not part of the original JSON start with an underscore
+ABSENT_COLUMN = '_absent'
+TX_INDEX_COLUMN = '_tx_index'
+LOG_INDEX_COLUMN = '_log_index'
+TOPIC_COLUMNS = ['_topic0', '_topic1', '_topic2', '_topic3']
+
+# field metadata for columns of JSON encoded values
+JSON_METADATA = {b'json': b'true'}
+
+TABLE_NAMES = ['header', 'transactions', 'receipts', 'logs', 'traces']
+
+
+@dataclass
+class BlockTables:
+    """
+    A block decomposed into Arrow tables so it can be parsed once, shared read-only between processes through Arrow
+    IPC files in shared memory or on disk, and attached to with zero copy.
+
+    The header, transactions, receipts and logs keep every field of the original JSON with scalar values as typed
+    columns and anything nested as JSON so row views are equal to the original. Traces are normalized from the parsed
+    geth or erigon traces. Internal columns prefixed with an underscore hold what is needed to link tables and filter
+    without decoding, like the transaction index and topics of logs, so finding the logs and traces of interest in a
+    block is a vectorized filter rather than a walk through every transaction.
+    """
+
+    header: pyarrow.Table
+    transactions: pyarrow.Table
+    # receipts without logs which are in their own table
+    receipts: pyarrow.Table
+    logs: pyarrow.Table
+    traces: Optional[pyarrow.Table]
+
+    @staticmethod
+    def from_transactions(block: Dict[str, any], transactions: List[EthTransaction], has_traces: bool) -> BlockTables:
+        """
+        Decompose the block JSON and parsed transactions of a block, each table built on first access.
+        """
+        return _ParsedBlockTables(block, transactions, has_traces)
+
+    @staticmethod
+    def open(directory: str) -> BlockTables:
+        """
+        Attach to tables written by share, memory mapping the files so nothing is copied.
+        """
+        tables = {}
+        for name in TABLE_NAMES:
+            path = os.path.join(directory, f'{name}.arrow')
+            if os.path.exists(path):
+                with pyarrow.memory_map(path, 'r') as source:
+                    tables[name] = pyarrow.ipc.open_file(source).read_all()
+            else:
+                tables[name] = None
+
+        return BlockTables(**tables)
+
+    def share(self, directory: str):
+        """
+        Write each table as an Arrow IPC file in the directory, ideally somewhere like /dev/shm so it never hits disk.
+        """
+        os.makedirs(directory, exist_ok=True)
+        for name in TABLE_NAMES:
+            table: Optional[pyarrow.Table] = getattr(self, name)
+            if table is None:
+                continue
+
+            # single chunks so row lookups don't need to search chunks
+            table = table.combine_chunks()
+            with pyarrow.OSFile(os.path.join(directory, f'{name}.arrow'), 'wb') as sink:
+                with pyarrow.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+
+    @property
+    def num_transactions(self) -> int:
+        return self.transactions.num_rows
+
+    @cached_property
+    def log_offsets(self) -> numpy.ndarray:
+        """
+        Offsets into the logs for each transaction, logs of transaction i are from offsets[i] to offsets[i + 1].
+        """
+        return _offsets(self.logs, self.num_transactions)
+
+    @cached_property
+    def trace_offsets(self) -> Optional[numpy.ndarray]:
+        return None if self.traces is None else _offsets(self.traces, self.num_transactions)
+
+    def topics_by_transaction(
+        self,
+        log_topics: Collection[str],
+        trace_topics: Collection[str],
+        addresses: Optional[Set[str]] = None
+    ) -> Dict[int, Set[str]]:
+        """
+        Index of each transaction with a log or trace of any of the topics, without the 0x prefix like the hash of an
+        ABI item, to the topics it has. If addresses are given, only logs emitted by and traces calling one of the
+        lowercase addresses are considered.
+        """
+        topics_by_transaction: Dict[int, Set[str]] = {}
+        for tx_index, topic in self._matching(log_topics, trace_topics, addresses):
+            topics_by_transaction.setdefault(tx_index, set()).add(topic)
+
+        return topics_by_transaction
+
+    def count_by_topic(
+        self,
+        log_topics: Collection[str],
+        trace_topics: Collection[str],
+        addresses: Optional[Set[str]] = None
+    ) -> Dict[str, int]:
+        """
+        Number of logs and traces of each topic in the block, filtered the same as topics_by_transaction.
+        """
+        counts: Dict[str, int] = {}
+        for _, topic in self._matching(log_topics, trace_topics, addresses):
+            counts[topic] = counts.get(topic, 0) + 1
+
+        return counts
+
+    def filter_logs(self, topics: Collection[str], addresses: Optional[Set[str]] = None) -> pyarrow.Table:
+        """
+        Logs with any of the topics and if given, emitted by one of the addresses.
+        """
+        return self.logs.filter(_mask(self.logs, TOPIC_COLUMNS[0], 'address', topics, addresses))
+
+    def _matching(
+        self,
+        log_topics: Collection[str],
+        trace_topics: Collection[str],
+        addresses: Optional[Set[str]]
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Transaction index and topic, without the 0x prefix, of each log and trace matching the filters, only touching
+        the tables needed.
+        """
+        matching = []
+        if len(log_topics) > 0:
+            matching.append(_filter(self.logs, TOPIC_COLUMNS[0], 'address', log_topics, addresses))
+        if len(trace_topics) > 0 and self.traces is not None:
+            matching.append(_filter(self.traces, 'signature', 'to', trace_topics, addresses))
+
+        for tx_indices, topics in matching:
+            for tx_index, topic in zip(tx_indices.tolist(), topics.tolist()):
+                yield tx_index, topic[2:]
+
+
+class _ParsedBlockTables(BlockTables):
+    """
+    Tables of a parsed JSON block, built on first access so only what is read is decomposed. Dispatching walks the
+    parsed transactions rather than building the logs and traces tables just to filter them.
+    """
+
+    _block: Dict[str, any]
+    _transactions: List[EthTransaction]
+    _has_traces: bool
+
+    def __init__(self, block: Dict[str, any], transactions: List[EthTransaction], has_traces: bool):
+        self._block = block
+        self._transactions = transactions
+        self._has_traces = has_traces
+
+    @cached_property
+    def header(self) -> pyarrow.Table:
+        return _table([{k: v for k, v in self._block.items() if k != 'transactions'}])
+
+    @cached_property
+    def transactions(self) -> pyarrow.Table:
+        return _table([transaction.raw for transaction in self._transactions])
+
+    @cached_property
+    def receipts(self) -> pyarrow.Table:
+        return _table([
+            {k: v for k, v in transaction.receipt.items() if k != 'logs'} for transaction in self._transactions
+        ])
+
+    @cached_property
+    def logs(self) -> pyarrow.Table:
+        return _logs_table(self._transactions)
+
+    @cached_property
+    def traces(self) -> Optional[pyarrow.Table]:
+        return _traces_table(self._transactions) if self._has_traces else None
+
+    @property
+    def num_transactions(self) -> int:
+        return len(self._transactions)
+
+    def _matching(
+        self,
+        log_topics: Collection[str],
+        trace_topics: Collection[str],
+        addresses: Optional[Set[str]]
+    ) -> Iterator[Tuple[int, str]]:
+        """
+        Walk the logs and traces by topic of each parsed transaction instead of building the logs and traces tables,
+        InitStep reads the same dicts for the transactions it transforms so they are built either way, while the
+        tables would only be used to dispatch.
+        """
+        log_topics = set(log_topics)
+        trace_topics = set(trace_topics)
+        filter_addresses = addresses is not None and len(addresses) > 0
+        for tx_index, transaction in enumerate(self._transactions):
+            if len(log_topics) > 0:
+                logs_by_topic = transaction.logs_by_topic
+                for topic in log_topics.intersection(logs_by_topic):
+                    for log in logs_by_topic[topic]:
+                        if not filter_addresses or (log.get('address') or '').lower() in addresses:
+                            yield tx_index, topic
+            if len(trace_topics) > 0 and self._has_traces:
+                traces_by_topic = transaction.traces_by_topic
+                for topic in trace_topics.intersection(traces_by_topic):
+                    for trace in traces_by_topic[topic]:
+                        if not filter_addresses or (trace.to_address or '').lower() in addresses:
+                            yield tx_index, topic
+
+
+class TableRows:
+    """
+    Column lookups for views over rows of a table, shared by all views of the table.
+    """
+
+    table: pyarrow.Table
+    names: List[str]
+    _columns: Dict[str, pyarrow.ChunkedArray]
+    _json_names: set
+    _absent: Optional[pyarrow.ChunkedArray]
+
+    def __init__(self, table: pyarrow.Table):
+        self.table = table
+        self.names = [name for name in table.column_names if not name.startswith('_')]
+        self._columns = {name: table.column(name) for name in table.column_names}
+        self._json_names = {
+            field.name for field in table.schema if field.metadata is not None and field.metadata.get(b'json') == b'true'
+        }
+        self._absent = self._columns.get(ABSENT_COLUMN)
+
+    def value(self, name: str, index: int) -> any:
+        value = self._columns[name][index].as_py()
+        if value is not None and name in self._json_names:
+            return json.loads(value)
+
+        return value
+
+    def absent(self, index: int) -> List[str]:
+        if self._absent is None:
+            return []
+
+        return self._absent[index].as_py() or []
+
+    def row(self, index: int) -> RowView:
+        return RowView(self, index)
+
+
+class RowView(MutableMapping):
+    """
+    Lazy dict-like view over a row of a table, values are only read from the columns when accessed. Writes go to an
+    overlay so views can be used where code expects to fix up values, like the status of a receipt.
+    """
+
+    _rows: TableRows
+    _index: int
+    _overlay: Dict[str, any]
+
+    def __init__(self, rows: TableRows, index: int):
+        self._rows = rows
+        self._index = index
+        self._overlay = {}
+
+    @cached_property
+    def _keys(self) -> List[str]:
+        absent = self._rows.absent(self._index)
+        return [name for name in self._rows.names if name not in absent]
+
+    def __getitem__(self, key: str) -> any:
+        if key in self._overlay:
+            return self._overlay[key]
+
+        if key not in self._keys:
+            raise KeyError(key)
+
+        return self._rows.value(key, self._index)
+
+    def __setitem__(self, key: str, value: any):
+        self._overlay[key] = value
+
+    def __delitem__(self, key: str):
+        raise Exception('Block views are read-only.')
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._keys
+        yield from (key for key in self._overlay if key not in self._keys)
+
+    def __len__(self) -> int:
+        return len(set(self._keys).union(self._overlay.keys()))
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+def _hex_to_int(value: str | int) -> int:
+    return int(value, 16) if isinstance(value, str) else value
+
+
+def _table(rows: List[Dict[str, any]], extra_columns: Optional[Dict[str, pyarrow.Array]] = None) -> pyarrow.Table:
+    """
+    Build a table from JSON rows with a column per key, typed if the values are scalars of a single type and otherwise
+    JSON encoded. Keys missing from a row are tracked separately from null values.
+    """
+    names: Dict[str, None] = {}
+    for row in rows:
+        names.update(dict.fromkeys(row.keys()))
+
+    arrays: List[pyarrow.Array] = []
+    fields: List[pyarrow.Field] = []
+    for name in names:
+        values = [row.get(name) for row in rows]
+        data_type = _scalar_type(values)
+        if data_type is None:
+            arrays.append(pyarrow.array([None if v is None else json.dumps(v) for v in values], pyarrow.string()))
+            fields.append(pyarrow.field(name, pyarrow.string(), metadata=JSON_METADATA))
+        else:
+            arrays.append(pyarrow.array(values, data_type))
+            fields.append(pyarrow.field(name, data_type))
+
+    absent = [[name for name in names if name not in row] or None for row in rows]
+    arrays.append(pyarrow.array(absent, pyarrow.list_(pyarrow.string())))
+    fields.append(pyarrow.field(ABSENT_COLUMN, pyarrow.list_(pyarrow.string())))
+
+    for name, array in (extra_columns or {}).items():
+        arrays.append(array)
+        fields.append(pyarrow.field(name, array.type))
+
+    return pyarrow.Table.from_arrays(arrays, schema=pyarrow.schema(fields))
+
+
+def _scalar_type(values: List[any]) -> Optional[pyarrow.DataType]:
+    """
+    Arrow type for the values if they're all a single scalar type, otherwise None to JSON encode them.
+    """
+    value_types = {type(value) for value in values if value is not None}
+    if len(value_types) == 0 or value_types == {str}:
+        return pyarrow.string()
+    elif value_types == {bool}:
+        return pyarrow.bool_()
+    elif value_types == {int} and all(value is None or -2 ** 63 <= value < 2 ** 63 for value in values):
+        return pyarrow.int64()
+
+    return None
+
+
+def _logs_table(transactions: List[EthTransaction]) -> pyarrow.Table:
+    """
+    Logs of all transactions in a single table in the order of the transactions with the topics split out.
+    """
+    logs: List[Dict[str, any]] = []
+    log_tx_indices: List[int] = []
+    for tx_index, transaction in enumerate(transactions):
+        logs.extend(transaction.logs)
+        log_tx_indices.extend([tx_index] * len(transaction.logs))
+
+    topics = [log['topics'] for log in logs]
+    log_columns: Dict[str, pyarrow.Array] = {
+        TX_INDEX_COLUMN: pyarrow.array(log_tx_indices, pyarrow.int32()),
+        LOG_INDEX_COLUMN: pyarrow.array([_hex_to_int(log['logIndex']) for log in logs], pyarrow.int64())
+    }
+    for topic_i, column in enumerate(TOPIC_COLUMNS):
+        log_columns[column] = pyarrow.array(
+            [log_topics[topic_i] if len(log_topics) > topic_i else None for log_topics in topics],
+            pyarrow.string()
+        )
+
+    return _table(logs, log_columns)
+
+
+def _traces_table(transactions: List[EthTransaction]) -> pyarrow.Table:
+    """
+    Normalize the parsed traces of all transactions into a single table in the order of the transactions.
+    """
+    traces: List[EthTrace] = []
+    tx_indices: List[int] = []
+    for tx_index, transaction in enumerate(transactions):
+        if transaction.traces is not None:
+            transaction_traces = transaction.traces.traces
+            traces.extend(transaction_traces)
+            tx_indices.extend([tx_index] * len(transaction_traces))
+
+    return pyarrow.table({
+        TX_INDEX_COLUMN: pyarrow.array(tx_indices, pyarrow.int32()),
+        'trace_address': pyarrow.array([trace.trace_address for trace in traces], pyarrow.list_(pyarrow.int32())),
+        'block_hash': pyarrow.array([trace.block_hash for trace in traces], pyarrow.string()),
+        'transaction_hash': pyarrow.array([trace.transaction_hash for trace in traces], pyarrow.string()),
+        'type': pyarrow.array([trace.type for trace in traces], pyarrow.string()),
+        'call_type': pyarrow.array([trace.call_type for trace in traces], pyarrow.string()),
+        'from': pyarrow.array([trace.from_address for trace in traces], pyarrow.string()),
+        'to': pyarrow.array([trace.to_address for trace in traces], pyarrow.string()),
+        'signature': pyarrow.array([trace.signature for trace in traces], pyarrow.string()),
+        'input': pyarrow.array([trace.input for trace in traces], pyarrow.string()),
+        'output': pyarrow.array([trace.output for trace in traces], pyarrow.string()),
+        # values can be larger than any integer type so keep them as decimal strings
+        'value': pyarrow.array([None if trace.value is None else str(trace.value) for trace in traces], pyarrow.string()),
+        'gas': pyarrow.array([trace.gas for trace in traces], pyarrow.int64()),
+        'gas_used': pyarrow.array([trace.gas_used for trace in traces], pyarrow.int64()),
+        'error': pyarrow.array([trace.error for trace in traces], pyarrow.string())
+    })
+
+
+def _filter(
+    table: pyarrow.Table,
+    topic_column: str,
+    address_column: str,
+    topics: Collection[str],
+    addresses: Optional[Set[str]]
+) -> Tuple[pyarrow.Array, pyarrow.Array]:
+    matching = table.select([TX_INDEX_COLUMN, topic_column]).filter(
+        _mask(table, topic_column, address_column, topics, addresses)
+    )
+    return matching.column(0).combine_chunks(), matching.column(1).combine_chunks()
+
+
+def _mask(
+    table: pyarrow.Table,
+    topic_column: str,
+    address_column: str,
+    topics: Collection[str],
+    addresses: Optional[Set[str]]
+) -> pyarrow.ChunkedArray:
+    mask = pyarrow.compute.is_in(
+        table.column(topic_column), value_set=pyarrow.array([f'0x{topic}' for topic in topics], pyarrow.string())
+    )
+    if addresses is not None and len(addresses) > 0 and address_column in table.column_names:
+        mask = pyarrow.compute.and_(mask, pyarrow.compute.is_in(
+            pyarrow.compute.utf8_lower(table.column(address_column)),
+            value_set=pyarrow.array(list(addresses), pyarrow.string())
+        ))
+
+    # nulls from missing topics or addresses never match
+    return mask.fill_null(False)
+
+
+def _offsets(table: pyarrow.Table, num_transactions: int) -> numpy.ndarray:
+    tx_indices = table.column(TX_INDEX_COLUMN).to_numpy()
+    return numpy.searchsorted(tx_indices, numpy.arange(num_transactions + 1), side='left')
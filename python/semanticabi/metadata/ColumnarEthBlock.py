@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import Dict, Iterator, List, Tuple
+
+from semanticabi.metadata.BlockTables import BlockTables, TableRows, RowView
+from semanticabi.metadata.ColumnarTraces import ColumnarTrace
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EthReceipt import EthReceipt
+from semanticabi.metadata.EthTransaction import EthTransaction
+from semanticabi.metadata.EvmChain import EvmChain
+
+
+class ColumnarEthBlock(EthBlock):
+    """
+    Block backed by BlockTables instead of JSON, with transactions, receipts, logs and traces as lazy views over the
+    tables. Since the tables can be memory mapped, many processes can transform the same block from a single parsed
+    copy.
+    """
+
+    tables: BlockTables
+
+    @staticmethod
+    def from_block(block: EthBlock) -> ColumnarEthBlock:
+        """
+        Parse a JSON block into tables.
+        """
+        return ColumnarEthBlock(
+            block.chain,
+            BlockTables.from_transactions(block.block, block.transactions, block.has_traces)
+        )
+
+    @staticmethod
+    def attach(chain: EvmChain, directory: str) -> ColumnarEthBlock:
+        """
+        Attach to a block shared by another process with BlockTables.share.
+        """
+        return ColumnarEthBlock(chain, BlockTables.open(directory))
+
+    def __init__(self, chain: EvmChain, tables: BlockTables):
+        super().__init__(chain, None)
+        self.tables = tables
+
+    @cached_property
+    def block(self) -> Dict[str, any]:
+        header = TableRows(self.tables.header).row(0)
+        header['transactions'] = self._transaction_views
+        return header
+
+    @property
+    def has_traces(self) -> bool:
+        return self.tables.traces is not None
+
+    @property
+    def transactions_and_receipts(self) -> Iterator[Tuple[Dict[str, any], EthReceipt]]:
+        return zip(self._transaction_views, self._receipt_views)
+
+    @cached_property
+    def transactions(self) -> List[EthTransaction]:
+        trace_rows = None if self.tables.traces is None else TableRows(self.tables.traces)
+        trace_offsets = self.tables.trace_offsets
+
+        transactions = []
+        for tx_index, (transaction, receipt) in enumerate(self.transactions_and_receipts):
+            traces = None
+            if trace_rows is not None:
+                traces = ColumnarTrace.transaction_traces(
+                    self.chain, trace_rows, trace_offsets[tx_index], trace_offsets[tx_index + 1]
+                )
+
+            transactions.append(EthTransaction(self.chain, transaction, receipt, traces))
+
+        return transactions
+
+    @cached_property
+    def _transaction_views(self) -> List[RowView]:
+        rows = TableRows(self.tables.transactions)
+        return [rows.row(i) for i in range(self.tables.transactions.num_rows)]
+
+    @cached_property
+    def _receipt_views(self) -> List[RowView]:
+        rows = TableRows(self.tables.receipts)
+        log_rows = TableRows(self.tables.logs)
+        log_offsets = self.tables.log_offsets
+
+        receipts = []
+        for i in range(self.tables.receipts.num_rows):
+            receipt = rows.row(i)
+            receipt['logs'] = [log_rows.row(log_i) for log_i in range(log_offsets[i], log_offsets[i + 1])]
+            receipts.append(receipt)
+
+        return receipts
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from functools import cached_property
+from typing import List, Optional
+
+from semanticabi.metadata.BlockTables import TableRows
+from semanticabi.metadata.EthTraces import EthTrace, CallType, TraceType, EthTransactionTraces
+from semanticabi.metadata.EvmChain import EvmChain
+
+
+class ColumnarTrace(EthTrace):
+    """
+    Trace backed by a row in the traces table of BlockTables, normalized the same way for both geth and erigon.
+    """
+
+    chain: EvmChain
+    _rows: TableRows
+    _index: int
+
+    @staticmethod
+    def transaction_traces(chain: EvmChain, rows: TableRows, start: int, end: int) -> Optional[EthTransactionTraces]:
+        """
+        Traces of a transaction from the range of rows in the traces table, the first being the root.
+        """
+        if start == end:
+            return None
+
+        transaction_traces = EthTransactionTraces(ColumnarTrace(chain, rows, start))
+        for index in range(start + 1, end):
+            transaction_traces.add_trace(ColumnarTrace(chain, rows, index))
+
+        return transaction_traces
+
+    def __init__(self, chain: EvmChain, rows: TableRows, index: int):
+        self.chain = chain
+        self._rows = rows
+        self._index = index
+
+    @cached_property
+    def contract_address(self) -> str:
+        """
+        Internal transfers will always be in the native token of the chain.
+        """
+        return self.chain.native_token_address
+
+    @cached_property
+    def from_address(self) -> str:
+        return self._rows.value('from', self._index)
+
+    @cached_property
+    def to_address(self) -> Optional[str]:
+        return self._rows.value('to', self._index)
+
+    @cached_property
+    def value(self) -> Optional[int]:
+        value = self._rows.value('value', self._index)
+        return None if value is None else int(value)
+
+    @property
+    def is_root(self) -> bool:
+        return len(self.trace_address) == 0
+
+    @property
+    def block_hash(self) -> str:
+        return self._rows.value('block_hash', self._index)
+
+    @property
+    def transaction_hash(self) -> str:
+        return self._rows.value('transaction_hash', self._index)
+
+    @cached_property
+    def trace_address(self) -> List[int]:
+        return self._rows.value('trace_address', self._index)
+
+    @cached_property
+    def trace_hash(self) -> str:
+        return EthTrace.hash_trace_address(self.trace_address)
+
+    @cached_property
+    def signature(self) -> Optional[str]:
+        return self._rows.value('signature', self._index)
+
+    @property
+    def error(self) -> Optional[str]:
+        return self._rows.value('error', self._index)
+
+    @property
+    def type(self) -> TraceType:
+        return self._rows.value('type', self._index)
+
+    @property
+    def call_type(self) -> CallType:
+        return self._rows.value('call_type', self._index)
+
+    @cached_property
+    def input(self) -> Optional[str]:
+        return self._rows.value('input', self._index)
+
+    @cached_property
+    def output(self) -> Optional[str]:
+        return self._rows.value('output', self._index)
+
+    @property
+    def gas(self) -> Optional[int]:
+        return self._rows.value('gas', self._index)
+
+    @property
+    def gas_used(self) -> Optional[int]:
+        return self._rows.value('gas_used', self._index)
@@ -1,12 +1,20 @@
+from __future__ import annotations
+
 from functools import cached_property
 from typing import Dict, Tuple, Iterator, List, Optional
 
+from semanticabi.abi.BatchEventDecoder import BatchDecodedKey, BatchDecoded
+from semanticabi.abi.DecodeMemo import DecodeMemo
+from semanticabi.abi.decoded.TokenTransferDecoded import TokenTransferDecoded
+from semanticabi.common.HexInterner import HexInterner
+from semanticabi.common.JsonDecoder import JsonDecoder
 from semanticabi.common.ValueConverter import ValueConverter
+from semanticabi.metadata.BlockTables import BlockTables
 from semanticabi.metadata.ErigonTraces import ErigonTraces
 from semanticabi.metadata.EthBlockJson import EthBlockJson
 from semanticabi.metadata.EthReceipt import EthReceipt
 from semanticabi.metadata.EthTraces import EthTraces
-from semanticabi.metadata.EthTransaction import EthTransaction
+from semanticabi.metadata.EthTransaction import EthTransaction, transfer_decoder
 from semanticabi.metadata.GethTraces import GethTraces
 from semanticabi.common.ObjectMetadata import ObjectMetadata
 from semanticabi.metadata.EvmChain import EvmChain
@@ -22,11 +30,21 @@ class EthBlock(ObjectMetadata):
     chain: EvmChain
     block_json: EthBlockJson
     _transactions: Optional[List[EthTransaction]]
+    _transfers: Optional[List[List[TokenTransferDecoded]]]
+
+    @staticmethod
+    def from_file(chain: EvmChain, path: str, json_decoder: Optional[JsonDecoder] = None) -> EthBlock:
+        """
+        Load a block with receipts and traces from a JSON file that is optionally gzipped.
+        """
+        json_decoder = JsonDecoder.default() if json_decoder is None else json_decoder
+        return EthBlock(chain, json_decoder.load(path))
 
     def __init__(self, chain: EvmChain, block_json: Dict[str, any]):
         self.chain = chain
         self.block_json = block_json
         self._transactions = None
+        self._transfers = None
 
     @property
     def number(self) -> int:
@@ -123,3 +141,45 @@ class EthBlock(ObjectMetadata):
                 )
 
         return transactions
+
+    @cached_property
+    def tables(self) -> BlockTables:
+        """
+        Columnar logs, traces and the rest of the block, each table decomposed from the transactions on first use.
+        """
+        return BlockTables.from_transactions(self.block, self.transactions, self.has_traces)
+
+    @cached_property
+    def hex_interner(self) -> HexInterner:
+        """
+        Normalized addresses and hashes shared by all rows transformed from the block.
+        """
+        return HexInterner()
+
+    @cached_property
+    def batch_decoded(self) -> Dict[BatchDecodedKey, BatchDecoded]:
+        """
+        Values of event logs decoded across the whole block at once, by event layout and contract addresses then by log
+        index, for steps transforming each transaction to look up instead of decoding logs one at a time. Shared by all
+        ABIs transforming the block.
+        """
+        return {}
+
+    @cached_property
+    def decode_memo(self) -> DecodeMemo:
+        """
+        Logs decoded one at a time, shared by all ABIs transforming the block so each is only decoded once.
+        """
+        return DecodeMemo()
+
+    def decode_transfers(self) -> List[List[TokenTransferDecoded]]:
+        """
+        Decode the token transfers of every transaction in the block together and fill them in on each transaction,
+        instead of each transaction decoding its own logs when its transfers are first needed. Only decodes once.
+        """
+        if self._transfers is None:
+            self._transfers = transfer_decoder().decode_logs([transaction.logs for transaction in self.transactions])
+            for transaction, transaction_transfers in zip(self.transactions, self._transfers):
+                transaction.transfers = transaction_transfers
+
+        return self._transfers
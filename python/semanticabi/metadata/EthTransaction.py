@@ -1,12 +1,13 @@
 from __future__ import annotations
 
-from functools import cached_property
+from functools import cached_property, cache
 from typing import List, Dict, Optional
 
 import importlib_resources
 
 from semanticabi.abi.Abi import Abi
 from semanticabi.abi.decoded.TokenTransferDecoded import TokenTransferDecoded
+from semanticabi.abi.decoded.TokenTransferDecoder import TokenTransferDecoder
 from semanticabi.metadata.EthLog import EthLog
 from semanticabi.metadata.EthReceipt import EthReceipt
 from semanticabi.common.ValueConverter import ValueConverter
@@ -15,10 +16,31 @@ from semanticabi.metadata.EthTransferable import EthTransferable
 from semanticabi.metadata.EthTransferType import EthTransferType
 from semanticabi.metadata.EvmChain import EvmChain
 
-TRANSFER_ABI = Abi.from_json(
-    'Transfer',
-    importlib_resources.files('resources').joinpath('Transfer.json').absolute()
-)
+
+@cache
+def transfer_abi() -> Abi:
+    """
+    ABI of token transfer events, loaded on first use rather than when imported.
+    """
+    return Abi.from_json(
+        'Transfer',
+        importlib_resources.files('resources').joinpath('Transfer.json').absolute()
+    )
+
+
+@cache
+def transfer_decoder() -> TokenTransferDecoder:
+    return TokenTransferDecoder(transfer_abi())
+
+
+def __getattr__(name: str) -> any:
+    # TRANSFER_ABI and TRANSFER_DECODER are still available as module attributes, just loaded lazily
+    if name == 'TRANSFER_ABI':
+        return transfer_abi()
+    elif name == 'TRANSFER_DECODER':
+        return transfer_decoder()
+
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
 
 
 class EthTransaction(EthTransferable):
@@ -114,14 +136,8 @@ class EthTransaction(EthTransferable):
         transfers = []
 
         for log_i, log in enumerate(self.logs):
-            if TokenTransferDecoded.is_a(log):
-                try:
-                    if decoded_log := TRANSFER_ABI.decode_log(log):
-                        for transfer_decoded in TokenTransferDecoded.of(log, log_i, decoded_log):
-                            transfers.append(transfer_decoded)
-                except Exception as e:
-                    # decoding failed, likely a bad transfer
-                    pass
+            # logs that aren't transfers or fail to decode, likely a bad transfer, have no transfers
+            transfers.extend(transfer_decoder().decode(log, log_i))
 
         return transfers
 
@@ -0,0 +1,240 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import Dict, List, Optional, Set
+
+import pyarrow
+import pyarrow.compute as pc
+
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.common.column.DatasetColumn import DatasetColumn
+from semanticabi.common.column.NumericDatasetColumn import CoercedNumericSilverColumn
+from semanticabi.common.column.RenamedColumn import RenamedColumn
+from semanticabi.common.column.StringDatasetColumn import StringDatasetColumn, StringType
+from semanticabi.steps.AbiSchema import AbiSchema
+from semanticabi.steps.Step import TRANSFORM_ERROR_COLUMN
+
+# size in bytes of the hashes that can be written as binary
+HASH_SIZES: Dict[StringType, int] = {
+    StringType.ADDRESS_HASH: 20,
+    StringType.TRANSACTION_HASH: 32,
+    StringType.BLOCK_HASH: 32
+}
+
+# max precision of an arrow decimal, 2 digits short of a uint256
+DECIMAL_PRECISION = 76
+DECIMAL_TYPE = pyarrow.decimal256(DECIMAL_PRECISION, 0)
+
+
+class HashEncoding(Enum):
+    """
+    How address, transaction hash and block hash columns are written.
+    """
+    # 0x prefixed hex strings
+    STRING = 'string'
+    # raw bytes as fixed size binary, less than half the size of hex strings
+    BINARY = 'binary'
+    # hex strings dictionary encoded, for when the same few addresses are repeated across many rows
+    DICTIONARY = 'dictionary'
+
+
+class NumericEncoding(Enum):
+    """
+    How integers too big for a native type, like uint256 token amounts, are written.
+    """
+    # base 10 strings
+    STRING = 'string'
+    # decimal256 with no scale so they can be aggregated natively, values with more digits are nulled with an error
+    DECIMAL = 'decimal'
+
+
+class ArrowTableBuilder:
+    """
+    Builds Arrow tables from transformed rows with the types of the ABI schema, optionally encoding hash columns as
+    binary or dictionaries and big integers as decimals.
+    """
+
+    columns: List[DatasetColumn]
+    hash_encoding: HashEncoding
+    numeric_encoding: NumericEncoding
+    schema: pyarrow.Schema
+    # the size of each hash column being encoded
+    _hash_sizes: Dict[str, int]
+    # big integer columns being encoded as decimals
+    _decimal_columns: Set[str]
+
+    @staticmethod
+    def from_transformer(
+        transformer: SemanticTransformer,
+        hash_encoding: HashEncoding = HashEncoding.STRING,
+        numeric_encoding: NumericEncoding = NumericEncoding.STRING
+    ) -> ArrowTableBuilder:
+        return ArrowTableBuilder(transformer.schema.columns(), hash_encoding, numeric_encoding)
+
+    @staticmethod
+    def by_item(
+        transformer: SemanticTransformer,
+        hash_encoding: HashEncoding = HashEncoding.STRING,
+        numeric_encoding: NumericEncoding = NumericEncoding.STRING
+    ) -> Dict[str, ArrowTableBuilder]:
+        """
+        Builders for the rows of each primary item by signature from SemanticTransformer.transform_by_item.
+        """
+        return {
+            signature: ArrowTableBuilder(schema.columns(), hash_encoding, numeric_encoding)
+            for signature, schema in transformer.schema_by_item.items()
+        }
+
+    @staticmethod
+    def from_schema(
+        schema: AbiSchema,
+        hash_encoding: HashEncoding = HashEncoding.STRING,
+        numeric_encoding: NumericEncoding = NumericEncoding.STRING
+    ) -> ArrowTableBuilder:
+        return ArrowTableBuilder(schema.columns(), hash_encoding, numeric_encoding)
+
+    def __init__(
+        self,
+        columns: List[DatasetColumn],
+        hash_encoding: HashEncoding = HashEncoding.STRING,
+        numeric_encoding: NumericEncoding = NumericEncoding.STRING
+    ):
+        self.columns = columns
+        self.hash_encoding = hash_encoding
+        self.numeric_encoding = numeric_encoding
+
+        self._hash_sizes = {}
+        if hash_encoding != HashEncoding.STRING:
+            for column in columns:
+                hash_size = ArrowTableBuilder.hash_size(column)
+                if hash_size is not None:
+                    self._hash_sizes[column.name] = hash_size
+
+        self._decimal_columns = set()
+        if numeric_encoding == NumericEncoding.DECIMAL:
+            self._decimal_columns = {column.name for column in columns if ArrowTableBuilder.is_big_integer(column)}
+
+        self.schema = pyarrow.schema([(column.name, self._data_type(column)) for column in columns])
+
+    @staticmethod
+    def hash_size(column: DatasetColumn) -> Optional[int]:
+        """
+        Size in bytes of the hashes in the column if it's an address, transaction hash or block hash column.
+        """
+        while isinstance(column, RenamedColumn):
+            column = column.original_column
+
+        if not isinstance(column, StringDatasetColumn):
+            return None
+
+        return HASH_SIZES.get(column.higher_order_type)
+
+    @staticmethod
+    def is_big_integer(column: DatasetColumn) -> bool:
+        """
+        If the column holds integers coerced to strings since they're too big for a native type.
+        """
+        while isinstance(column, RenamedColumn):
+            column = column.original_column
+
+        return isinstance(column, CoercedNumericSilverColumn) and column.scale == 0
+
+    def build(self, rows: List[Dict[str, any]]) -> pyarrow.Table:
+        if len(self._hash_sizes) == 0 and len(self._decimal_columns) == 0:
+            return pyarrow.Table.from_pylist(rows, schema=self.schema)
+
+        # build with the types of the schema and then encode
+        table = pyarrow.Table.from_pylist(rows, schema=pyarrow.schema([
+            (column.name, column.data_type) for column in self.columns
+        ]))
+        for name, hash_size in self._hash_sizes.items():
+            i = table.schema.get_field_index(name)
+            encoded = self._encode(table.column(i).combine_chunks(), name, hash_size)
+            table = table.set_column(i, self.schema.field(name), encoded)
+
+        for name in self._decimal_columns:
+            table = self._encode_decimal(table, name)
+
+        return table
+
+    def union(self, tables: List[pyarrow.Table]) -> pyarrow.Table:
+        """
+        Concatenate tables built with the schemas of some of the columns, like those of each primary item, into one
+        with all the columns of this builder. Missing columns are null arrays so nothing is copied row by row.
+        """
+        unioned = []
+        for table in tables:
+            columns = [
+                table.column(field.name) if field.name in table.schema.names else pyarrow.nulls(len(table), field.type)
+                for field in self.schema
+            ]
+            unioned.append(pyarrow.Table.from_arrays(columns, schema=self.schema))
+
+        return pyarrow.concat_tables(unioned) if len(unioned) > 0 else self.schema.empty_table()
+
+    def _data_type(self, column: DatasetColumn) -> pyarrow.DataType:
+        if column.name in self._decimal_columns:
+            return DECIMAL_TYPE
+
+        if column.name not in self._hash_sizes:
+            return column.data_type
+
+        if self.hash_encoding == HashEncoding.BINARY:
+            value_type = pyarrow.binary(self._hash_sizes[column.name])
+        else:
+            value_type = pyarrow.dictionary(pyarrow.int32(), pyarrow.string())
+
+        return pyarrow.list_(value_type) if pyarrow.types.is_list(column.data_type) else value_type
+
+    def _encode(self, array: pyarrow.Array, name: str, hash_size: int) -> pyarrow.Array:
+        if pyarrow.types.is_list(array.type):
+            return pyarrow.ListArray.from_arrays(
+                array.offsets, self._encode(array.values, name, hash_size), mask=array.is_null()
+            )
+
+        if self.hash_encoding == HashEncoding.DICTIONARY:
+            return array.dictionary_encode()
+
+        # hashes repeat a lot so only decode each distinct one
+        decoded: Dict[str, bytes] = {}
+        values: List[Optional[bytes]] = []
+        for value in array.to_pylist():
+            if value is None:
+                values.append(None)
+                continue
+
+            value_bytes = decoded.get(value)
+            if value_bytes is None:
+                if len(value) != 2 + 2 * hash_size or not value.startswith('0x'):
+                    raise Exception(f'Value \'{value}\' of column \'{name}\' is not a {hash_size} byte hash.')
+                value_bytes = decoded[value] = bytes.fromhex(value[2:])
+            values.append(value_bytes)
+
+        return pyarrow.array(values, pyarrow.binary(hash_size))
+
+    def _encode_decimal(self, table: pyarrow.Table, name: str) -> pyarrow.Table:
+        """
+        Cast a column of integer strings to decimals all at once, nulling any with too many digits and adding an error
+        for the row instead of failing the whole table.
+        """
+        array = table.column(name).combine_chunks()
+        overflow = pc.fill_null(pc.greater(pc.utf8_length(pc.utf8_ltrim(array, '-')), DECIMAL_PRECISION), False)
+
+        overflow_i = pc.indices_nonzero(overflow).to_pylist()
+        if len(overflow_i) > 0:
+            if TRANSFORM_ERROR_COLUMN.name not in table.schema.names:
+                raise Exception(f'Value \'{array[overflow_i[0]].as_py()}\' of column \'{name}\' overflows {DECIMAL_TYPE}.')
+
+            errors = table.column(TRANSFORM_ERROR_COLUMN.name).to_pylist()
+            for i in overflow_i:
+                error = f'Value \'{array[i].as_py()}\' of column \'{name}\' overflows {DECIMAL_TYPE}.'
+                errors[i] = error if errors[i] is None else f'{errors[i]},{error}'
+            table = table.set_column(
+                table.schema.get_field_index(TRANSFORM_ERROR_COLUMN.name),
+                table.schema.field(TRANSFORM_ERROR_COLUMN.name),
+                pyarrow.array(errors, pyarrow.string())
+            )
+
+            array = pc.if_else(overflow, pyarrow.scalar(None, pyarrow.string()), array)
+
+        return table.set_column(table.schema.get_field_index(name), self.schema.field(name), array.cast(DECIMAL_TYPE))
@@ -0,0 +1,254 @@
+from __future__ import annotations
+
+import inspect
+import os
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Tuple
+
+import pyarrow.parquet as pq
+
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.common.column.DatasetColumn import DatasetColumn
+from semanticabi.common.column.StringDatasetColumn import StringType
+from semanticabi.common.column.NumericDatasetColumn import NumericType
+from semanticabi.sink.ArrowTableBuilder import ArrowTableBuilder, HashEncoding, NumericEncoding
+from semanticabi.steps.AbiSchema import AbiSchema
+
+# columns used to partition, the chain is in the path so is dropped from the files
+CHAIN_COLUMN = 'chain'
+TIMESTAMP_COLUMN = 'blockTimestamp'
+SORT_COLUMN = 'blockNumber'
+
+# high cardinality columns commonly filtered on with equality
+BLOOM_FILTER_TYPES = {StringType.ADDRESS_HASH.code, StringType.TRANSACTION_HASH.code}
+DICTIONARY_TYPES = {StringType.ENUM.code, NumericType.ENUM.code}
+
+# bloom filters, page indexes and sorting metadata were added to the writer in later versions of pyarrow than the
+# oldest supported
+_WRITER_PARAMETERS = inspect.signature(pq.ParquetWriter.__init__).parameters
+SUPPORTS_BLOOM_FILTERS = 'bloom_filter_options' in _WRITER_PARAMETERS
+SUPPORTS_PAGE_INDEX = 'write_page_index' in _WRITER_PARAMETERS
+SUPPORTS_SORTING_COLUMNS = 'sorting_columns' in _WRITER_PARAMETERS and hasattr(pq, 'SortingColumn')
+
+Partition = Tuple[str, str]
+
+
+@dataclass
+class _PartitionWriter:
+    """
+    Buffered rows and the currently open file for a partition.
+    """
+    directory: str
+    rows: List[Dict[str, any]] = field(default_factory=list)
+    writer: Optional[pq.ParquetWriter] = None
+    path: Optional[str] = None
+    rows_in_file: int = 0
+    files: int = 0
+
+
+class ParquetSink:
+    """
+    Writes transformed rows to Parquet partitioned by chain and block date with "chain=<chain>/date=<yyyy-mm-dd>"
+    directories. Encodings are picked from the column types: dictionaries for enums, bloom filters for addresses and
+    transaction hashes, and delta encoding with sorting metadata for block numbers so readers can skip row groups.
+    Hashes can also be written as fixed size binary or dictionaries with the hash encoding, and big integers as decimals
+    with the numeric encoding.
+
+    Files are written to a temporary name and renamed once closed so partial files are never visible. If the sink is
+    exited with an exception, files still being written are deleted instead. Each file prefix must have a single writer,
+    files left by an earlier run with the same prefix are refused rather than overwritten, but two sinks writing the
+    same prefix at once would race, which the random default prefix avoids.
+    """
+
+    _root: str
+    _schema: AbiSchema
+    _table_builder: ArrowTableBuilder
+    _row_group_size: int
+    _max_rows_per_file: int
+    _compression: str
+    _file_prefix: str
+    _writer_options: Dict[str, any]
+
+    _partitions: Dict[Partition, _PartitionWriter]
+    _written: List[str]
+
+    @staticmethod
+    def from_transformer(root: str, transformer: SemanticTransformer, **kwargs) -> ParquetSink:
+        return ParquetSink(root, transformer.schema, **kwargs)
+
+    def __init__(
+        self,
+        root: str,
+        schema: AbiSchema,
+        *,
+        # rows buffered before writing a row group, bigger groups compress and scan better but use more memory
+        row_group_size: int = 128 * 1024,
+        # roll over to a new file after this many rows
+        max_rows_per_file: int = 1024 * 1024,
+        compression: str = 'zstd',
+        # name of files which will be suffixed with a sequence number per partition, defaults to a random one so runs
+        # and sinks writing to the same root don't collide
+        file_prefix: Optional[str] = None,
+        bloom_filter_fpp: float = 0.01,
+        hash_encoding: HashEncoding = HashEncoding.STRING,
+        numeric_encoding: NumericEncoding = NumericEncoding.STRING
+    ):
+        self._root = root
+        self._schema = schema
+        self._row_group_size = row_group_size
+        self._max_rows_per_file = max_rows_per_file
+        self._compression = compression
+        self._file_prefix = f'part-{uuid.uuid4().hex}' if file_prefix is None else file_prefix
+
+        columns = [column for column in schema.columns() if column.name != CHAIN_COLUMN]
+        self._table_builder = ArrowTableBuilder(columns, hash_encoding, numeric_encoding)
+        self._writer_options = ParquetSink._writer_options(columns, row_group_size, bloom_filter_fpp)
+
+        self._partitions = {}
+        self._written = []
+
+    @staticmethod
+    def _writer_options(columns: List[DatasetColumn], row_group_size: int, bloom_filter_fpp: float) -> Dict[str, any]:
+        """
+        Encoding options for the parquet writer from the column types.
+        """
+        higher_order_types = {column.name: column.extended_metadata.get('higherOrderType') for column in columns}
+        column_names = [column.name for column in columns]
+
+        options = {
+            'use_dictionary': [name for name, code in higher_order_types.items() if code in DICTIONARY_TYPES]
+        }
+        if SUPPORTS_PAGE_INDEX:
+            # page indexes allow skipping pages within a row group using the block number stats
+            options['write_page_index'] = True
+
+        if SORT_COLUMN in column_names:
+            options['column_encoding'] = {SORT_COLUMN: 'DELTA_BINARY_PACKED'}
+            if SUPPORTS_SORTING_COLUMNS:
+                options['sorting_columns'] = [pq.SortingColumn(column_names.index(SORT_COLUMN))]
+
+        if SUPPORTS_BLOOM_FILTERS:
+            bloom_filter_columns = [name for name, code in higher_order_types.items() if code in BLOOM_FILTER_TYPES]
+            if len(bloom_filter_columns) > 0:
+                options['bloom_filter_options'] = {
+                    name: {'ndv': row_group_size, 'fpp': bloom_filter_fpp} for name in bloom_filter_columns
+                }
+
+        return options
+
+    def __enter__(self) -> ParquetSink:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    @property
+    def written(self) -> List[str]:
+        """
+        Paths of all files that have been completely written.
+        """
+        return self._written
+
+    def write(self, rows: List[Dict[str, any]]):
+        """
+        Buffer rows into their partitions, writing out row groups once big enough.
+        """
+        for row in rows:
+            partition = ParquetSink.partition(row)
+            if partition not in self._partitions:
+                self._partitions[partition] = _PartitionWriter(os.path.join(
+                    self._root, f'chain={partition[0]}', f'date={partition[1]}'
+                ))
+
+            partition_writer = self._partitions[partition]
+            partition_writer.rows.append(row)
+            if len(partition_writer.rows) >= self._row_group_size:
+                self._flush(partition_writer)
+
+    def close(self):
+        """
+        Write out all buffered rows and close any open files.
+        """
+        for partition_writer in self._partitions.values():
+            self._flush(partition_writer)
+            self._close_file(partition_writer)
+
+        self._partitions = {}
+
+    def abort(self):
+        """
+        Drop all buffered rows and delete any files still being written, leaving only those completely written.
+        """
+        for partition_writer in self._partitions.values():
+            if partition_writer.writer is not None:
+                partition_writer.writer.close()
+                os.remove(ParquetSink._temp_path(partition_writer.path))
+
+        self._partitions = {}
+
+    @staticmethod
+    def partition(row: Dict[str, any]) -> Partition:
+        timestamp = row[TIMESTAMP_COLUMN]
+        if not isinstance(timestamp, datetime):
+            timestamp = datetime.fromtimestamp(timestamp, tz=timezone.utc)
+
+        return row[CHAIN_COLUMN], timestamp.date().isoformat()
+
+    def _flush(self, partition_writer: _PartitionWriter):
+        rows = partition_writer.rows
+        partition_writer.rows = []
+
+        while len(rows) > 0:
+            if partition_writer.writer is None:
+                self._open_file(partition_writer)
+
+            # fill up the current file before rolling over
+            count = min(len(rows), self._max_rows_per_file - partition_writer.rows_in_file)
+            table = self._table_builder.build(rows[:count])
+            if SORT_COLUMN in table.schema.names:
+                table = table.sort_by(SORT_COLUMN)
+
+            partition_writer.writer.write_table(table, row_group_size=self._row_group_size)
+            partition_writer.rows_in_file += count
+            rows = rows[count:]
+
+            if partition_writer.rows_in_file >= self._max_rows_per_file:
+                self._close_file(partition_writer)
+
+    def _open_file(self, partition_writer: _PartitionWriter):
+        os.makedirs(partition_writer.directory, exist_ok=True)
+        partition_writer.path = os.path.join(
+            partition_writer.directory, f'{self._file_prefix}-{partition_writer.files:05d}.parquet'
+        )
+        # left by an earlier run, only a single writer per prefix so nothing can create it before the rename
+        if os.path.exists(partition_writer.path):
+            raise FileExistsError(f'Parquet file {partition_writer.path} already exists.')
+        partition_writer.writer = pq.ParquetWriter(
+            ParquetSink._temp_path(partition_writer.path),
+            self._table_builder.schema,
+            compression=self._compression,
+            **self._writer_options
+        )
+
+    def _close_file(self, partition_writer: _PartitionWriter):
+        if partition_writer.writer is None:
+            return
+
+        partition_writer.writer.close()
+        os.replace(ParquetSink._temp_path(partition_writer.path), partition_writer.path)
+        self._written.append(partition_writer.path)
+
+        partition_writer.writer = None
+        partition_writer.path = None
+        partition_writer.rows_in_file = 0
+        partition_writer.files += 1
+
+    @staticmethod
+    def _temp_path(path: str) -> str:
+        directory, name = os.path.split(path)
+        return os.path.join(directory, f'.{name}.tmp')
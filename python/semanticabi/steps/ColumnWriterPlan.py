@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from enum import Enum
+from typing import List, Dict, Optional, Tuple, TYPE_CHECKING
+
+from semanticabi.common.column.DatasetColumn import DatasetColumn
+from semanticabi.common.column.StringDatasetColumn import StringType
+from semanticabi.steps.AbiSchema import AbiSchema
+
+if TYPE_CHECKING:
+    from semanticabi.steps.Step import TransformItem
+
+"""
+Doing this as a NONE type rather than SYSTEM so that it can't get accidentally get dropped later. We break up the
+handling of transform error into two parts, where the base Step class manages catching any errors and recording them
+for later, and then only writes out the errors if the schema includes this column, which is done by including the
+TransformErrorStep in the pipeline.
+"""
+TRANSFORM_ERROR_COLUMN = StringType.NONE('transform_error')
+
+
+class ColumnWrite(Enum):
+    """
+    How the value of a column in a final row is written.
+    """
+    # value from the row as is
+    COPY = 'copy'
+    # value from the column's transform which could fail
+    TRANSFORM = 'transform'
+    # errors of the item
+    ERROR = 'error'
+    # column only in another pipeline
+    PAD = 'pad'
+
+
+class ColumnWriterPlan:
+    """
+    Compiled from a schema once so building each final row is a single pass over the columns without checking the
+    type of each one. Columns of an optional union schema that aren't in the schema are padded with None, as are
+    columns whose transform fails so every row has every column of the schema.
+    """
+
+    _writes: List[Tuple[str, ColumnWrite, Optional[DatasetColumn]]]
+
+    def __init__(self, schema: AbiSchema, union_schema: Optional[AbiSchema] = None):
+        self._writes = [(column.name, ColumnWriterPlan._write(column), column) for column in schema.columns()]
+        if union_schema is not None:
+            self._writes += [
+                (column.name, ColumnWrite.PAD, None)
+                for column in union_schema.columns() if not schema.has_column(column.name)
+            ]
+
+    @staticmethod
+    def _write(column: DatasetColumn) -> ColumnWrite:
+        if column.name == TRANSFORM_ERROR_COLUMN.name:
+            return ColumnWrite.ERROR
+        elif column.transform_f is None and type(column).post_transform_value is DatasetColumn.post_transform_value:
+            return ColumnWrite.COPY
+        else:
+            return ColumnWrite.TRANSFORM
+
+    def write(self, item: TransformItem, row: Dict[str, any]) -> Dict[str, any]:
+        final_row: Dict[str, any] = {}
+        for name, write, column in self._writes:
+            if write is ColumnWrite.COPY:
+                final_row[name] = row.get(name)
+            elif write is ColumnWrite.TRANSFORM:
+                try:
+                    # Do any final column type transformation
+                    final_row[name] = column.transform(row)
+                except Exception as e:
+                    # Continue with the rest of the row, recording the error for the transform error column
+                    final_row[name] = None
+                    item.add_transform_error(str(e))
+            elif write is ColumnWrite.ERROR:
+                final_row[name] = item.transform_error
+            else:
+                final_row[name] = None
+
+        return final_row
@@ -3,25 +3,25 @@ from typing import List, Tuple, Dict, Callable
 from semanticabi.common.column.HexToFloat import HexToFloat
 from semanticabi.common.ValueConverter import ValueConverter
 from semanticabi.common.column.DatasetColumn import DatasetColumn
-from semanticabi.common.column.HexNormalize import HexNormalize
 from semanticabi.common.column.NumericDatasetColumn import NumericDatasetColumn, NumericType
 from semanticabi.common.column.StringDatasetColumn import StringType
 from semanticabi.common.column.TimestampDatasetColumn import TimestampDatasetColumn
 from semanticabi.metadata.EthBlock import EthBlock
 from semanticabi.metadata.EthTransaction import EthTransaction
 from semanticabi.steps.AbiSchema import AbiSchema
+from semanticabi.steps.Projection import Projection
 from semanticabi.steps.Step import Step, TransformItem
 from semanticabi.steps.SubsequentStep import SubsequentStep
 
 DEFAULT_COLUMNS: List[Tuple[DatasetColumn, Callable[[EthBlock, EthTransaction, TransformItem], any]]] = [
     (StringType.ENUM('chain'), lambda block, transaction, result_item: block.chain.value),
-    (StringType.BLOCK_HASH('blockHash'), lambda block, transaction, result_item: HexNormalize.normalize(block.block['hash'])),
+    (StringType.BLOCK_HASH('blockHash'), lambda block, transaction, result_item: block.hex_interner.normalize(block.block['hash'])),
     (NumericDatasetColumn.uint32('blockNumber', higher_order_type=NumericType.INDEX), lambda block, transaction, result_item: ValueConverter.hex_to_int(block.number)),
     (TimestampDatasetColumn.timestamp('blockTimestamp', is_time_sort_column=True), lambda block, transaction, result_item: ValueConverter.hex_to_int(block.timestamp)),
-    (StringType.TRANSACTION_HASH('transactionHash'), lambda block, transaction, result_item: HexNormalize.normalize(transaction.hash)),
-    (StringType.ADDRESS_HASH('transactionFrom'), lambda block, transaction, result_item: HexNormalize.normalize(transaction.from_address)),
-    (StringType.ADDRESS_HASH('transactionTo'), lambda block, transaction, result_item: HexNormalize.normalize(transaction.to_address)),
-    (StringType.ADDRESS_HASH('contractAddress'), lambda block, transaction, result_item: HexNormalize.normalize(result_item.contract_address)),
+    (StringType.TRANSACTION_HASH('transactionHash'), lambda block, transaction, result_item: block.hex_interner.normalize(transaction.hash)),
+    (StringType.ADDRESS_HASH('transactionFrom'), lambda block, transaction, result_item: block.hex_interner.normalize(transaction.from_address)),
+    (StringType.ADDRESS_HASH('transactionTo'), lambda block, transaction, result_item: block.hex_interner.normalize(transaction.to_address)),
+    (StringType.ADDRESS_HASH('contractAddress'), lambda block, transaction, result_item: block.hex_interner.normalize(result_item.contract_address)),
     (NumericDatasetColumn.uint8('status', higher_order_type=NumericType.ENUM), lambda block, transaction, result_item: ValueConverter.hex_to_int(transaction.receipt['status'])),
     (NumericDatasetColumn.float64('gasUsed', higher_order_type=NumericType.CURRENCY), lambda block, transaction, result_item: HexToFloat.convert(transaction.receipt['gasUsed'])),
     (StringType.ENUM('itemType'), lambda block, transaction, result_item: result_item.item_type),
@@ -37,15 +37,32 @@ class DefaultColumnsStep(SubsequentStep):
     """
 
     _schema: AbiSchema
+    _default_columns: List[Tuple[DatasetColumn, Callable[[EthBlock, EthTransaction, TransformItem], any]]]
 
     def __init__(self, previous_step: Step):
         super().__init__(previous_step)
         self._schema = previous_step.schema.with_columns([el[0] for el in DEFAULT_COLUMNS])
+        self._default_columns = DEFAULT_COLUMNS
 
     @property
     def schema(self) -> AbiSchema:
         return self._schema
 
+    def project(self, projection: Projection) -> None:
+        self._default_columns = [el for el in DEFAULT_COLUMNS if el[0].name in projection.columns]
+        self._previous_step.project(projection.without_columns({el[0].name for el in DEFAULT_COLUMNS}))
+
+    def __getstate__(self) -> Dict[str, any]:
+        # extractors are lambdas so only pickle the names of the default columns being added
+        state = self.__dict__.copy()
+        state['_default_columns'] = [column.name for column, _ in self._default_columns]
+        return state
+
+    def __setstate__(self, state: Dict[str, any]):
+        names = set(state['_default_columns'])
+        self.__dict__.update(state)
+        self._default_columns = [el for el in DEFAULT_COLUMNS if el[0].name in names]
+
     def _inner_transform_item(
         self,
         block: EthBlock,
@@ -56,7 +73,7 @@ class DefaultColumnsStep(SubsequentStep):
         new_data: List[Dict[str, any]] = []
         for row in previous_data:
             # Add the default columns to the existing data
-            for column, extractor_fn in DEFAULT_COLUMNS:
+            for column, extractor_fn in self._default_columns:
                 row[column.name] = extractor_fn(block, transaction, item)
 
             new_data.append(row)
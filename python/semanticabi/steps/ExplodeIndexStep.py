@@ -5,6 +5,7 @@ from semanticabi.common.column.NumericDatasetColumn import NumericDatasetColumn
 from semanticabi.metadata.EthBlock import EthBlock
 from semanticabi.metadata.EthTransaction import EthTransaction
 from semanticabi.steps.AbiSchema import AbiSchema
+from semanticabi.steps.Projection import Projection
 from semanticabi.steps.Step import Step, TransformItem
 from semanticabi.steps.SubsequentStep import SubsequentStep
 
@@ -17,15 +18,24 @@ class ExplodeIndexStep(SubsequentStep):
     After the Explode and Match steps, adds a unique index for each row of exploded or "many" matched data
     """
     _schema: AbiSchema
+    _include_index: bool
 
     def __init__(self, previous_step: Step):
         super().__init__(previous_step)
         self._schema = previous_step.schema.with_columns([_EXPLODE_INDEX_COLUMN])
+        self._include_index = True
 
     @property
     def schema(self) -> AbiSchema:
         return self._schema
 
+    def _should_transform(self):
+        return self._include_index
+
+    def project(self, projection: Projection) -> None:
+        self._include_index = _EXPLODE_INDEX_COLUMN.name in projection.columns
+        self._previous_step.project(projection.without_columns({_EXPLODE_INDEX_COLUMN.name}))
+
     def _inner_transform_item(
         self,
         block: EthBlock,
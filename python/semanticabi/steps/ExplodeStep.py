@@ -8,6 +8,7 @@ from semanticabi.metadata.EthTransaction import EthTransaction
 from semanticabi.steps.AbiSchema import AbiSchema
 from semanticabi.steps.FlattenedParameter import FlattenedParameter
 from semanticabi.steps.ParameterFlattener import FlattenPredicate, ParameterFlattener
+from semanticabi.steps.Projection import Projection
 from semanticabi.steps.Step import Step, TransformItem
 from semanticabi.steps.SubsequentStep import SubsequentStep
 
@@ -50,6 +51,8 @@ class ExplodeStep(SubsequentStep):
     """
     _parameter_flattener: ParameterFlattener
     _schema: AbiSchema
+    # the exploded parameters to produce, all unless projected
+    _parameters: List[FlattenedParameter]
 
     def __init__(self, previous_step: Step):
         super().__init__(previous_step)
@@ -58,6 +61,7 @@ class ExplodeStep(SubsequentStep):
             explode_path_parts = previous_step._abi_item.properties.explode.path_parts
         self._parameter_flattener = ParameterFlattener(self._previous_step._abi_item, ExplodeFlattenPredicate(explode_path_parts))
         self._schema = self._previous_step.schema.with_columns(self._parameter_flattener.dataset_columns())
+        self._parameters = self._parameter_flattener.parameter_list()
 
     @property
     def schema(self) -> AbiSchema:
@@ -66,6 +70,19 @@ class ExplodeStep(SubsequentStep):
     def _should_transform(self):
         return self._abi_item.properties.explode is not None
 
+    def project(self, projection: Projection) -> None:
+        parameters = self._parameter_flattener.parameter_list()
+        self._parameters = [parameter for parameter in parameters if parameter.final_column_name in projection.columns]
+        if len(self._parameters) == 0 and len(parameters) > 0:
+            # still need an exploded parameter for the number of rows
+            self._parameters = parameters[:1]
+
+        self._previous_step.project(
+            projection
+            .without_columns({parameter.final_column_name for parameter in parameters})
+            .with_parameters({parameter.top_level_name for parameter in self._parameters})
+        )
+
     def _inner_transform_item(
         self,
         block: EthBlock,
@@ -80,13 +97,13 @@ class ExplodeStep(SubsequentStep):
             raise TransformException('Can only explode a single row of data')
 
         new_data: List[Dict[str, any]] = []
-        flattened_parameters: List[FlattenedParameter] = self._parameter_flattener.parameter_list()
+        flattened_parameters: List[FlattenedParameter] = self._parameters
         for row in previous_data:
             flattened_arrays: List[List[str]] = []
             array_length: Optional[int] = None
             # Get the flattened array of values for each parameter
             for parameter in flattened_parameters:
-                flattened_array: List[any] = parameter.flattened_array(decoded_result)
+                flattened_array: List[any] = parameter.flattened_array(decoded_result, block.hex_interner)
 
                 if array_length is None:
                     array_length = len(flattened_array)
@@ -96,12 +113,14 @@ class ExplodeStep(SubsequentStep):
 
                 flattened_arrays.append(flattened_array)
 
-            # Zip the flattened arrays into tuples that get turned into rows
-            for zipped_data in zip(*flattened_arrays):
-                new_data_map = row.copy()
-                for index, param_value in enumerate(zipped_data):
-                    new_data_map[flattened_parameters[index].final_column_name] = param_value
+            # Repeat the row for each element and fill in each exploded column at a time instead of zipping them into
+            # tuples for every row
+            exploded_rows: List[Dict[str, any]] = [row.copy() for _ in range(array_length or 0)]
+            for parameter, flattened_array in zip(flattened_parameters, flattened_arrays):
+                column_name: str = parameter.final_column_name
+                for exploded_row, param_value in zip(exploded_rows, flattened_array):
+                    exploded_row[column_name] = param_value
 
-                new_data.append(new_data_map)
+            new_data.extend(exploded_rows)
 
         return new_data
@@ -1,10 +1,11 @@
 from typing import List, Dict, Set
 
 from semanticabi.abi.InvalidAbiException import InvalidAbiException
-from semanticabi.abi.item.Expressions import Expressions
+from semanticabi.abi.item.Expressions import Expression, Expressions
 from semanticabi.metadata.EthBlock import EthBlock
 from semanticabi.metadata.EthTransaction import EthTransaction
 from semanticabi.steps.AbiSchema import AbiSchema
+from semanticabi.steps.Projection import Projection
 from semanticabi.steps.Step import Step, TransformItem
 from semanticabi.steps.SubsequentStep import SubsequentStep
 
@@ -16,11 +17,14 @@ class ExpressionListStep(SubsequentStep):
 
     _expressions: Expressions
     _schema: AbiSchema
+    # the expressions to evaluate, all unless projected
+    _evaluated: List[Expression]
 
     def __init__(self, previous_step: Step, expressions: Expressions):
         super().__init__(previous_step)
         self._expressions = expressions
         self._schema = ExpressionListStep._build_schema(previous_step.schema, expressions)
+        self._evaluated = expressions.expressions
 
     @staticmethod
     def _build_schema(previous_schema: AbiSchema, expressions: Expressions) -> AbiSchema:
@@ -47,7 +51,21 @@ class ExpressionListStep(SubsequentStep):
         return self._schema
 
     def _should_transform(self):
-        return len(self._expressions.expressions) > 0
+        return len(self._evaluated) > 0
+
+    def project(self, projection: Projection) -> None:
+        # expressions can reference earlier ones so work backwards from the last
+        columns: Set[str] = set(projection.columns)
+        evaluated: List[Expression] = []
+        for expression in reversed(self._expressions.expressions):
+            if expression.name in columns:
+                evaluated.insert(0, expression)
+                columns.discard(expression.name)
+                # includes the previous value if the expression overwrites a column using it
+                columns |= expression.column_names()
+
+        self._evaluated = evaluated
+        self._previous_step.project(Projection(columns, projection.parameters))
 
     def _inner_transform_item(
         self,
@@ -58,7 +76,7 @@ class ExpressionListStep(SubsequentStep):
     ) -> List[Dict[str, any]]:
         new_data: List[Dict[str, any]] = []
         for row in previous_data:
-            for expression in self._expressions.expressions:
+            for expression in self._evaluated:
                 # Make sure we pass in the updated row to evaluate the next expression
                 row[expression.name] = expression.evaluate(row)
 
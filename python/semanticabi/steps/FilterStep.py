@@ -0,0 +1,46 @@
+from typing import List, Dict, Tuple
+
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EthTransaction import EthTransaction
+from semanticabi.steps.AbiSchema import AbiSchema
+from semanticabi.steps.Projection import Projection
+from semanticabi.steps.RowFilter import RowFilter
+from semanticabi.steps.Step import Step, TransformItem
+from semanticabi.steps.SubsequentStep import SubsequentStep
+
+
+class FilterStep(SubsequentStep):
+    """
+    Drops rows that don't match all of the filters, along with any items left without rows so later steps don't run for
+    them at all. Filters are typed for the columns of the previous step, any of other pipelines never match. Items that
+    already failed to transform are kept as is with their error since their rows don't have the values to compare.
+    """
+
+    _filters: List[RowFilter]
+
+    def __init__(self, previous_step: Step, filters: List[RowFilter]):
+        super().__init__(previous_step)
+        schema = previous_step.schema
+        self._filters = [
+            row_filter.for_column(schema.column(row_filter.column)) if schema.has_column(row_filter.column) else row_filter
+            for row_filter in filters
+        ]
+
+    @property
+    def schema(self) -> AbiSchema:
+        return self._previous_step.schema
+
+    def project(self, projection: Projection) -> None:
+        self._previous_step.project(projection.with_columns({row_filter.column for row_filter in self._filters}))
+
+    def _inner_transform(self, block: EthBlock, transaction: EthTransaction) -> List[Tuple[TransformItem, List[Dict[str, any]]]]:
+        return [(item, rows) for item, rows in super()._inner_transform(block, transaction) if len(rows) > 0]
+
+    def _inner_transform_item(
+        self,
+        block: EthBlock,
+        transaction: EthTransaction,
+        item: TransformItem,
+        previous_data: List[Dict[str, any]]
+    ) -> List[Dict[str, any]]:
+        return [row for row in previous_data if all(row_filter.matches(row) for row_filter in self._filters)]
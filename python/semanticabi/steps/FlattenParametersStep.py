@@ -4,7 +4,9 @@ from semanticabi.abi.item.SemanticAbiItem import DecodedResult
 from semanticabi.metadata.EthBlock import EthBlock
 from semanticabi.metadata.EthTransaction import EthTransaction
 from semanticabi.steps.AbiSchema import AbiSchema
+from semanticabi.steps.FlattenedParameter import FlattenedParameter
 from semanticabi.steps.ParameterFlattener import ParameterFlattener
+from semanticabi.steps.Projection import Projection
 from semanticabi.steps.Step import Step, TransformItem
 from semanticabi.steps.SubsequentStep import SubsequentStep
 
@@ -16,16 +18,28 @@ class FlattenParametersStep(SubsequentStep):
 
     _parameter_flattener: ParameterFlattener
     _schema: AbiSchema
+    # the flattened parameters to produce, all unless projected
+    _parameters: List[FlattenedParameter]
 
     def __init__(self, previous_step: Step):
         super().__init__(previous_step)
         self._parameter_flattener = ParameterFlattener(self._previous_step._abi_item)
         self._schema = self._previous_step.schema.with_columns(self._parameter_flattener.dataset_columns())
+        self._parameters = self._parameter_flattener.parameter_list()
 
     @property
     def schema(self) -> AbiSchema:
         return self._schema
 
+    def project(self, projection: Projection) -> None:
+        parameters = self._parameter_flattener.parameter_list()
+        self._parameters = [parameter for parameter in parameters if parameter.final_column_name in projection.columns]
+        self._previous_step.project(
+            projection
+            .without_columns({parameter.final_column_name for parameter in parameters})
+            .with_parameters({parameter.top_level_name for parameter in self._parameters})
+        )
+
     def _inner_transform_item(
         self,
         block: EthBlock,
@@ -37,8 +51,8 @@ class FlattenParametersStep(SubsequentStep):
 
         new_data: List[Dict[str, any]] = []
         for row in previous_data:
-            for parameter in self._parameter_flattener.parameter_list():
-                row[parameter.final_column_name] = parameter.flattened_value(decoded_result)
+            for parameter in self._parameters:
+                row[parameter.final_column_name] = parameter.flattened_value(decoded_result, block.hex_interner)
 
             new_data.append(row)
 
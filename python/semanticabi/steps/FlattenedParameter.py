@@ -1,10 +1,12 @@
 from dataclasses import dataclass
+from enum import Enum
 from functools import cached_property
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from semanticabi.abi.item.Parameter import PrimitiveParameter, Parameter
 from semanticabi.abi.item.SemanticAbiItem import DecodedResult
 from semanticabi.abi.item.SemanticParameter import SemanticParameter
+from semanticabi.common.HexInterner import HexInterner
 from semanticabi.common.TransformException import TransformException
 from semanticabi.common.ValueConverter import ValueConverter
 from semanticabi.common.column.BooleanDatasetColumn import BooleanDatasetColumn
@@ -14,6 +16,14 @@ from semanticabi.common.column.NumericDatasetColumn import NumericDatasetColumn
 from semanticabi.common.column.StringDatasetColumn import StringType
 
 
+class _ValueType(Enum):
+    """
+    Conversions of raw decoded values by the type of parameter
+    """
+    INT = 'int'
+    ADDRESS = 'address'
+
+
 @dataclass
 class FlattenedParameter:
 
@@ -37,6 +47,13 @@ class FlattenedParameter:
         else:
             return self.semantic_parameter.transform.name
 
+    @property
+    def top_level_name(self) -> str:
+        """
+        Name of the input or output parameter this is, or is nested in
+        """
+        return self.path[0].name if len(self.path) > 0 else self.semantic_parameter.name
+
     @cached_property
     def final_dataset_column(self) -> DatasetColumn:
         """
@@ -50,9 +67,10 @@ class FlattenedParameter:
         else:
             return self.semantic_parameter.transform.type.dataset_column(column_name, raw_column.transform_f)
 
-    def flattened_value(self, decoded_result: DecodedResult) -> any:
+    def flattened_value(self, decoded_result: DecodedResult, interner: Optional[HexInterner] = None) -> any:
         """
-        Get the decoded and transformed parameter value for this flattened parameter
+        Get the decoded and transformed parameter value for this flattened parameter, normalizing addresses with the
+        interner if given
         """
         full_path = self.path + [self.semantic_parameter]
         # First get the raw decoded value
@@ -62,13 +80,13 @@ class FlattenedParameter:
             value = self._navigate_path(full_path, decoded_result.decoded_output_json)
 
         if value is None:
-            raise TransformException(f'Could not find value at path {full_path}')
+            raise TransformException(f'Could not find value at path {".".join(param.name for param in full_path)}')
 
-        return self._apply_transforms(value)
+        return self._apply_transforms(value, interner)
 
-    def flattened_array(self, decoded_result: DecodedResult) -> List[any]:
+    def flattened_array(self, decoded_result: DecodedResult, interner: Optional[HexInterner] = None) -> List[any]:
         """
-        Get the decoded and transformed array values for this flattened parameter
+        Get the decoded and transformed array values for this flattened parameter, converting them a column at a time
         """
         full_path = self.path + [self.semantic_parameter]
         # First get the raw decoded value
@@ -78,9 +96,17 @@ class FlattenedParameter:
             value = self._navigate_array_path(full_path, decoded_result.decoded_output_json)
 
         if value is None:
-            raise TransformException(f'Could not find value at path {full_path}')
+            raise TransformException(f'Could not find value at path {".".join(param.name for param in full_path)}')
+
+        if self._value_type == _ValueType.INT:
+            value = list(map(ValueConverter.hex_to_int, value))
+        elif self._value_type == _ValueType.ADDRESS:
+            value = list(map(HexNormalize.normalize if interner is None else interner.normalize, value))
 
-        return [self._apply_transforms(v) for v in value]
+        if self.semantic_parameter.transform is not None:
+            value = list(map(self.semantic_parameter.transform.evaluate_expression, value))
+
+        return value
 
     @staticmethod
     def build_column(parameter: Parameter, column_name: str) -> DatasetColumn:
@@ -145,13 +171,25 @@ class FlattenedParameter:
             # TODO: support fixed and ufixed
             raise Exception(f'Unsupported primitive type {primitive_type} for parameter {parameter.name}')
 
-    def _apply_transforms(self, value: any) -> any:
+    @cached_property
+    def _value_type(self) -> Optional[_ValueType]:
+        """
+        How raw decoded values of the parameter are converted, only determined once instead of for every value
+        """
         primitive_type: str = self.semantic_parameter.parameter.signature
         if primitive_type.startswith('int') or primitive_type.startswith('uint'):
-            value = ValueConverter.hex_to_int(value)
+            return _ValueType.INT
         elif primitive_type.startswith('address'):
+            return _ValueType.ADDRESS
+
+        return None
+
+    def _apply_transforms(self, value: any, interner: Optional[HexInterner] = None) -> any:
+        if self._value_type == _ValueType.INT:
+            value = ValueConverter.hex_to_int(value)
+        elif self._value_type == _ValueType.ADDRESS:
             # Make sure all addresses get normalized before they might happen to get used in a match
-            value = HexNormalize.normalize(value)
+            value = HexNormalize.normalize(value) if interner is None else interner.normalize(value)
 
         # Finally evaluate any expression transformations
         if self.semantic_parameter.transform is not None:
@@ -190,5 +228,19 @@ class FlattenedParameter:
 
             json = json[param.name]
 
-        # Then navigate through each array item the rest of the way
-        return [FlattenedParameter._navigate_path(full_path[array_param_index + 1:], value) for value in json]
+        # Then pluck the rest of the way out of each array item, with the names resolved once for the whole array
+        names: Tuple[str, ...] = tuple(param.name for param in full_path[array_param_index + 1:])
+        return [FlattenedParameter._pluck(names, value) for value in json]
+
+    @staticmethod
+    def _pluck(names: Tuple[str, ...], json: Dict[str, any]) -> Optional[any]:
+        """
+        Same as _navigate_path with the names of the parameters along the path
+        """
+        for name in names:
+            if name not in json:
+                return None
+
+            json = json[name]
+
+        return json
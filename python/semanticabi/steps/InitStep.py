@@ -1,14 +1,23 @@
 from functools import partial
-from typing import List, Tuple, Dict, Callable
+from typing import List, Tuple, Dict, Callable, Optional, FrozenSet
 
+import eth_abi
+
+from semanticabi.abi.BatchEventDecoder import BatchEventDecoder, BatchDecodedKey, BatchDecoded
+from semanticabi.abi.Decoded import DecodedTuple
 from semanticabi.abi.SemanticAbi import SemanticAbi
+from semanticabi.abi.item.Parameter import PrimitiveParameter
 from semanticabi.abi.item.SemanticAbiItem import SemanticAbiItem, SemanticAbiEvent, DecodedResult
 from semanticabi.common.ValueConverter import ValueConverter
+from semanticabi.common.column.HexNormalize import HexNormalize
+from semanticabi.metadata.BlockTables import TOPIC_COLUMNS
 from semanticabi.metadata.EthBlock import EthBlock
 from semanticabi.metadata.EthLog import EthLog
 from semanticabi.metadata.EthTraces import EthTrace
 from semanticabi.metadata.EthTransaction import EthTransaction
 from semanticabi.steps.AbiSchema import AbiSchema
+from semanticabi.steps.Projection import Projection
+from semanticabi.steps.RowFilter import FilterOperator, RowFilter
 from semanticabi.steps.Step import Step, TransformItem
 
 
@@ -62,17 +71,69 @@ class InitStep(Step):
     """
     A no-op step that gets initialized with the particular ABI item that it'll handle, and filters the logs
     or traces by the signature of that item, optionally also filtering those by any contract addresses specified in the
-    ABI, adding an empty row for each matching log or trace
+    ABI, adding an empty row for each matching log or trace. Events with only static types are decoded for the whole
+    block at once the first time one of its transactions is transformed. If projected, only the top level parameters
+    needed are decoded.
+
+    Equality filters on indexed parameters are checked against the topics of logs so those that can't match are never
+    decoded, the filters themselves are still applied to the rows later. Logs that can't match are skipped even if they
+    would have failed to decode.
     """
 
     _semantic_abi: SemanticAbi
     _semantic_abi_item: SemanticAbiItem
     _schema: AbiSchema
+    _batch_decoder: Optional[BatchEventDecoder]
+    # top level parameters to decode, all if None
+    _parameters: Optional[FrozenSet[str]]
+    # topic index and the topics of an indexed parameter that could match a filter
+    _topic_filters: List[Tuple[int, FrozenSet[str]]]
 
-    def __init__(self, abi: SemanticAbi, abi_item: SemanticAbiItem):
+    def __init__(self, abi: SemanticAbi, abi_item: SemanticAbiItem, filters: Optional[List[RowFilter]] = None):
         self._semantic_abi = abi
         self._semantic_abi_item = abi_item
         self._schema = AbiSchema()
+        self._parameters = None
+        self._topic_filters = InitStep._build_topic_filters(abi_item, [] if filters is None else filters)
+
+        self._batch_decoder = None
+        if isinstance(abi_item, SemanticAbiEvent) and BatchEventDecoder.supports(abi_item.event):
+            self._batch_decoder = BatchEventDecoder(abi_item.event)
+
+    @staticmethod
+    def _build_topic_filters(abi_item: SemanticAbiItem, filters: List[RowFilter]) -> List[Tuple[int, FrozenSet[str]]]:
+        if not isinstance(abi_item, SemanticAbiEvent):
+            return []
+
+        indexed = abi_item.event.inputs.parameters(True)
+        topic_filters = []
+        for row_filter in filters:
+            if row_filter.operator not in (FilterOperator.EQ, FilterOperator.IN):
+                continue
+
+            # only the columns of indexed parameters that are exactly their decoded values
+            parameter = next((parameter for parameter in indexed if parameter.name == row_filter.column), None)
+            if parameter is None or not isinstance(parameter, PrimitiveParameter) or parameter.is_dynamic:
+                continue
+            semantic_parameter = abi_item.input_parameters.parameter(parameter.name)
+            if semantic_parameter.exclude or semantic_parameter.transform is not None:
+                continue
+
+            values = row_filter.value if row_filter.operator == FilterOperator.IN else [row_filter.value]
+            topics = set()
+            try:
+                for value in values:
+                    if parameter.signature.startswith('bytes'):
+                        # bytes are decoded to hex
+                        value = bytes.fromhex(value)
+                    topics.add(f'0x{eth_abi.encode([parameter.signature], [value]).hex()}')
+            except Exception:
+                # values that can't be encoded are left for the filter to compare
+                continue
+
+            topic_filters.append((1 + indexed.index(parameter), frozenset(topics)))
+
+        return topic_filters
 
     @property
     def _abi(self) -> SemanticAbi:
@@ -86,19 +147,81 @@ class InitStep(Step):
     def schema(self) -> AbiSchema:
         return self._schema
 
+    def project(self, projection: Projection) -> None:
+        self._parameters = frozenset(projection.parameters)
+
     def _inner_transform(self, block: EthBlock, transaction: EthTransaction) -> List[Tuple[TransformItem, List[Dict[str, any]]]]:
         results = []
         if isinstance(self._abi_item, SemanticAbiEvent):
             logs: List[EthLog] = transaction.logs_by_topic.get(self._abi_item.raw_item.hash, [])
+            batch_decoded: BatchDecoded = self._batch_decoded(block) if len(logs) > 0 else {}
             for log in logs:
-                transform_item: EventTransformItem = EventTransformItem(log, partial(self._abi_item.decode, log))
+                if not self._could_match(log):
+                    continue
+
+                values: Optional[List[any]] = batch_decoded.get(log.get('logIndex'))
+                transform_item: EventTransformItem = EventTransformItem(
+                    log,
+                    # logs the batch couldn't decode go through the usual decode to get the same result or error
+                    # other ABIs with the same event share the decoded values
+                    partial(self._abi_item.decode, log, self._parameters, block.decode_memo) if values is None
+                    else partial(self._batch_decoded_event, values)
+                )
                 if self._abi.should_consider(transform_item.contract_address):
                     results.append((transform_item, [{}]))
         else:
             traces: List[EthTrace] = transaction.traces_by_topic.get(self._abi_item.raw_item.hash, [])
             for trace in traces:
-                transform_item: FunctionTransformItem = FunctionTransformItem(trace, partial(self._abi_item.decode, trace))
+                transform_item: FunctionTransformItem = FunctionTransformItem(
+                    trace, partial(self._abi_item.decode, trace, self._parameters)
+                )
                 if self._abi.should_consider(transform_item.contract_address):
                     results.append((transform_item, [{}]))
 
         return results
+
+    def _could_match(self, log: EthLog) -> bool:
+        """
+        If the log could match the filters on its topics. Topics that aren't the encoding of a filtered value can't
+        decode to it so the log is never decoded, while a log missing the topic is decoded to report its error.
+        """
+        topics = log['topics']
+        for topic_i, filter_topics in self._topic_filters:
+            if topic_i >= len(topics) or topics[topic_i] is None:
+                return True
+            if HexNormalize.normalize(topics[topic_i]) not in filter_topics:
+                return False
+
+        return True
+
+    def _batch_decoded_event(self, values: List[any]) -> DecodedResult:
+        return DecodedResult(
+            DecodedTuple.from_parameters_and_values(None, self._abi_item.event.inputs.parameters(), values), None
+        )
+
+    def _batch_decoded(self, block: EthBlock) -> BatchDecoded:
+        """
+        Decoded input values by log index of all logs of the event in the block that could be batch decoded. ABIs with
+        the same event and contract addresses share the batch.
+        """
+        if self._batch_decoder is None:
+            return {}
+
+        key: BatchDecodedKey = (self._abi_item.event.layout, frozenset(self._abi.contract_addresses))
+        if key not in block.batch_decoded:
+            logs = block.tables.filter_logs([self._abi_item.raw_item.hash], self._abi.contract_addresses)
+            values_by_log_index: BatchDecoded = {}
+            if 'logIndex' in logs.column_names and 'data' in logs.column_names:
+                topics = [
+                    [topic for topic in log_topics if topic is not None]
+                    for log_topics in zip(*[logs.column(column).to_pylist() for column in TOPIC_COLUMNS])
+                ]
+                decoded = self._batch_decoder.decode_values(topics, logs.column('data').to_pylist())
+                for log_index, log_values in zip(logs.column('logIndex').to_pylist(), decoded):
+                    if log_values is not None:
+                        values_by_log_index[log_index] = log_values
+
+            block.batch_decoded[key] = values_by_log_index
+
+        return block.batch_decoded[key]
+
@@ -11,6 +11,7 @@ from semanticabi.metadata.EthTransaction import EthTransaction
 from semanticabi.steps.AbiSchema import AbiSchema
 from semanticabi.steps.FlattenParametersStep import FlattenParametersStep
 from semanticabi.steps.InitStep import InitStep
+from semanticabi.steps.Projection import Projection
 from semanticabi.steps.Step import Step, TransformItem
 from semanticabi.steps.SubsequentStep import SubsequentStep
 from semanticabi.steps.TokenTransferStep import TokenTransferStep
@@ -101,6 +102,15 @@ class MatchStep(SubsequentStep):
     def _should_transform(self):
         return self._abi_item.properties.matches is not None
 
+    def project(self, projection: Projection) -> None:
+        # matched steps are shared between items so always produce everything, only the source columns are needed
+        self._previous_step.project(projection.with_columns({
+            source_column_name
+            for match, _ in self._matches_and_steps
+            for predicate in match.predicates
+            for source_column_name in predicate.source_column_names()
+        }))
+
     def _inner_transform_item(
         self,
         block: EthBlock,
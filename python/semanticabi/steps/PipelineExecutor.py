@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from typing import List, Dict, Optional
+
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EthTransaction import EthTransaction
+from semanticabi.steps.AbiSchema import AbiSchema
+from semanticabi.steps.ColumnWriterPlan import ColumnWriterPlan
+from semanticabi.steps.Step import Step
+from semanticabi.steps.SubsequentStep import SubsequentStep
+
+
+class PipelineExecutor:
+    """
+    Runs a pipeline of steps one item at a time instead of each step transforming the results of all the ones before
+    it. This skips building a list of items and rows between every step and stops as soon as an item has no rows, with
+    the same results and errors as Step.transform.
+
+    Rows are built with the columns of the output schema, padding any that are only in other pipelines with None.
+    """
+
+    _first_step: Step
+    # the steps after the first that transform anything
+    _steps: List[SubsequentStep]
+    _plan: ColumnWriterPlan
+
+    def __init__(self, step: Step, schema: Optional[AbiSchema] = None):
+        steps: List[SubsequentStep] = []
+        while isinstance(step, SubsequentStep):
+            steps.insert(0, step)
+            step = step._previous_step
+        self._first_step = step
+        self._steps = [step for step in steps if step._should_transform()]
+
+        pipeline_schema: AbiSchema = steps[-1].schema if len(steps) > 0 else step.schema
+        self._plan = ColumnWriterPlan(pipeline_schema, schema)
+
+    def transform(self, block: EthBlock, transaction: EthTransaction) -> List[Dict[str, any]]:
+        results: List[Dict[str, any]] = []
+        for item, rows in self._first_step._inner_transform(block, transaction):
+            for step in self._steps:
+                rows = step._transform_item(block, transaction, item, rows)
+                if len(rows) == 0:
+                    break
+
+            for row in rows:
+                results.append(self._plan.write(item, row))
+
+        return results
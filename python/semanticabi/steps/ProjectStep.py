@@ -0,0 +1,41 @@
+from typing import List, Dict, Set
+
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EthTransaction import EthTransaction
+from semanticabi.steps.AbiSchema import AbiSchema
+from semanticabi.steps.Projection import Projection
+from semanticabi.steps.Step import Step, TransformItem, TRANSFORM_ERROR_COLUMN
+from semanticabi.steps.SubsequentStep import SubsequentStep
+
+
+class ProjectStep(SubsequentStep):
+    """
+    Last step that limits the schema to a set of columns, projecting the previous steps so anything that isn't needed
+    for them isn't decoded, flattened or evaluated. The transform error column is always kept so errors aren't lost.
+    """
+
+    _schema: AbiSchema
+
+    def __init__(self, previous_step: Step, columns: Set[str]):
+        super().__init__(previous_step)
+        self._schema = AbiSchema([
+            column for column in previous_step.schema.columns()
+            if column.name in columns or column.name == TRANSFORM_ERROR_COLUMN.name
+        ])
+        previous_step.project(Projection({column.name for column in self._schema.columns()}))
+
+    @property
+    def schema(self) -> AbiSchema:
+        return self._schema
+
+    def _should_transform(self):
+        return False
+
+    def _inner_transform_item(
+        self,
+        block: EthBlock,
+        transaction: EthTransaction,
+        item: TransformItem,
+        previous_data: List[Dict[str, any]]
+    ) -> List[Dict[str, any]]:
+        return previous_data
@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Set
+
+
+@dataclass(frozen=True)
+class Projection:
+    """
+    What a step needs from the steps before it, starting from the columns requested of the transformer and working back
+    through the pipeline.
+    """
+    # columns that need to be in the rows
+    columns: Set[str]
+    # top level input and output parameters that need to be decoded
+    parameters: Set[str] = field(default_factory=set)
+
+    def without_columns(self, columns: Set[str]) -> Projection:
+        return Projection(self.columns - columns, self.parameters)
+
+    def with_columns(self, columns: Set[str]) -> Projection:
+        return Projection(self.columns | columns, self.parameters)
+
+    def with_parameters(self, parameters: Set[str]) -> Projection:
+        return Projection(self.columns, self.parameters | parameters)
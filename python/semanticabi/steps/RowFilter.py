@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import operator
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Callable, Dict, Optional, Tuple
+
+from semanticabi.abi.InvalidAbiException import InvalidAbiException
+from semanticabi.common.column.BooleanDatasetColumn import BooleanDatasetColumn
+from semanticabi.common.column.DatasetColumn import DatasetColumn
+from semanticabi.common.column.HexNormalize import HexNormalize
+from semanticabi.common.column.NumericDatasetColumn import NumericDatasetColumn
+from semanticabi.common.column.RenamedColumn import RenamedColumn
+from semanticabi.common.column.StringDatasetColumn import StringDatasetColumn
+
+TypedRowFilter = Tuple[str, str, any]
+
+
+class FilterOperator(Enum):
+    EQ = ('=', operator.eq)
+    NE = ('!=', operator.ne)
+    GT = ('>', operator.gt)
+    GE = ('>=', operator.ge)
+    LT = ('<', operator.lt)
+    LE = ('<=', operator.le)
+    IN = ('in', lambda value, values: value in values)
+
+    code: str
+    compare: Callable[[any, any], bool]
+
+    def __init__(self, code: str, compare: Callable[[any, any], bool]):
+        self.code = code
+        self.compare = compare
+
+    @staticmethod
+    def from_code(code: str) -> FilterOperator:
+        for filter_operator in FilterOperator:
+            if filter_operator.code == code:
+                return filter_operator
+
+        raise InvalidAbiException(f'Unknown filter operator \'{code}\'')
+
+
+_EQUALITY_OPERATORS = frozenset([FilterOperator.EQ, FilterOperator.NE, FilterOperator.IN])
+
+
+class FilterValueType(Enum):
+    """
+    Type values of a column are compared as. Rows can have a column's values either as decoded or already coerced into
+    the column type, like numbers matched from other items that are strings, so both the constant and the values of
+    rows are converted to the same type before comparing.
+    """
+    NUMBER = 'number'
+    STRING = 'string'
+    BOOLEAN = 'boolean'
+
+    @staticmethod
+    def for_column(column: DatasetColumn) -> Optional[FilterValueType]:
+        while isinstance(column, RenamedColumn):
+            column = column.original_column
+
+        if isinstance(column, NumericDatasetColumn):
+            return FilterValueType.NUMBER
+        elif isinstance(column, StringDatasetColumn) and not column.is_array:
+            return FilterValueType.STRING
+        elif isinstance(column, BooleanDatasetColumn):
+            return FilterValueType.BOOLEAN
+
+        # compared as is
+        return None
+
+    def coerce(self, value: any) -> any:
+        """
+        Convert the value to the type, raising a ValueError or TypeError if it isn't one.
+        """
+        if self == FilterValueType.NUMBER and not isinstance(value, bool):
+            if isinstance(value, (int, float)):
+                return value
+            elif isinstance(value, str):
+                try:
+                    return int(value)
+                except ValueError:
+                    return float(value)
+        elif self == FilterValueType.STRING:
+            if isinstance(value, str):
+                return value
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                # same as string columns coerce values
+                return str(value)
+        elif self == FilterValueType.BOOLEAN and isinstance(value, bool):
+            return value
+
+        raise TypeError(f'{value!r} is not a {self.value}')
+
+
+@dataclass(frozen=True)
+class RowFilter:
+    """
+    Keeps rows where the value of a column compares to a constant, like ('value', '>', 1000) or ('from', '=', '0x...').
+    Once typed for the column with for_column, the constant and the values of rows are both converted to the type of
+    the column, so numbers compare as numbers even when given as strings, and addresses are lowercase. String columns
+    can only be compared for equality. Like SQL, missing values never match.
+    """
+    column: str
+    operator: FilterOperator
+    value: any
+    # type values are converted to before comparing, compared as is if None
+    value_type: Optional[FilterValueType] = None
+
+    @staticmethod
+    def from_tuple(row_filter: TypedRowFilter) -> RowFilter:
+        column, code, value = row_filter
+        filter_operator = FilterOperator.from_code(code)
+        if filter_operator == FilterOperator.IN:
+            value = frozenset(RowFilter._normalize(v) for v in value)
+        else:
+            value = RowFilter._normalize(value)
+
+        return RowFilter(column, filter_operator, value)
+
+    def for_column(self, column: DatasetColumn) -> RowFilter:
+        """
+        Filter with the constant converted to the type of the column, raising if it isn't a value of the column.
+        """
+        value_type = FilterValueType.for_column(column)
+        if value_type is None:
+            return self
+        if value_type == FilterValueType.STRING and self.operator not in _EQUALITY_OPERATORS:
+            # ordering strings like ids, addresses and hashes is lexicographic and never what's meant
+            raise InvalidAbiException(f'Filter \'{self}\' can only compare string column {column} with =, != or in')
+
+        try:
+            if self.operator == FilterOperator.IN:
+                value = frozenset(value_type.coerce(v) for v in self.value)
+            else:
+                value = value_type.coerce(self.value)
+        except (ValueError, TypeError) as e:
+            raise InvalidAbiException(f'Filter \'{self}\' does not match the type of column {column}: {e}')
+
+        return replace(self, value=value, value_type=value_type)
+
+    @staticmethod
+    def _normalize(value: any) -> any:
+        # addresses and hashes are lowercased when decoded
+        if isinstance(value, str) and value.startswith('0x'):
+            return HexNormalize.normalize(value)
+
+        return value
+
+    def matches(self, row: Dict[str, any]) -> bool:
+        value = row.get(self.column)
+        if value is None:
+            return False
+
+        try:
+            if self.value_type is not None:
+                value = self.value_type.coerce(value)
+            return self.operator.compare(value, self.value)
+        except (ValueError, TypeError):
+            # untyped constants of a different type, or values that failed to decode into the column type
+            return False
+
+    def __str__(self):
+        return f'{self.column} {self.operator.code} {self.value}'
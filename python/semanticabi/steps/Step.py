@@ -6,18 +6,11 @@ from typing import List, Tuple, Dict, Optional, Callable
 
 from semanticabi.abi.SemanticAbi import SemanticAbi
 from semanticabi.abi.item.SemanticAbiItem import SemanticAbiItem, DecodedResult
-from semanticabi.common.column.StringDatasetColumn import StringType
 from semanticabi.metadata.EthBlock import EthBlock
 from semanticabi.metadata.EthTransaction import EthTransaction
 from semanticabi.steps.AbiSchema import AbiSchema
-
-"""
-Doing this as a NONE type rather than SYSTEM so that it can't get accidentally get dropped later. We break up the
-handling of transform error into two parts, where the base Step class manages catching any errors and recording them
-for later, and then only writes out the errors if the schema includes this column, which is done by including the
-TransformErrorStep in the pipeline.
-"""
-TRANSFORM_ERROR_COLUMN = StringType.NONE('transform_error')
+from semanticabi.steps.ColumnWriterPlan import ColumnWriterPlan, TRANSFORM_ERROR_COLUMN
+from semanticabi.steps.Projection import Projection
 
 
 class TransformItem(ABC):
@@ -108,6 +101,13 @@ class Step(ABC):
         """
         pass
 
+    def project(self, projection: Projection) -> None:
+        """
+        Only produce what's needed for the projection, passing back what this step needs in turn from any previous
+        steps. Steps produce everything unless projected.
+        """
+        pass
+
     @abstractmethod
     def _inner_transform(self, block: EthBlock, transaction: EthTransaction) -> List[Tuple[TransformItem, List[Dict[str, any]]]]:
         """
@@ -120,22 +120,17 @@ class Step(ABC):
         Returns the transformed block and transaction data as a list of results
         """
         results: List[Dict[str, any]] = []
-        schema: AbiSchema = self.schema
+        plan: ColumnWriterPlan = self._writer_plan
         for item, transformed_rows in self._inner_transform(block, transaction):
             for transformed_row in transformed_rows:
-                final_row: Dict[str, any] = {}
-                for dataset_column in schema.columns():
-                    if dataset_column.name == TRANSFORM_ERROR_COLUMN.name:
-                        final_row[TRANSFORM_ERROR_COLUMN.name] = item.transform_error
-                        continue
-
-                    try:
-                        # Do any final column type transformation
-                        final_row[dataset_column.name] = dataset_column.transform(transformed_row)
-                    except Exception as e:
-                        # Try to continue writing out the remaining data for the row before adding all the errors
-                        item.add_transform_error(str(e))
-
-                results.append(final_row)
+                results.append(plan.write(item, transformed_row))
 
         return results
+
+    @cached_property
+    def _writer_plan(self) -> ColumnWriterPlan:
+        """
+        Compiled on the first transform since steps set their schema after the base constructor runs. Projection only
+        changes what steps produce and never the schema so the plan doesn't need to be rebuilt.
+        """
+        return ColumnWriterPlan(self.schema)
@@ -7,6 +7,7 @@ from semanticabi.abi.item.SemanticAbiItem import SemanticAbiItem
 from semanticabi.common.TransformException import TransformException
 from semanticabi.metadata.EthBlock import EthBlock
 from semanticabi.metadata.EthTransaction import EthTransaction
+from semanticabi.steps.Projection import Projection
 from semanticabi.steps.Step import Step, TransformItem
 
 
@@ -30,6 +31,9 @@ class SubsequentStep(Step):
         """
         return self._previous_step._abi_item
 
+    def project(self, projection: Projection) -> None:
+        self._previous_step.project(projection)
+
     def _should_transform(self) -> bool:
         """
         Returns true if this step should be run
@@ -59,20 +63,31 @@ class SubsequentStep(Step):
         if not self._should_transform():
             return previous_results
 
-        results: List[Tuple[TransformItem, List[Dict[str, any]]]] = []
-        for result_item, previous_data in previous_results:
-            try:
-                if not result_item.has_transform_error:
-                    transformed_rows: List[Dict[str, any]] = self._inner_transform_item(block, transaction, result_item, previous_data)
-                    results.append((result_item, transformed_rows))
-                else:
-                    results.append((result_item, previous_data))
-            except Exception as e:
-                # If there is an exception during transformation, add the error message to the row and continue
-                result_item.add_transform_error(str(e))
-                results.append((result_item, previous_data))
-                if not isinstance(e, TransformException):
-                    # For any unexpected exceptions, also log an error for later
-                    logging.error(f'Error transforming transaction {transaction.hash}, chain {block.chain.name}, item with topic {self._abi_item.raw_item.hash}: {e}')
+        return [
+            (result_item, self._transform_item(block, transaction, result_item, previous_data))
+            for result_item, previous_data in previous_results
+        ]
+
+    def _transform_item(
+        self,
+        block: EthBlock,
+        transaction: EthTransaction,
+        item: TransformItem,
+        previous_data: List[Dict[str, any]]
+    ) -> List[Dict[str, any]]:
+        """
+        Transform an item unless it already has an error, recording any error on the item and keeping the previous data.
+        """
+        if item.has_transform_error:
+            return previous_data
+
+        try:
+            return self._inner_transform_item(block, transaction, item, previous_data)
+        except Exception as e:
+            # If there is an exception during transformation, add the error message to the row and continue
+            item.add_transform_error(str(e))
+            if not isinstance(e, TransformException):
+                # For any unexpected exceptions, also log an error for later
+                logging.error(f'Error transforming transaction {transaction.hash}, chain {block.chain.name}, item with topic {self._abi_item.raw_item.hash}: {e}')
 
-        return results
+            return previous_data
@@ -62,6 +62,8 @@ class TokenTransferStep(Step):
     def _inner_transform(self, block: EthBlock, transaction: EthTransaction) -> List[Tuple[TransformItem, List[Dict[str, any]]]]:
         results: List[Tuple[TransformItem, List[Dict[str, any]]]] = []
 
+        # decode transfers of every transaction in the block together the first time any are needed
+        block.decode_transfers()
         for transfer in transaction.transfers:
             results.append((TokenTransferTransformItem(transfer), [{
                 'fromAddress': transfer.from_address,
@@ -0,0 +1,47 @@
+import pickle
+from typing import Dict
+
+import pytest
+from antlr4 import CommonTokenStream, InputStream
+
+from semanticabi.common.expression.ExpressionEvaluator import ExpressionEvaluator
+from semanticabi.common.expression.parser.ExpressionLexer import ExpressionLexer
+from semanticabi.common.expression.parser.ExpressionParser import ExpressionParser
+from test.common.ExpressionEvalVisitor import ExpressionEvalVisitor
+
+VARIABLES = {'a': 2, 'b': 3, 'c': 0.5, 'zero': 0, 'big': 2 ** 200, 's': 'foo', 't': 'bar', 'none': None}
+
+
+def _visit(expression: str, variables: Dict[str, any]) -> any:
+    """
+    Evaluate by walking the parse tree like expressions were before being compiled.
+    """
+    parser = ExpressionParser(CommonTokenStream(ExpressionLexer(InputStream(expression))))
+    return ExpressionEvalVisitor(variables).visit(parser.expression())
+
+
+def _outcome(evaluate) -> any:
+    try:
+        return 'value', evaluate()
+    except Exception as e:
+        return 'error', type(e), str(e)
+
+
+@pytest.mark.parametrize('expression', [
+    # arithmetic and precedence
+    '1 + 2 * 3', '(1 + 2) * 3', '2 ** 3 ** 2', '-2 ** 2', '1 - -2', '+-+1', '7 / 2', '1.5 * 4', '.5 + 0.25',
+    '12345678901234567890123 * 3',
+    # variables
+    'a + b * c', '-a', 'big * big - 1', 'a ** b / c', 's || t', 's || \'-\' || t', '(s)',
+    # errors raised while evaluating
+    'missing', 'none + 1', 'a / zero', 's - 1', 's * c', 'a || s',
+    # expressions that don't fully parse
+    '', '1 +', '(1 + 2', '1 + * 2', 'a b', ')', '\'unterminated', '1..2', '#', '** 2'
+])
+def test_same_as_visitor(expression: str):
+    compiled = ExpressionEvaluator(expression)
+    unpickled = pickle.loads(pickle.dumps(compiled))
+
+    expected = _outcome(lambda: _visit(expression, VARIABLES))
+    assert _outcome(lambda: compiled.evaluate(VARIABLES)) == expected
+    assert _outcome(lambda: unpickled.evaluate(VARIABLES)) == expected
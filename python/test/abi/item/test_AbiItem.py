@@ -1,6 +1,9 @@
 import unittest
 
+import eth_abi
+
 from semanticabi.abi.InvalidAbiException import InvalidAbiException
+from semanticabi.abi.item.AbiItem import AbiEvent, AbiFunction
 from semanticabi.abi.item.DataType import DataType
 from semanticabi.abi.item.SemanticAbiItem import SemanticAbiEvent, SemanticAbiFunction
 
@@ -510,3 +513,37 @@ class AbiItem(unittest.TestCase):
 
         with self.assertRaises(InvalidAbiException):
             SemanticAbiEvent.from_json(abi_json)
+
+    def test_projected_decode(self):
+        inputs = [
+            {"name": "name", "type": "string"},
+            {"name": "amount", "type": "uint256"},
+            {"name": "ids", "type": "uint256[]"},
+            {"name": "order", "type": "tuple", "components": [
+                {"name": "offerer", "type": "address"},
+                {"name": "salt", "type": "uint256"}
+            ]}
+        ]
+        function = AbiFunction.from_json({"name": "fn", "type": "function", "inputs": inputs, "outputs": []})
+        encoded = eth_abi.encode(
+            ['string', 'uint256', 'uint256[]', '(address,uint256)'],
+            ['name', 5, [1, 2, 3], ('0x' + 'ab' * 20, 7)]
+        ).hex()
+
+        decoded = function.decode('0x12345678' + encoded).to_json()
+        self.assertEqual(
+            {'amount': 5, 'order': decoded['order']},
+            function.decode('0x12345678' + encoded, {'amount', 'order'}).to_json()
+        )
+
+        # skipped dynamic parameters aren't decoded at all, so an invalid string doesn't fail
+        invalid_string = encoded[:-64 * 4 - 64] + 'ff' * 32 + encoded[-64 * 4:]
+        with self.assertRaises(Exception):
+            function.decode('0x12345678' + invalid_string)
+        self.assertEqual({'amount': 5}, function.decode('0x12345678' + invalid_string, {'amount'}).to_json())
+
+        event = AbiEvent.from_json({"name": "Ev", "type": "event", "inputs": [
+            {"name": "sender", "type": "address", "indexed": True}
+        ] + inputs})
+        log = {'topics': ['0x' + event.hash, '0x' + '00' * 12 + 'cd' * 20], 'data': '0x' + encoded}
+        self.assertEqual({'sender': '0x' + 'cd' * 20, 'ids': (1, 2, 3)}, event.decode(log, {'sender', 'ids'}).to_json())
@@ -0,0 +1,86 @@
+import pickle
+from typing import Dict, List
+
+from semanticabi.common.column.HexToInt import HexToInt
+from semanticabi.common.column.NumericDatasetColumn import NumericDatasetColumn
+from semanticabi.common.column.StringDatasetColumn import StringType
+from semanticabi.steps.AbiSchema import AbiSchema
+from semanticabi.steps.ColumnWriterPlan import ColumnWriterPlan, ColumnWrite, TRANSFORM_ERROR_COLUMN
+from semanticabi.steps.InitStep import EventTransformItem
+from semanticabi.steps.Step import Step
+
+
+def _item() -> EventTransformItem:
+    return EventTransformItem({'address': '0x0', 'logIndex': '0x0'}, lambda: None)
+
+
+def test_write():
+    schema = AbiSchema([
+        NumericDatasetColumn.int64('count'),
+        StringType.ADDRESS_HASH('address'),
+        NumericDatasetColumn.int64('value', transform_f=HexToInt()),
+        TRANSFORM_ERROR_COLUMN
+    ])
+    union_schema = AbiSchema(schema.columns() + [StringType.NONE('other')])
+    plan = ColumnWriterPlan(schema, union_schema)
+    assert [write for _, write, _ in plan._writes] == [
+        ColumnWrite.COPY, ColumnWrite.TRANSFORM, ColumnWrite.TRANSFORM, ColumnWrite.ERROR, ColumnWrite.PAD
+    ]
+
+    assert plan.write(_item(), {'count': 1, 'address': '0xABC', 'value': '0x10'}) == {
+        'count': 1, 'address': '0xabc', 'value': 16, 'transform_error': None, 'other': None
+    }
+
+    # failed transforms are nulled with the error written out
+    item = _item()
+    row = plan.write(item, {'address': '0xabc', 'value': 'not hex'})
+    assert row['count'] is None
+    assert row['value'] is None
+    assert row['transform_error'] is not None
+    assert item.has_transform_error
+
+    # plans can be sent to other processes
+    unpickled = pickle.loads(pickle.dumps(plan))
+    assert unpickled.write(_item(), {'count': 1, 'address': '0xABC', 'value': '0x10'}) \
+        == plan.write(_item(), {'count': 1, 'address': '0xABC', 'value': '0x10'})
+
+
+class _RowsStep(Step):
+    """
+    Step producing fixed rows for a single item.
+    """
+
+    def __init__(self, schema: AbiSchema, rows: List[Dict[str, any]]):
+        self._schema = schema
+        self._rows = rows
+        self._item = _item()
+
+    @property
+    def _abi(self):
+        return None
+
+    @property
+    def _abi_item(self):
+        return None
+
+    @property
+    def schema(self) -> AbiSchema:
+        return self._schema
+
+    def _inner_transform(self, block, transaction):
+        return [(self._item, self._rows)]
+
+
+def test_step_transform():
+    schema = AbiSchema([NumericDatasetColumn.int64('value', transform_f=HexToInt()), TRANSFORM_ERROR_COLUMN])
+    step = _RowsStep(schema, [{'value': '0x10'}, {'value': 'not hex'}])
+
+    # a failed column is written as None rather than left out of the row, the same as PipelineExecutor
+    rows = step.transform(None, None)
+    assert rows[0] == {'value': 16, 'transform_error': None}
+    assert list(rows[1]) == ['value', 'transform_error']
+    assert rows[1]['value'] is None
+    assert rows[1]['transform_error'] is not None
+
+    # compiled once for the step
+    assert step._writer_plan is step._writer_plan
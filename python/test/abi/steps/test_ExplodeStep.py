@@ -71,3 +71,33 @@ def test_explode_multiple(seaport_block: EthBlock):
     assert row['orders_signature'].startswith('ebeba350')
     assert row['fulfilled'] is True
     assert row['explodeIndex'] == 1
+
+
+def test_explode_tuple(seaport_block: EthBlock):
+    with open('test/resources/contracts/seaport/abis/explode/tuple.json') as file:
+        semantic_abi: SemanticAbi = SemanticAbi(json.loads(file.read()))
+
+    fulfill_order_transaction: EthTransaction = \
+        next(t for t in seaport_block.transactions if t.hash == '0x35343c5b809fc2a1c9e1c15fe854c8f07ba815fa58764373c5f949ffc08d9d6f')
+
+    step: Step = InitStep(semantic_abi, semantic_abi.functions_by_hash.get('ed98a574'))
+    step = ExplodeStep(step)
+
+    rows: List[Dict[str, any]] = step.transform(seaport_block, fulfill_order_transaction)
+
+    # each element is exploded into its own copy of the row
+    assert rows == [
+        {
+            'orders_parameters_offerer': '0x48d67bf72c47d748ca7c23fd54981a7875a0282e',
+            'orders_parameters_orderType': 0,
+            'orders_parameters_startTime': '1705393997',
+            'orders_signature': '747dbe9266ec5b43e167e68f033fe2f079eae133b9f1a3bd5c3116a813672b247dab08d158e9daaabf0dedf6fddf65da00f27c734ce0b7cd27ba366b39cb2cc1'
+        },
+        {
+            'orders_parameters_offerer': '0x2ff895e051f7a1c29c2d3bdab35c4960e3e1ec72',
+            'orders_parameters_orderType': 0,
+            'orders_parameters_startTime': '1705535000',
+            'orders_signature': 'ebeba3501a325b6ac776dd1b17a757ca73ad9d9a1748348b25500c0205ed8cc99149f3e9113b98ee0520083f4711258b831544297925622ec56fe3b6f09d7b2a'
+        }
+    ]
+    assert rows[0] is not rows[1]
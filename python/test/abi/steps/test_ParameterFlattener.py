@@ -3,8 +3,10 @@ from typing import Optional, List, Dict
 
 import pytest
 
+from semanticabi.abi.Decoded import DecodedTuple
 from semanticabi.abi.SemanticAbi import SemanticAbi
-from semanticabi.abi.item.SemanticAbiItem import SemanticAbiItem
+from semanticabi.abi.item.SemanticAbiItem import SemanticAbiItem, DecodedResult
+from semanticabi.common.TransformException import TransformException
 from semanticabi.steps.ExplodeStep import ExplodeFlattenPredicate
 from semanticabi.steps.FlattenedParameter import FlattenedParameter
 from semanticabi.steps.ParameterFlattener import ParameterFlattener
@@ -365,3 +367,17 @@ def test_flattened_array_nested_tuple():
         True,
         {'higherOrderType': 'addressHash'}
     )
+
+
+def test_missing_value_error():
+    with open('test/resources/contracts/seaport/abis/explode/tuple.json') as file:
+        seaport_abi: SemanticAbi = SemanticAbi(json.loads(file.read()))
+
+    abi_item: SemanticAbiItem = seaport_abi.functions_by_hash.get('ed98a574')
+    flattener: ParameterFlattener = ParameterFlattener(abi_item, ExplodeFlattenPredicate(abi_item.properties.explode.path_parts))
+    offerer_param: FlattenedParameter = flattener.parameter_list()[0]
+
+    # the path is named by its parameters so the message is the same across runs
+    decoded_result = DecodedResult(DecodedTuple(None, []), None)
+    with pytest.raises(TransformException, match=r'^Could not find value at path orders\.parameters\.offerer$'):
+        offerer_param.flattened_array(decoded_result)
@@ -0,0 +1,49 @@
+import glob
+import gzip
+import json
+from typing import Dict, List
+
+import pytest
+
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.abi.InvalidAbiException import InvalidAbiException
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EvmChain import EvmChain
+from semanticabi.steps.PipelineExecutor import PipelineExecutor
+
+ABI_PATHS = sorted(
+    glob.glob('test/resources/contracts/seaport/abis/*/*.json') + glob.glob('test/resources/contracts/erc20/abis/*.json')
+)
+
+
+def _transform_with_steps(transformer: SemanticTransformer, block: EthBlock) -> List[Dict[str, any]]:
+    """
+    Transform each transaction by running the whole chain of steps.
+    """
+    rows = []
+    for transaction in block.transactions:
+        for step in transformer._pipeline_by_topic.values():
+            for row in step.transform(block, transaction):
+                rows.append({column.name: row.get(column.name) for column in transformer.schema.columns()})
+
+    return rows
+
+
+@pytest.mark.parametrize('abi_path', ABI_PATHS)
+def test_same_as_steps(abi_path):
+    with open(abi_path) as file:
+        try:
+            transformer = SemanticTransformer(json.loads(file.read()))
+        except InvalidAbiException:
+            pytest.skip('invalid abi')
+
+    for path in sorted(glob.glob('test/resources/contracts/seaport/blocks/*.json.gz')):
+        with gzip.open(path) as file:
+            block_json = json.loads(file.read())
+
+        block = EthBlock(EvmChain.ETHEREUM, block_json)
+        executors = [PipelineExecutor(step, transformer.schema) for step in transformer._pipeline_by_topic.values()]
+        rows = [row for transaction in block.transactions for executor in executors for row in executor.transform(block, transaction)]
+
+        expected = _transform_with_steps(transformer, EthBlock(EvmChain.ETHEREUM, block_json))
+        assert rows == expected
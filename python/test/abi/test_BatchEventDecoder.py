@@ -0,0 +1,137 @@
+import gzip
+import json
+import random
+from typing import Dict, List, Optional
+
+import pytest
+
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.abi.BatchEventDecoder import BatchEventDecoder
+from semanticabi.abi.item.AbiItem import AbiEvent
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EvmChain import EvmChain
+from semanticabi.steps.InitStep import InitStep
+
+STATIC_PARAMETERS = [
+    ('sender', 'address', True),
+    ('tick', 'int24', True),
+    ('amount', 'uint256', False),
+    ('liquidity', 'int128', False),
+    ('flag', 'bool', False),
+    ('selector', 'bytes4', False),
+    ('decimals', 'uint8', False),
+    ('delta', 'int256', False),
+    ('nonce', 'uint64', False),
+    ('offset', 'int64', False)
+]
+
+
+def _event(parameters) -> AbiEvent:
+    return AbiEvent.from_json({
+        'type': 'event',
+        'name': 'Static',
+        'inputs': [{'name': name, 'type': type, 'indexed': indexed} for name, type, indexed in parameters]
+    })
+
+
+def _word(rng: random.Random, type: str) -> str:
+    if type == 'address':
+        return f'{rng.getrandbits(160):064x}'
+    elif type == 'bool':
+        return f'{rng.randint(0, 1):064x}'
+    elif type.startswith('bytes'):
+        size = int(type[5:])
+        return f'{rng.getrandbits(8 * size):0{2 * size}x}'.ljust(64, '0')
+
+    bits = int(type.lstrip('uint') or 256)
+    if type.startswith('u'):
+        return f'{rng.getrandbits(bits):064x}'
+
+    value = rng.randint(-2 ** (bits - 1), 2 ** (bits - 1) - 1)
+    return f'{value % 2 ** 256:064x}'
+
+
+def _decode_or_none(event: AbiEvent, log: Dict[str, any]) -> Optional[Dict[str, any]]:
+    try:
+        return event.decode(log).to_json()
+    except Exception:
+        return None
+
+
+def test_equivalent_to_eth_abi():
+    rng = random.Random(7)
+    event = _event(STATIC_PARAMETERS)
+
+    logs: List[Dict[str, any]] = []
+    for _ in range(500):
+        words = {name: _word(rng, type) for name, type, _ in STATIC_PARAMETERS}
+        if rng.random() < 0.2:
+            # corrupt a digit which might be padding
+            name = rng.choice(list(words))
+            digit = rng.randrange(64)
+            words[name] = words[name][:digit] + rng.choice('0123456789abcdef') + words[name][digit + 1:]
+
+        topics = [f'0x{event.hash}'] + [f'0x{words[name]}' for name, _, indexed in STATIC_PARAMETERS if indexed]
+        data = '0x' + ''.join(words[name] for name, _, indexed in STATIC_PARAMETERS if not indexed)
+
+        shape = rng.random()
+        if shape < 0.03:
+            topics = topics[:-1]
+        elif shape < 0.06:
+            data = data[:-64]
+        elif shape < 0.09:
+            data += '00' * 32
+
+        logs.append({'topics': topics, 'data': data})
+
+    decoded = BatchEventDecoder(event).decode(logs)
+    assert any(log_decoded is None for log_decoded in decoded)
+    assert any(log_decoded is not None for log_decoded in decoded)
+
+    decoded_json = BatchEventDecoder(event).decode_json(logs)
+    for log, log_decoded, log_json in zip(logs, decoded, decoded_json):
+        expected = _decode_or_none(event, log)
+        if log_decoded is None:
+            # only logs that eth_abi can't decode are left to it
+            assert expected is None
+            assert log_json is None
+        else:
+            assert log_decoded.to_json() == expected
+            assert log_json == expected
+
+
+def test_columns():
+    event = _event([('owner', 'address', True), ('value', 'uint64', False), ('total', 'uint256', False)])
+    topics = [[f'0x{event.hash}', '0x' + '00' * 12 + 'ab' * 20]]
+    data = ['0x' + f'{2 ** 64 - 1:064x}' + f'{2 ** 200 + 5:064x}']
+
+    columns = BatchEventDecoder(event).decode_columns(topics, data)
+    assert columns.valid.tolist() == [True]
+    assert columns.columns['owner'].tobytes() == bytes.fromhex('ab' * 20)
+    assert columns.columns['value'].tolist() == [2 ** 64 - 1]
+    assert columns.columns['total'].tolist() == [[2 ** 8, 0, 0, 5]]
+
+
+def test_supports():
+    assert BatchEventDecoder.supports(_event(STATIC_PARAMETERS))
+    assert not BatchEventDecoder.supports(_event([('name', 'string', False)]))
+    assert not BatchEventDecoder.supports(_event([('ids', 'uint256[]', False)]))
+
+    with pytest.raises(Exception, match='not static elementary types'):
+        BatchEventDecoder(_event([('data', 'bytes', False)]))
+
+
+def test_transform(monkeypatch):
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        transformer = SemanticTransformer(json.loads(file.read()))
+    with gzip.open('test/resources/contracts/seaport/blocks/19072200.json.gz') as file:
+        block_json = json.loads(file.read())
+
+    block = EthBlock(EvmChain.ETHEREUM, block_json)
+    rows = transformer.transform(block)
+    assert len(next(iter(block.batch_decoded.values()))) > 0
+
+    # decode each log individually
+    monkeypatch.setattr(InitStep, '_batch_decoded', lambda self, block: {})
+    expected = transformer.transform(EthBlock(EvmChain.ETHEREUM, block_json))
+    assert rows == expected
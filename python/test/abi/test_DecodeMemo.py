@@ -0,0 +1,88 @@
+import copy
+import gzip
+import json
+from typing import List
+
+import pytest
+
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.abi.DecodeMemo import DecodeMemo
+from semanticabi.abi.item.AbiItem import AbiEvent
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EvmChain import EvmChain
+
+
+def _event(names: List[str]) -> AbiEvent:
+    return AbiEvent.from_json({
+        'type': 'event',
+        'name': 'Named',
+        'inputs': [
+            {'name': names[0], 'type': 'address', 'indexed': True},
+            {'name': names[1], 'type': 'string', 'indexed': False}
+        ]
+    })
+
+
+@pytest.fixture
+def decodes(monkeypatch) -> List[AbiEvent]:
+    decodes = []
+    decode_values = AbiEvent.decode_values
+    monkeypatch.setattr(
+        AbiEvent, 'decode_values', lambda self, *args: decodes.append(self) or decode_values(self, *args)
+    )
+    return decodes
+
+
+def test_decode(decodes):
+    event = _event(['owner', 'name'])
+    renamed = _event(['holder', 'label'])
+    log = {
+        'topics': [f'0x{event.hash}', '0x' + '00' * 12 + 'ab' * 20],
+        'data': '0x' + f'{32:064x}' + f'{3:064x}' + b'abc'.hex().ljust(64, '0')
+    }
+
+    memo = DecodeMemo()
+    assert memo.decode(event, log).to_json() == {'owner': '0x' + 'ab' * 20, 'name': 'abc'}
+    # the same values under the names of the other event
+    assert memo.decode(renamed, log).to_json() == {'holder': '0x' + 'ab' * 20, 'label': 'abc'}
+    assert len(decodes) == 1
+
+    assert memo.decode(renamed, log, ['holder']).to_json() == {'holder': '0x' + 'ab' * 20}
+    assert memo.decode(event, log, ['owner']).to_json() == {'owner': '0x' + 'ab' * 20}
+    assert len(decodes) == 2
+
+    # errors are raised again without decoding
+    short = {**log, 'data': log['data'][:66]}
+    for _ in range(2):
+        with pytest.raises(Exception):
+            memo.decode(event, short)
+    assert len(decodes) == 3
+
+
+def test_transform(decodes):
+    with open('test/resources/contracts/seaport/abis/match/function_onlyone.json') as file:
+        abi_json = json.loads(file.read())
+    with gzip.open('test/resources/contracts/seaport/blocks/19072200.json.gz') as file:
+        block_json = json.loads(file.read())
+
+    # the same event with a parameter named differently
+    renamed_json = copy.deepcopy(abi_json)
+    event_json = next(item for item in renamed_json['abi'] if item.get('@isPrimary'))
+    next(parameter for parameter in event_json['inputs'] if parameter['name'] == 'recipient')['name'] = 'receiver'
+
+    transformer = SemanticTransformer(abi_json)
+    renamed = SemanticTransformer(renamed_json)
+
+    expected = renamed.transform(EthBlock(EvmChain.ETHEREUM, block_json))
+    decodes.clear()
+
+    block = EthBlock(EvmChain.ETHEREUM, block_json)
+    rows = transformer.transform(block)
+    num_decodes = len(decodes)
+    assert num_decodes > 0
+    assert len(rows) > 0
+
+    # decoded for the first ABI and only rebuilt under the new names for the second
+    assert renamed.transform(block) == expected
+    assert len(decodes) == num_decodes
+    assert any(name.endswith('receiver') and value is not None for row in expected for name, value in row.items())
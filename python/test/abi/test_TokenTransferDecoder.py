@@ -0,0 +1,140 @@
+import gzip
+import json
+import random
+from typing import Dict, List
+
+import pytest
+
+from semanticabi.abi.decoded.TokenTransferDecoded import TokenTransferDecoded
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EthLog import EthLog
+from semanticabi.metadata.EvmChain import EvmChain
+from semanticabi.metadata.EthTransaction import TRANSFER_ABI, TRANSFER_DECODER
+
+TRANSFER = '0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'
+TRANSFER_SINGLE = '0xc3d58168c5ae7397731d063d5bbf3d657854427343f4c083240f7aacaa2d0f62'
+TRANSFER_BATCH = '0x4a39dc06d4c0dbc64b70af90fd698a233a518aa5d07e595d983b8c0526c8f7fb'
+PUNK_TRANSFER = '0x05af636b70da6819000c49f85b21fa82081c632069bb626f30932034099107d8'
+PUNK_BOUGHT = '0x58e5d5a525e3b40bc15abaa38b5882678db1ee68befd2f60bafe3a7fd06db9e3'
+
+
+def _decode_with_abi(log: EthLog, log_i: int) -> List[TokenTransferDecoded]:
+    """
+    Decoding through the generic ABI decoder, ignoring failures.
+    """
+    if not TokenTransferDecoded.is_a(log):
+        return []
+
+    try:
+        if decoded_log := TRANSFER_ABI.decode_log(log):
+            return TokenTransferDecoded.of(log, log_i, decoded_log)
+    except Exception:
+        pass
+
+    return []
+
+
+def _address(rng: random.Random) -> str:
+    return f'{rng.getrandbits(160):064x}'
+
+
+def _uint(rng: random.Random) -> str:
+    return f'{rng.getrandbits(rng.choice([8, 64, 256])):064x}'
+
+
+def _array(rng: random.Random, values: List[int]) -> str:
+    return f'{len(values):064x}' + ''.join(f'{value:064x}' for value in values)
+
+
+def _random_log(rng: random.Random) -> Dict[str, any]:
+    signature = rng.choice([TRANSFER, TRANSFER, TRANSFER, TRANSFER_SINGLE, TRANSFER_BATCH, PUNK_TRANSFER, PUNK_BOUGHT])
+    if signature == TRANSFER:
+        shape = rng.choice(['erc20', 'erc721', 'erc721_unindexed'])
+        if shape == 'erc20':
+            topics, data = [_address(rng), _address(rng)], _uint(rng)
+        elif shape == 'erc721':
+            topics, data = [_address(rng), _address(rng), _uint(rng)], ''
+        else:
+            topics, data = [], _address(rng) + _address(rng) + _uint(rng)
+    elif signature == TRANSFER_SINGLE:
+        topics, data = [_address(rng), _address(rng), _address(rng)], _uint(rng) + _uint(rng)
+    elif signature == TRANSFER_BATCH:
+        ids = [rng.getrandbits(64) for _ in range(rng.randint(0, 3))]
+        values = [rng.getrandbits(64) for _ in range(len(ids) + rng.choice([0, 0, -1]))]
+        data = f'{64:064x}' + f'{64 + 32 * (len(ids) + 1):064x}' + _array(rng, ids) + _array(rng, values)
+        topics = [_address(rng), _address(rng), _address(rng)]
+    elif signature == PUNK_TRANSFER:
+        topics, data = [_address(rng), _address(rng)], _uint(rng)
+    else:
+        topics, data = [_uint(rng), _address(rng), _address(rng)], _uint(rng)
+
+    # malform some logs in ways that may or may not decode
+    malform = rng.random()
+    if malform < 0.05 and len(data) > 0:
+        data = data[:-64]
+    elif malform < 0.1:
+        topics = topics + [_uint(rng)]
+    elif malform < 0.15 and len(topics) > 0:
+        topics = topics[:-1]
+    elif malform < 0.2 and len(data) > 0:
+        digit = rng.randrange(len(data))
+        data = data[:digit] + 'f' + data[digit + 1:]
+    elif malform < 0.25 and len(topics) > 0:
+        topics[0] = 'f' + topics[0][1:]
+    elif malform < 0.27:
+        data += '00' * 32
+
+    return {
+        'address': '0x' + 'ab' * 20,
+        'topics': [signature] + [f'0x{topic}' for topic in topics],
+        'data': f'0x{data}'
+    }
+
+
+def _assert_same(transfers: List[TokenTransferDecoded], expected: List[TokenTransferDecoded]):
+    assert [transfer.__dict__ for transfer in transfers] == [transfer.__dict__ for transfer in expected]
+
+
+def test_equivalent_to_abi():
+    rng = random.Random(11)
+    logs = [_random_log(rng) for _ in range(2000)]
+
+    expected = [_decode_with_abi(log, log_i) for log_i, log in enumerate(logs)]
+    assert sum(len(transfers) > 0 for transfers in expected) > 1000
+    assert sum(len(transfers) == 0 for transfers in expected) > 100
+
+    for log_i, log in enumerate(logs):
+        _assert_same(TRANSFER_DECODER.decode(log, log_i), expected[log_i])
+
+    # batches of logs like transactions in a block
+    batches = [logs[i:i + 7] for i in range(0, len(logs), 7)]
+    for batch, transfers in zip(batches, TRANSFER_DECODER.decode_logs(batches)):
+        _assert_same(transfers, [transfer for log_i, log in enumerate(batch) for transfer in _decode_with_abi(log, log_i)])
+
+
+@pytest.mark.parametrize('path', [
+    'test/resources/ethereum_traces/17133218_geth.json',
+    'test/resources/contracts/seaport/blocks/19072200.json.gz'
+])
+def test_block_transfers(path):
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path) as file:
+        block = EthBlock(EvmChain.ETHEREUM, json.loads(file.read()))
+
+    expected = [
+        [transfer for log_i, log in enumerate(transaction.logs) for transfer in _decode_with_abi(log, log_i)]
+        for transaction in block.transactions
+    ]
+    assert sum(len(transfers) for transfers in expected) > 0
+
+    # filled in on each transaction instead of decoding them again
+    transfers_by_transaction = block.decode_transfers()
+    for transaction, transfers in zip(block.transactions, transfers_by_transaction):
+        assert vars(transaction)['transfers'] is transfers
+    assert block.decode_transfers() is transfers_by_transaction
+
+    for transaction, transaction_expected in zip(block.transactions, expected):
+        _assert_same(transaction.transfers, transaction_expected)
+
+    for transfers, transaction_expected in zip(block.decode_transfers(), expected):
+        _assert_same(transfers, transaction_expected)
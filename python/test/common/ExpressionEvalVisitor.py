@@ -7,7 +7,9 @@ from semanticabi.common.expression.parser.ExpressionVisitor import ExpressionVis
 
 class ExpressionEvalVisitor(ExpressionVisitor):
     """
-    Visitor that is responsible for evaluating an expression and returning the result
+    Visitor that is responsible for evaluating an expression and returning the result. Expressions were evaluated by
+    walking their parse tree with this for every row before being compiled, kept to check that compiled expressions
+    evaluate the same.
     """
     _variables: Dict[str, any]
 
@@ -0,0 +1,178 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+import hashlib
+import json
+from collections import Counter
+from typing import Dict, List, Optional
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from semanticabi.common.ValueConverter import ValueConverter
+
+
+class StandInNode:
+    """
+    Minimal JSON-RPC node serving a fetched geth block so the BlockFetcher can be tested without a real node. Counts
+    calls per method and can make block and transaction tracing slow or fail to exercise fallbacks.
+
+    The chain can be extended with synthetic blocks reusing the transactions of the fetched block, and the most recent
+    of those can be replaced to simulate a reorg.
+    """
+
+    block_json: Dict[str, any]
+    block: Dict[str, any]
+    receipts: List[Dict[str, any]]
+    traces: List[Dict[str, any]]
+
+    # the canonical chain served by the node
+    blocks_by_number: Dict[int, Dict[str, any]]
+
+    calls: Counter
+    # seconds to wait before responding to debug_traceBlockByNumber
+    block_trace_delay: float
+    # if set, respond to debug_traceBlockByNumber with this JSON-RPC error message
+    block_trace_error: Optional[str]
+    # number of times to respond to debug_traceTransaction for a transaction hash with an error before succeeding
+    transaction_trace_failures: Counter
+
+    _forks: int
+    _server: TestServer
+
+    def __init__(self, block_json: Dict[str, any]):
+        self.block_json = block_json
+        self.block = block_json['block']
+        self.receipts = block_json['receipts']
+        self.traces = block_json['traces']
+
+        self.blocks_by_number = {ValueConverter.hex_to_int(self.block['number']): block_json}
+
+        self.calls = Counter()
+        self.block_trace_delay = 0
+        self.block_trace_error = None
+        self.transaction_trace_failures = Counter()
+
+        self._forks = 0
+
+    @staticmethod
+    def from_file(path: str) -> StandInNode:
+        with open(path, 'r') as f:
+            return StandInNode(json.load(f))
+
+    @property
+    def url(self) -> str:
+        return str(self._server.make_url('/'))
+
+    @property
+    def head(self) -> int:
+        return max(self.blocks_by_number.keys())
+
+    def extend(self, count: int, transactions: Optional[int] = None):
+        """
+        Add blocks on top of the current head, each with the first n transactions of the fetched block.
+        """
+        for _ in range(count):
+            parent = self.blocks_by_number[self.head]['block']
+            number = self.head + 1
+            transactions = len(self.block['transactions']) if transactions is None else transactions
+
+            block = copy.copy(self.block)
+            block['number'] = hex(number)
+            block['hash'] = '0x' + hashlib.sha256(f'{number}-{self._forks}'.encode()).hexdigest()
+            block['parentHash'] = parent['hash']
+            block['transactions'] = self.block['transactions'][:transactions]
+
+            self.blocks_by_number[number] = {
+                'block': block,
+                'receipts': self.receipts[:transactions],
+                'traces': self.traces[:transactions]
+            }
+
+    def reorg(self, depth: int):
+        """
+        Replace the most recent blocks with a fork of the same height.
+        """
+        self._forks += 1
+        transactions = len(self.blocks_by_number[self.head]['block']['transactions'])
+        for _ in range(depth):
+            del self.blocks_by_number[self.head]
+
+        self.extend(depth, transactions)
+
+    async def __aenter__(self) -> StandInNode:
+        app = web.Application()
+        app.router.add_post('/', self._handle)
+        self._server = TestServer(app)
+        await self._server.start_server()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self._server.close()
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        body = await request.json()
+        method = body['method']
+        params = body['params']
+        self.calls[method] += 1
+
+        try:
+            result = await getattr(self, f'_{method}')(*params)
+            response = {'jsonrpc': '2.0', 'id': body['id'], 'result': result}
+        except _RpcError as e:
+            response = {'jsonrpc': '2.0', 'id': body['id'], 'error': {'code': -32000, 'message': str(e)}}
+
+        return web.json_response(response)
+
+    def _block_json(self, block_number: str) -> Dict[str, any]:
+        number = ValueConverter.hex_to_int(block_number)
+        if number not in self.blocks_by_number:
+            raise _RpcError(f'block {number} not found')
+
+        return self.blocks_by_number[number]
+
+    def _tx_index(self, transaction_hash: str) -> int:
+        for i, transaction in enumerate(self.block['transactions']):
+            if transaction['hash'] == transaction_hash:
+                return i
+
+        raise _RpcError(f'transaction {transaction_hash} not found')
+
+    async def _eth_blockNumber(self) -> str:
+        return hex(self.head)
+
+    async def _eth_getBlockByNumber(self, block_number: str, full_transactions: bool) -> Optional[Dict[str, any]]:
+        if ValueConverter.hex_to_int(block_number) not in self.blocks_by_number:
+            return None
+
+        block = self._block_json(block_number)['block']
+        if full_transactions:
+            return block
+
+        return {**block, 'transactions': [t['hash'] for t in block['transactions']]}
+
+    async def _eth_getTransactionReceipt(self, transaction_hash: str) -> Dict[str, any]:
+        return self.receipts[self._tx_index(transaction_hash)]
+
+    async def _eth_getBlockReceipts(self, block_number: str) -> List[Dict[str, any]]:
+        return self._block_json(block_number)['receipts']
+
+    async def _debug_traceBlockByNumber(self, block_number: str, config: Dict[str, any]) -> List[Dict[str, any]]:
+        if self.block_trace_delay > 0:
+            await asyncio.sleep(self.block_trace_delay)
+        if self.block_trace_error is not None:
+            raise _RpcError(self.block_trace_error)
+
+        return self._block_json(block_number)['traces']
+
+    async def _debug_traceTransaction(self, transaction_hash: str, config: Dict[str, any]) -> Dict[str, any]:
+        if self.transaction_trace_failures[transaction_hash] > 0:
+            self.transaction_trace_failures[transaction_hash] -= 1
+            raise _RpcError('execution timeout')
+
+        return self.traces[self._tx_index(transaction_hash)]['result']
+
+
+class _RpcError(Exception):
+    pass
@@ -0,0 +1,32 @@
+import gzip
+import json
+
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.common.HexInterner import HexInterner
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EvmChain import EvmChain
+
+
+def test_hex_interner():
+    interner = HexInterner()
+    address = interner.normalize('0xABCDEF')
+
+    assert address == '0xabcdef'
+    assert interner.normalize('0xAbCdEf') is address
+    assert interner.normalize('0xabcdef') is address
+    assert interner.normalize(None) is None
+    assert len(interner) == 1
+
+
+def test_rows_share_addresses():
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        transformer = SemanticTransformer(json.loads(file.read()))
+    with gzip.open('test/resources/contracts/seaport/blocks/19072200.json.gz') as file:
+        block = EthBlock(EvmChain.ETHEREUM, json.loads(file.read()))
+
+    # decoded addresses are checksummed so lowercasing copies each one, interned there is a single copy per address
+    addresses = [
+        row[column] for row in transformer.transform(block) for column in ['from', 'to', 'contractAddress', 'transactionTo']
+    ]
+    assert len(addresses) > len(set(addresses))
+    assert len({id(address) for address in addresses}) == len(set(addresses))
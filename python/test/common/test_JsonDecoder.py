@@ -0,0 +1,48 @@
+import gzip
+import json
+
+import pytest
+
+from semanticabi.common.JsonDecoder import JsonDecoder, StdlibJsonDecoder
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EvmChain import EvmChain
+
+BLOCK_PATH = 'test/resources/contracts/seaport/blocks/19072200.json.gz'
+
+
+@pytest.fixture(scope='module')
+def block_bytes() -> bytes:
+    with gzip.open(BLOCK_PATH) as file:
+        return file.read()
+
+
+def test_available():
+    available = JsonDecoder.available()
+
+    # stdlib is always available as the last resort
+    assert available[-1] == 'json'
+    assert JsonDecoder.default().name == available[0]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError) as e:
+        JsonDecoder.of('yaml')
+
+    assert 'Unknown JSON decoder backend: yaml' in str(e.value)
+
+
+@pytest.mark.parametrize('name', JsonDecoder.available())
+def test_backends_decode_identically(name: str, block_bytes: bytes):
+    decoder = JsonDecoder.of(name)
+
+    expected = json.loads(block_bytes)
+    assert decoder.loads(block_bytes) == expected
+    assert decoder.loads(block_bytes.decode('utf-8')) == expected
+
+
+def test_load_block():
+    block: EthBlock = EthBlock.from_file(EvmChain.ETHEREUM, BLOCK_PATH)
+    stdlib_block: EthBlock = EthBlock.from_file(EvmChain.ETHEREUM, BLOCK_PATH, StdlibJsonDecoder())
+
+    assert block.number == 19072200
+    assert len(block.transactions) == len(stdlib_block.transactions) == 193
@@ -0,0 +1,168 @@
+import gzip
+import json
+import time
+from typing import Callable, Dict
+
+import pytest
+
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.metadata.BlockTables import BlockTables, TABLE_NAMES
+from semanticabi.metadata.ColumnarEthBlock import ColumnarEthBlock
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EvmChain import EvmChain
+
+
+TRACE_ATTRIBUTES = [
+    'trace_address', 'block_hash', 'transaction_hash', 'type', 'call_type', 'from_address', 'to_address', 'signature',
+    'input', 'output', 'value', 'gas', 'gas_used', 'error', 'is_root', 'trace_hash'
+]
+
+
+def _load_json(path: str) -> Dict[str, any]:
+    opener = gzip.open if path.endswith('.gz') else open
+    with opener(path) as file:
+        return json.loads(file.read())
+
+
+@pytest.fixture(scope='module')
+def geth_block() -> EthBlock:
+    return EthBlock(EvmChain.ETHEREUM, _load_json('test/resources/ethereum_traces/17133218_geth.json'))
+
+
+@pytest.fixture(scope='module')
+def erigon_block() -> EthBlock:
+    return EthBlock(EvmChain.ETHEREUM, _load_json('test/resources/contracts/seaport/blocks/19072200.json.gz'))
+
+
+def _assert_equal_blocks(columnar: EthBlock, block: EthBlock):
+    assert columnar.number == block.number
+    assert columnar.block == block.block
+    assert columnar.has_traces == block.has_traces
+    assert len(columnar.transactions) == len(block.transactions)
+
+    for columnar_transaction, transaction in zip(columnar.transactions, block.transactions):
+        assert columnar_transaction.raw == transaction.raw
+        assert columnar_transaction.receipt == transaction.receipt
+        assert columnar_transaction.logs_by_topic == transaction.logs_by_topic
+
+        columnar_traces = columnar_transaction.traces.traces
+        traces = transaction.traces.traces
+        assert len(columnar_traces) == len(traces)
+        for columnar_trace, trace in zip(columnar_traces, traces):
+            for attribute in TRACE_ATTRIBUTES:
+                assert getattr(columnar_trace, attribute) == getattr(trace, attribute), attribute
+
+
+@pytest.mark.parametrize('block_fixture', ['geth_block', 'erigon_block'])
+def test_views(request, block_fixture):
+    block: EthBlock = request.getfixturevalue(block_fixture)
+    _assert_equal_blocks(ColumnarEthBlock.from_block(block), block)
+
+
+def test_share_and_attach(tmp_path, erigon_block):
+    ColumnarEthBlock.from_block(erigon_block).tables.share(str(tmp_path))
+    attached = ColumnarEthBlock.attach(EvmChain.ETHEREUM, str(tmp_path))
+
+    _assert_equal_blocks(attached, erigon_block)
+
+    with open('test/resources/contracts/seaport/abis/transform/primary_items_schema_equal.json') as file:
+        transformer = SemanticTransformer(json.loads(file.read()))
+    assert transformer.transform(attached) == transformer.transform(erigon_block)
+
+
+def test_without_traces(erigon_block):
+    block_json = {'block': erigon_block.block, 'receipts': [t.receipt for t in erigon_block.transactions]}
+    block = EthBlock(EvmChain.ETHEREUM, block_json)
+    columnar = ColumnarEthBlock.from_block(block)
+
+    assert columnar.tables.traces is None
+    assert not columnar.has_traces
+    assert all(transaction.traces is None for transaction in columnar.transactions)
+
+
+def test_receipt_overlay(geth_block):
+    receipt = ColumnarEthBlock.from_block(geth_block).transactions[0].receipt
+    receipt['status'] = None
+
+    assert receipt['status'] is None
+    with pytest.raises(Exception, match='read-only'):
+        del receipt['status']
+
+
+def _table_backed(block: EthBlock) -> BlockTables:
+    # tables built up front like ones attached with BlockTables.open, so matching runs the vectorized filters
+    tables = block.tables
+    return BlockTables(**{name: getattr(tables, name) for name in TABLE_NAMES})
+
+
+def _topics_by_walking(block: EthBlock, log_topics, trace_topics) -> Dict[int, set]:
+    topics_by_transaction = {}
+    for tx_index, transaction in enumerate(block.transactions):
+        topics = set(log_topics).intersection(transaction.logs_by_topic) \
+            .union(set(trace_topics).intersection(transaction.traces_by_topic))
+        if len(topics) > 0:
+            topics_by_transaction[tx_index] = topics
+
+    return topics_by_transaction
+
+
+@pytest.mark.parametrize('block_fixture', ['geth_block', 'erigon_block'])
+def test_topics_by_transaction(request, block_fixture):
+    block: EthBlock = request.getfixturevalue(block_fixture)
+    log_topics = list({topic for t in block.transactions for topic in t.logs_by_topic})
+    trace_topics = list({topic for t in block.transactions for topic in t.traces_by_topic})
+
+    expected = _topics_by_walking(block, log_topics, trace_topics)
+    assert block.tables.topics_by_transaction(log_topics, trace_topics) == expected
+    assert ColumnarEthBlock.from_block(block).tables.topics_by_transaction(log_topics, trace_topics) == expected
+    assert _table_backed(block).topics_by_transaction(log_topics, trace_topics) == expected
+
+    for tables in [block.tables, _table_backed(block)]:
+        counts = tables.count_by_topic(log_topics, trace_topics)
+        for topic in log_topics:
+            assert counts[topic] == sum(len(t.logs_by_topic.get(topic, [])) for t in block.transactions)
+        for topic in trace_topics:
+            assert counts[topic] == sum(len(t.traces_by_topic.get(topic, [])) for t in block.transactions)
+
+
+def test_topics_by_transaction_addresses(erigon_block):
+    transfer_topic = 'ddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef'
+    transfers = [
+        (tx_index, log)
+        for tx_index, transaction in enumerate(erigon_block.transactions)
+        for log in transaction.logs_by_topic.get(transfer_topic, [])
+    ]
+    tx_index, log = transfers[0]
+    address = log['address'].lower()
+
+    for tables in [erigon_block.tables, _table_backed(erigon_block)]:
+        assert tables.topics_by_transaction([transfer_topic], [], {address}) == {
+            tx_index: {transfer_topic} for tx_index, log in transfers if log['address'].lower() == address
+        }
+        assert tables.count_by_topic([transfer_topic], [], {address}) == {
+            transfer_topic: sum(1 for _, log in transfers if log['address'].lower() == address)
+        }
+
+
+@pytest.mark.parametrize('block_fixture', ['geth_block', 'erigon_block'])
+def test_dispatch_time(request, block_fixture):
+    block: EthBlock = request.getfixturevalue(block_fixture)
+    log_topics = list({topic for t in block.transactions for topic in t.logs_by_topic})
+    trace_topics = list({topic for t in block.transactions for topic in t.traces_by_topic})
+
+    def timed(dispatch: Callable[[EthBlock], any]) -> float:
+        # freshly parsed block each run so the dicts cached on the transactions are built every time
+        fresh = EthBlock(block.chain, block.block_json)
+        _ = fresh.transactions
+        start = time.perf_counter()
+        dispatch(fresh)
+        return time.perf_counter() - start
+
+    # interleaved so load from anything else running slows both the same, what dispatch did before the tables first
+    walking = []
+    dispatching = []
+    for _ in range(10):
+        walking.append(timed(lambda fresh: _topics_by_walking(fresh, log_topics, trace_topics)))
+        dispatching.append(timed(lambda fresh: fresh.tables.topics_by_transaction(log_topics, trace_topics)))
+    # within 2x of walking, building the logs table to dispatch is several times slower
+    assert min(dispatching) < 2 * min(walking)
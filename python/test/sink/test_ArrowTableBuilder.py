@@ -0,0 +1,135 @@
+import gzip
+import json
+import os
+from typing import Dict, List
+
+import pyarrow
+import pyarrow.compute
+import pyarrow.parquet as pq
+import pytest
+
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EvmChain import EvmChain
+from semanticabi.sink.ArrowTableBuilder import ArrowTableBuilder, DECIMAL_TYPE, HashEncoding, NumericEncoding
+from semanticabi.sink.ParquetSink import ParquetSink
+
+
+@pytest.fixture(scope='module')
+def transformer() -> SemanticTransformer:
+    with open('test/resources/contracts/seaport/abis/transform/primary_items_schema_equal.json') as file:
+        return SemanticTransformer(json.loads(file.read()))
+
+
+@pytest.fixture(scope='module')
+def rows(transformer) -> List[Dict[str, any]]:
+    with gzip.open('test/resources/contracts/seaport/blocks/19072200.json.gz') as file:
+        block: EthBlock = EthBlock(EvmChain.ETHEREUM, json.loads(file.read()))
+
+    return transformer.transform(block)
+
+
+def test_binary(transformer, rows):
+    builder = ArrowTableBuilder.from_transformer(transformer, HashEncoding.BINARY)
+    table = builder.build(rows)
+
+    assert table.schema.field('blockHash').type == pyarrow.binary(32)
+    assert table.schema.field('transactionHash').type == pyarrow.binary(32)
+    assert table.schema.field('contractAddress').type == pyarrow.binary(20)
+    # renamed columns from matches are encoded from the type of the original column
+    assert table.schema.field('transfer_fromAddress').type == pyarrow.binary(20)
+    # other hashes are left as strings
+    assert table.schema.field('parameters_zoneHash').type == pyarrow.string()
+
+    strings = ArrowTableBuilder.from_transformer(transformer).build(rows)
+    for name in ['blockHash', 'transactionHash', 'contractAddress', 'transfer_fromAddress']:
+        assert [
+            None if value is None else f'0x{value.hex()}' for value in table.column(name).to_pylist()
+        ] == strings.column(name).to_pylist()
+
+
+def test_dictionary(transformer, rows):
+    table = ArrowTableBuilder.from_transformer(transformer, HashEncoding.DICTIONARY).build(rows)
+
+    assert pyarrow.types.is_dictionary(table.schema.field('transactionHash').type)
+    assert table.column('transactionHash').cast(pyarrow.string()).to_pylist() == [row['transactionHash'] for row in rows]
+
+
+def test_invalid_hash(transformer, rows):
+    builder = ArrowTableBuilder.from_transformer(transformer, HashEncoding.BINARY)
+    with pytest.raises(Exception, match='is not a 20 byte hash'):
+        builder.build([{**rows[0], 'contractAddress': '0x1234'}])
+
+
+def test_parquet_size(tmp_path, transformer, rows):
+    sizes = {}
+    for hash_encoding in [HashEncoding.STRING, HashEncoding.BINARY]:
+        root = tmp_path / hash_encoding.value
+        with ParquetSink.from_transformer(str(root), transformer, compression='none', hash_encoding=hash_encoding) as sink:
+            sink.write(rows)
+
+        sizes[hash_encoding] = sum(os.path.getsize(path) for path in sink.written)
+        assert pq.read_table(sink.written[0]).num_rows == len(rows)
+
+    assert sizes[HashEncoding.BINARY] < sizes[HashEncoding.STRING]
+
+
+
+def test_decimal(transformer, rows):
+    table = ArrowTableBuilder.from_transformer(transformer, numeric_encoding=NumericEncoding.DECIMAL).build(rows)
+    strings = ArrowTableBuilder.from_transformer(transformer).build(rows)
+
+    decimal_columns = [field.name for field in table.schema if field.type == DECIMAL_TYPE]
+    # renamed big integers from matches are also decimals
+    assert 'transfer_value' in decimal_columns
+    for name in decimal_columns:
+        assert strings.schema.field(name).type == pyarrow.string()
+        # full 256 bit values like salts overflow and are nulled
+        assert [None if value is None else str(value) for value in table.column(name).to_pylist()] \
+            == [None if value is None or len(value) > 76 else value for value in strings.column(name).to_pylist()]
+
+    overflowed = [error for error in table.column('transform_error').to_pylist() if error is not None]
+    assert len(overflowed) > 0
+    assert all('of column \'parameters_salt\' overflows decimal256(76, 0).' in error for error in overflowed)
+
+    # native aggregations
+    assert pyarrow.compute.sum(table.column('transfer_value')).as_py() \
+        == sum(int(value) for value in strings.column('transfer_value').to_pylist() if value is not None)
+
+
+def test_decimal_overflow(transformer, rows):
+    builder = ArrowTableBuilder.from_transformer(transformer, numeric_encoding=NumericEncoding.DECIMAL)
+    table = builder.build([{**rows[0], 'transfer_value': str(2 ** 256 - 1)}, rows[1]])
+
+    assert table.column('transfer_value').to_pylist()[0] is None
+    assert 'overflows decimal256(76, 0)' in table.column('transform_error').to_pylist()[0]
+    assert table.column('transfer_value').to_pylist()[1] == int(rows[1]['transfer_value'])
+    assert 'transfer_value' not in table.column('transform_error').to_pylist()[1]
+
+    # without an error column there is nowhere to record the overflow
+    builder = ArrowTableBuilder(
+        [column for column in transformer.schema.columns() if column.name != 'transform_error'],
+        numeric_encoding=NumericEncoding.DECIMAL
+    )
+    with pytest.raises(Exception, match='overflows decimal256'):
+        builder.build([{**rows[0], 'transfer_value': str(-10 ** 76)}])
+
+
+def test_union():
+    with open('test/resources/contracts/seaport/abis/transform/primary_items_schema_diff_columns.json') as file:
+        transformer = SemanticTransformer(json.loads(file.read()))
+    with gzip.open('test/resources/contracts/seaport/blocks/19072200.json.gz') as file:
+        block: EthBlock = EthBlock(EvmChain.ETHEREUM, json.loads(file.read()))
+
+    builders = ArrowTableBuilder.by_item(transformer, HashEncoding.BINARY)
+    tables = [builders[signature].build(rows) for signature, rows in transformer.transform_by_item(block).items()]
+    assert any(len(table.schema) < len(transformer.schema.columns()) for table in tables)
+
+    builder = ArrowTableBuilder.from_transformer(transformer, HashEncoding.BINARY)
+    union = builder.union(tables)
+    assert union.schema == builder.schema
+
+    # grouped by item rather than in transaction order
+    sort_keys = [('transactionHash', 'ascending'), ('internalIndex', 'ascending')]
+    assert union.sort_by(sort_keys) == builder.build(transformer.transform(block)).sort_by(sort_keys)
+    assert builder.union([]).num_rows == 0
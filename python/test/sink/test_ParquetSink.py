@@ -0,0 +1,112 @@
+import gzip
+import json
+import os
+from typing import Dict, List
+
+import pyarrow.parquet as pq
+import pytest
+
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EvmChain import EvmChain
+from semanticabi.sink.ParquetSink import ParquetSink, SUPPORTS_BLOOM_FILTERS, SUPPORTS_SORTING_COLUMNS
+
+
+@pytest.fixture(scope='module')
+def transformer() -> SemanticTransformer:
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        return SemanticTransformer(json.loads(file.read()))
+
+
+@pytest.fixture(scope='module')
+def rows(transformer) -> List[Dict[str, any]]:
+    with gzip.open('test/resources/contracts/seaport/blocks/19072200.json.gz') as file:
+        block: EthBlock = EthBlock(EvmChain.ETHEREUM, json.loads(file.read()))
+
+    return transformer.transform(block)
+
+
+def test_write(tmp_path, transformer, rows):
+    with ParquetSink.from_transformer(
+        str(tmp_path), transformer, row_group_size=50, max_rows_per_file=120, file_prefix='part'
+    ) as sink:
+        sink.write(rows)
+
+    directory = tmp_path / 'chain=ethereum' / 'date=2024-01-23'
+    files = sorted(os.listdir(directory))
+    expected_files = (len(rows) + 119) // 120
+    assert files == [f'part-{i:05d}.parquet' for i in range(expected_files)]
+    assert sink.written == [str(directory / file) for file in files]
+
+    # the chain is only in the path and restored from the partitioning when read
+    assert 'chain' not in pq.ParquetFile(directory / files[0]).schema_arrow.names
+    table = pq.read_table(str(tmp_path))
+    assert table.column('chain').unique().to_pylist() == ['ethereum']
+    assert table.num_rows == len(rows)
+    assert sorted(table.column('transactionHash').to_pylist()) == sorted(row['transactionHash'] for row in rows)
+
+    metadata = pq.ParquetFile(directory / files[0]).metadata
+    assert metadata.num_rows == 120
+    assert metadata.num_row_groups == 3
+
+    row_group = metadata.row_group(0)
+    column_indices = {row_group.column(i).path_in_schema: i for i in range(row_group.num_columns)}
+    assert 'RLE_DICTIONARY' in row_group.column(column_indices['itemType']).encodings
+    assert 'DELTA_BINARY_PACKED' in row_group.column(column_indices['blockNumber']).encodings
+    if SUPPORTS_SORTING_COLUMNS:
+        assert row_group.sorting_columns[0].column_index == column_indices['blockNumber']
+    if SUPPORTS_BLOOM_FILTERS:
+        assert row_group.column(column_indices['transactionHash']).bloom_filter_offset is not None
+        assert row_group.column(column_indices['from']).bloom_filter_offset is not None
+
+
+def test_older_pyarrow(tmp_path, monkeypatch, transformer, rows):
+    import semanticabi.sink.ParquetSink as parquet_sink
+    for name in ['SUPPORTS_BLOOM_FILTERS', 'SUPPORTS_PAGE_INDEX', 'SUPPORTS_SORTING_COLUMNS']:
+        monkeypatch.setattr(parquet_sink, name, False)
+
+    # options the writer doesn't have are left out rather than failing
+    with ParquetSink.from_transformer(str(tmp_path), transformer) as sink:
+        assert {'write_page_index', 'sorting_columns', 'bloom_filter_options'}.isdisjoint(sink._writer_options)
+        sink.write(rows)
+
+    assert pq.read_table(str(tmp_path)).num_rows == len(rows)
+
+
+def test_partitions(tmp_path, transformer, rows):
+    # shift some rows to the next day
+    next_day = [{**row, 'blockTimestamp': row['blockTimestamp'] + 86400} for row in rows[:10]]
+    with ParquetSink.from_transformer(str(tmp_path), transformer) as sink:
+        sink.write(rows + next_day)
+
+    assert sorted(os.listdir(tmp_path / 'chain=ethereum')) == ['date=2024-01-23', 'date=2024-01-24']
+    assert pq.read_table(str(tmp_path / 'chain=ethereum' / 'date=2024-01-24')).num_rows == 10
+    # no temporary files are left behind
+    assert all(not name.startswith('.') for _, _, names in os.walk(tmp_path) for name in names)
+
+
+def test_sinks_never_overwrite(tmp_path, transformer, rows):
+    for _ in range(2):
+        with ParquetSink.from_transformer(str(tmp_path / 'default'), transformer) as sink:
+            sink.write(rows)
+
+    # the default prefix is different for each sink
+    assert pq.read_table(str(tmp_path / 'default')).num_rows == 2 * len(rows)
+
+    with ParquetSink.from_transformer(str(tmp_path / 'fixed'), transformer, file_prefix='part') as sink:
+        sink.write(rows)
+    with pytest.raises(FileExistsError):
+        with ParquetSink.from_transformer(str(tmp_path / 'fixed'), transformer, file_prefix='part') as sink:
+            sink.write(rows)
+    assert pq.read_table(str(tmp_path / 'fixed')).num_rows == len(rows)
+
+
+def test_abort(tmp_path, transformer, rows):
+    with pytest.raises(Exception, match='failed'):
+        with ParquetSink.from_transformer(str(tmp_path), transformer, row_group_size=50, max_rows_per_file=60) as sink:
+            sink.write(rows[:130])
+            raise Exception('failed')
+
+    # only the file that was completely written is kept
+    assert len(sink.written) == 1
+    assert [str(path) for path in tmp_path.rglob('*') if path.is_file()] == sink.written
@@ -0,0 +1,107 @@
+import asyncio
+import json
+import os
+from typing import Dict
+
+import pyarrow.parquet as pq
+import pytest
+
+from semanticabi.Backfill import Backfill, BackfillManifest, WorkUnit
+from semanticabi.BlockFetcher import BlockFetcher, NodeType
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EvmChain import EvmChain
+from semanticabi.sink.ParquetSink import ParquetSink
+from test.common.StandInNode import StandInNode
+
+
+GETH_BLOCK = 'test/resources/ethereum_traces/17133218_geth.json'
+START = 17133219
+END = 17133228
+
+
+@pytest.fixture(scope='module')
+def abi_json() -> Dict[str, any]:
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        return json.loads(file.read())
+
+
+def _node() -> StandInNode:
+    node = StandInNode.from_file(GETH_BLOCK)
+    node.extend(END - START, 20)
+    return node
+
+
+def _backfill(node: StandInNode, abi_json: Dict[str, any], output_root: str) -> BackfillManifest:
+    async def run():
+        async with node:
+            async with BlockFetcher(node.url, NodeType.GETH, max_connections=4) as fetcher:
+                backfill = Backfill(fetcher, EvmChain.ETHEREUM, abi_json, output_root, workers=1, processes=0)
+                return await backfill.run(START, END, unit_size=3)
+
+    return asyncio.run(run())
+
+
+def _expected_rows(node: StandInNode, abi_json: Dict[str, any]) -> int:
+    transformer = SemanticTransformer(abi_json)
+    return sum(
+        len(transformer.transform(EthBlock(EvmChain.ETHEREUM, node.blocks_by_number[number])))
+        for number in range(START, END)
+    )
+
+
+def test_split():
+    assert WorkUnit.split(0, 7, 3) == [WorkUnit(0, 3), WorkUnit(3, 6), WorkUnit(6, 7)]
+    assert WorkUnit(3, 6).id == '0000000003-0000000006'
+
+
+def test_backfill(tmp_path, abi_json):
+    node = _node()
+    manifest = _backfill(node, abi_json, str(tmp_path))
+
+    assert manifest.remaining == []
+    files = [file for unit in manifest.units for file in manifest.completed[unit.id]]
+    assert files == [
+        f'chain=ethereum/date=2023-04-26/{unit.id}-00000.parquet' for unit in WorkUnit.split(START, END, 3)
+    ]
+    assert all(os.path.exists(tmp_path / file) for file in files)
+    assert not os.path.exists(tmp_path / '_staging' / WorkUnit(START, START + 3).id)
+
+    table = pq.read_table(str(tmp_path))
+    assert table.num_rows == _expected_rows(node, abi_json)
+    assert sorted(set(table.column('blockNumber').to_pylist())) == list(range(START, END))
+
+
+def test_resume(tmp_path, monkeypatch, abi_json):
+    node = _node()
+    # fail in the middle unit
+    missing = node.blocks_by_number.pop(START + 4)
+
+    aborted = []
+    abort = ParquetSink.abort
+    monkeypatch.setattr(ParquetSink, 'abort', lambda sink: aborted.append(sink._file_prefix) or abort(sink))
+    with pytest.raises(Exception, match=f'Block {START + 4} not found'):
+        _backfill(node, abi_json, str(tmp_path))
+
+    with open(tmp_path / '_manifest.json') as file:
+        assert list(json.load(file)['completed'].keys()) == [WorkUnit(START, START + 3).id]
+    # the sink of the failed unit was aborted
+    assert aborted == [WorkUnit(START + 3, START + 6).id]
+
+    node.blocks_by_number[START + 4] = missing
+    node.calls.clear()
+    manifest = _backfill(node, abi_json, str(tmp_path))
+
+    # only the missing units were fetched
+    assert manifest.remaining == []
+    assert node.calls['eth_getBlockByNumber'] == 6
+    assert pq.read_table(str(tmp_path)).num_rows == _expected_rows(node, abi_json)
+
+
+def test_manifest_range_mismatch(tmp_path):
+    path = str(tmp_path / '_manifest.json')
+    BackfillManifest.load_or_create(path, 0, 10, WorkUnit.split(0, 10, 5))
+
+    assert BackfillManifest.load_or_create(path, 0, 10, WorkUnit.split(0, 10, 2)).units == WorkUnit.split(0, 10, 5)
+    with pytest.raises(Exception, match='is for blocks 0 to 10'):
+        BackfillManifest.load_or_create(path, 0, 20, WorkUnit.split(0, 20, 5))
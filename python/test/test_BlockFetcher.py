@@ -0,0 +1,154 @@
+import asyncio
+import json
+from typing import Callable, Optional
+
+import pytest
+
+from semanticabi.BlockFetcher import BlockFetcher, NodeType
+from semanticabi.FetchPlan import FetchPlan
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EthBlockJson import EthBlockJson
+from semanticabi.metadata.EvmChain import EvmChain
+from test.common.StandInNode import StandInNode
+
+
+GETH_BLOCK = 'test/resources/ethereum_traces/17133218_geth.json'
+GETH_BLOCK_NUMBER = 17133218
+
+
+def _fetch(
+    configure_node: Callable[[StandInNode], None],
+    plan: Optional[FetchPlan] = None,
+    **fetcher_kwargs
+) -> (StandInNode, EthBlockJson):
+    async def fetch():
+        async with StandInNode.from_file(GETH_BLOCK) as node:
+            configure_node(node)
+            async with BlockFetcher(node.url, NodeType.GETH, **fetcher_kwargs) as fetcher:
+                return node, await fetcher.fetch_block(GETH_BLOCK_NUMBER, plan)
+
+    return asyncio.run(fetch())
+
+
+@pytest.fixture(scope='module')
+def expected() -> StandInNode:
+    return StandInNode.from_file(GETH_BLOCK)
+
+
+def _transformer(abi_path: str) -> SemanticTransformer:
+    with open(abi_path) as file:
+        return SemanticTransformer(json.loads(file.read()))
+
+
+def _transform(transformer: SemanticTransformer, block_json: EthBlockJson) -> list:
+    return transformer.transform(EthBlock(EvmChain.ETHEREUM, block_json))
+
+
+def test_fetch_geth(expected):
+    node, block = _fetch(lambda n: None)
+
+    assert block['block'] == expected.block
+    assert block['receipts'] == expected.receipts
+    assert block['traces'] == expected.traces
+    assert node.calls['debug_traceBlockByNumber'] == 1
+    assert node.calls['debug_traceTransaction'] == 0
+
+
+def test_trace_transactions_over_threshold(expected):
+    node, block = _fetch(lambda n: None, trace_transactions_threshold=100, max_connections=4)
+
+    assert block['traces'] == expected.traces
+    assert node.calls['debug_traceBlockByNumber'] == 0
+    assert node.calls['debug_traceTransaction'] == 144
+
+
+def test_trace_transactions_on_timeout(expected):
+    def slow_node(node: StandInNode):
+        node.block_trace_delay = 2
+
+    node, block = _fetch(slow_node, trace_transactions_threshold=1000, block_trace_timeout=0.5)
+
+    assert block['traces'] == expected.traces
+    assert node.calls['debug_traceBlockByNumber'] == 1
+    assert node.calls['debug_traceTransaction'] == 144
+
+
+def test_trace_transactions_on_node_error(expected):
+    def failing_node(node: StandInNode):
+        node.block_trace_error = 'execution timeout'
+
+    node, block = _fetch(failing_node, trace_transactions_threshold=1000)
+
+    assert block['traces'] == expected.traces
+    assert node.calls['debug_traceTransaction'] == 144
+
+
+def test_trace_transactions_concurrency():
+    async def connections(**fetcher_kwargs) -> int:
+        async with BlockFetcher('http://localhost', NodeType.GETH, **fetcher_kwargs) as fetcher:
+            return fetcher._session.connector.limit
+
+    # tracing individually gets enough connections for its concurrency, otherwise the limit is left alone
+    assert asyncio.run(connections(trace_transactions_threshold=100, trace_concurrency=8)) == 8
+    assert asyncio.run(connections(trace_transactions_threshold=100, max_connections=16)) == 16
+    assert asyncio.run(connections(trace_concurrency=8)) == 1
+
+
+def test_trace_transactions_retry(expected):
+    failing_hash = expected.block['transactions'][3]['hash']
+
+    def flaky_node(node: StandInNode):
+        node.transaction_trace_failures[failing_hash] = 2
+
+    node, block = _fetch(flaky_node, trace_transactions_threshold=100)
+
+    assert block['traces'] == expected.traces
+    assert node.calls['debug_traceTransaction'] == 146
+
+
+def test_trace_transactions_failed(expected):
+    failing_hash = expected.block['transactions'][3]['hash']
+
+    def failing_node(node: StandInNode):
+        node.transaction_trace_failures[failing_hash] = 3
+
+    # the transaction that couldn't be traced is named
+    with pytest.raises(Exception, match=f'transaction trace for {failing_hash}: execution timeout'):
+        _fetch(failing_node, trace_transactions_threshold=100)
+
+
+def test_fetch_plan_events(expected):
+    transformer = _transformer('test/resources/contracts/erc20/abis/transfer_event.json')
+    plan = FetchPlan.from_transformer(transformer)
+    assert plan == FetchPlan(logs=True, traces=False)
+
+    node, block = _fetch(lambda n: None, plan)
+
+    assert 'traces' not in block
+    assert node.calls['debug_traceBlockByNumber'] == 0
+    assert node.calls['eth_getTransactionReceipt'] == 144
+    assert _transform(transformer, block) == _transform(transformer, expected.block_json)
+
+
+def test_fetch_plan_functions(expected):
+    transformer = _transformer('test/resources/contracts/erc20/abis/transfer_function.json')
+    plan = FetchPlan.from_transformer(transformer)
+    assert plan == FetchPlan(logs=False, traces=True)
+
+    node, block = _fetch(lambda n: None, plan)
+
+    # receipts are built from the traces instead of fetched
+    assert node.calls['eth_getTransactionReceipt'] == 0
+    assert node.calls['debug_traceBlockByNumber'] == 1
+    assert [r['contractAddress'] for r in block['receipts']] == [r['contractAddress'] for r in expected.receipts]
+    assert _transform(transformer, block) == _transform(transformer, expected.block_json)
+
+
+def test_fetch_plan_from_transformers():
+    plan = FetchPlan.from_transformers([
+        _transformer('test/resources/contracts/erc20/abis/transfer_event.json'),
+        _transformer('test/resources/contracts/erc20/abis/transfer_function.json')
+    ])
+
+    assert plan == FetchPlan.all()
@@ -0,0 +1,98 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List
+
+import pytest
+
+from semanticabi.BlockFetcher import BlockFetcher, NodeType
+from semanticabi.BlockPipeline import BlockPipeline, BlockRows
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EvmChain import EvmChain
+from test.common.StandInNode import StandInNode
+
+
+GETH_BLOCK = 'test/resources/ethereum_traces/17133218_geth.json'
+ABI_PATHS = [
+    'test/resources/contracts/erc20/abis/transfer_event.json',
+    'test/resources/contracts/erc20/abis/transfer_function.json'
+]
+
+
+@pytest.fixture(scope='module')
+def abi_jsons() -> List[Dict[str, any]]:
+    abi_jsons = []
+    for path in ABI_PATHS:
+        with open(path) as file:
+            abi_jsons.append(json.loads(file.read()))
+
+    return abi_jsons
+
+
+def _run(abi_jsons: List[Dict[str, any]], processes: int, **pipeline_kwargs) -> (StandInNode, Dict[int, BlockRows]):
+    written: Dict[int, BlockRows] = {}
+
+    def write(block_number: int, rows: BlockRows):
+        written[block_number] = rows
+
+    async def run():
+        async with StandInNode.from_file(GETH_BLOCK) as node:
+            node.extend(5, 30)
+            async with BlockFetcher(node.url, NodeType.GETH, max_connections=4) as fetcher:
+                pipeline = BlockPipeline(fetcher, EvmChain.ETHEREUM, abi_jsons, write, processes=processes, queue_size=2, **pipeline_kwargs)
+                await pipeline.run(range(node.head - 5, node.head + 1))
+
+            return node
+
+    return asyncio.run(run()), written
+
+
+@pytest.mark.parametrize('processes,shared', [(0, False), (2, False), (2, True)])
+def test_pipeline(tmp_path, abi_jsons, processes, shared):
+    node, written = _run(abi_jsons, processes, shared_directory=str(tmp_path) if shared else None)
+
+    assert sorted(written.keys()) == sorted(node.blocks_by_number.keys())
+    for block_number, rows in written.items():
+        block = EthBlock(EvmChain.ETHEREUM, node.blocks_by_number[block_number])
+        assert rows == [SemanticTransformer(abi_json).transform(block) for abi_json in abi_jsons]
+
+    # shared blocks are cleaned up once transformed
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_pipeline_failure(abi_jsons):
+    def write(block_number: int, rows: BlockRows):
+        raise Exception('disk full')
+
+    async def run():
+        async with StandInNode.from_file(GETH_BLOCK) as node:
+            node.extend(20, 5)
+            async with BlockFetcher(node.url, NodeType.GETH) as fetcher:
+                pipeline = BlockPipeline(fetcher, EvmChain.ETHEREUM, abi_jsons, write, processes=0, queue_size=1)
+                await pipeline.run(range(node.head - 20, node.head + 1))
+
+    with pytest.raises(Exception, match='disk full'):
+        asyncio.run(run())
+
+
+def test_shutdown_off_event_loop(monkeypatch, abi_jsons):
+    shutdown_threads = []
+    shutdown = ProcessPoolExecutor.shutdown
+
+    def record_shutdown(executor, *args, **kwargs):
+        shutdown_threads.append(threading.current_thread())
+        shutdown(executor, *args, **kwargs)
+
+    monkeypatch.setattr(ProcessPoolExecutor, 'shutdown', record_shutdown)
+    _run(abi_jsons, 2)
+
+    # waiting for the processes of the pool owned by the pipeline to exit doesn't block the event loop
+    assert len(shutdown_threads) == 1
+    assert shutdown_threads[0] is not threading.main_thread()
+
+
+def test_shared_without_processes(tmp_path, abi_jsons):
+    with pytest.raises(Exception, match='pool of processes'):
+        BlockPipeline(None, EvmChain.ETHEREUM, abi_jsons, lambda *args: None, processes=0, shared_directory=str(tmp_path))
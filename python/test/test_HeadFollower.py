@@ -0,0 +1,166 @@
+import asyncio
+import json
+from typing import List
+
+import pytest
+
+from semanticabi.BlockFetcher import BlockFetcher, NodeType
+from semanticabi.HeadFollower import HeadFollower, HeadEvent, HeadEventType
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.metadata.EvmChain import EvmChain
+from test.common.StandInNode import StandInNode
+
+
+GETH_BLOCK = 'test/resources/ethereum_traces/17133218_geth.json'
+TRANSACTIONS = 40
+
+
+@pytest.fixture(scope='module')
+def transformer() -> SemanticTransformer:
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        return SemanticTransformer(json.loads(file.read()))
+
+
+def test_follow_with_reorg(transformer):
+    async def follow() -> List[HeadEvent]:
+        async with StandInNode.from_file(GETH_BLOCK) as node:
+            node.extend(3, TRANSACTIONS)
+            start_block = node.head - 2
+
+            events: List[HeadEvent] = []
+            async with BlockFetcher(node.url, NodeType.GETH) as fetcher:
+                follower = HeadFollower(fetcher, EvmChain.ETHEREUM, transformer, start_block=start_block, poll_interval=0.01)
+                async for event in follower.follow():
+                    events.append(event)
+
+                    if len(events) == 3:
+                        # replace the last 2 blocks and add another once caught up
+                        node.reorg(2)
+                        node.extend(1, TRANSACTIONS)
+                    elif len(events) == 8:
+                        return events
+
+    events = asyncio.run(follow())
+
+    assert [(e.type, e.block_number) for e in events] == [
+        (HeadEventType.ROWS, 17133219),
+        (HeadEventType.ROWS, 17133220),
+        (HeadEventType.ROWS, 17133221),
+        (HeadEventType.RETRACT, 17133221),
+        (HeadEventType.RETRACT, 17133220),
+        (HeadEventType.ROWS, 17133220),
+        (HeadEventType.ROWS, 17133221),
+        (HeadEventType.ROWS, 17133222)
+    ]
+
+    # retractions are for exactly the rows emitted for the orphaned blocks
+    assert events[3].keys == events[2].keys
+    assert events[4].keys == events[1].keys
+    assert len(events[1].keys) > 0
+    assert all(key[0] == events[1].block_hash for key in events[1].keys)
+
+    # the new canonical blocks have the same transactions under a different hash
+    assert events[5].block_hash != events[1].block_hash
+    assert [key[1:] for key in events[5].keys] == [key[1:] for key in events[1].keys]
+
+
+def test_reorg_deeper_than_window(transformer):
+    types: List[HeadEventType] = []
+
+    async def follow():
+        async with StandInNode.from_file(GETH_BLOCK) as node:
+            node.extend(3, TRANSACTIONS)
+
+            async with BlockFetcher(node.url, NodeType.GETH) as fetcher:
+                follower = HeadFollower(
+                    fetcher, EvmChain.ETHEREUM, transformer, start_block=node.head - 2, window=2, poll_interval=0.01
+                )
+                async for event in follower.follow():
+                    types.append(event.type)
+                    if len(types) == 3:
+                        node.reorg(3)
+                        node.extend(1, TRANSACTIONS)
+
+    with pytest.raises(Exception, match='deeper than the window'):
+        asyncio.run(follow())
+
+    # the window is still retracted, it's the first block that was emitted and left the window that can't be
+    assert types[3:] == [HeadEventType.RETRACT] * 2
+
+
+def test_reorg_as_deep_as_window(transformer):
+    async def follow() -> List[HeadEvent]:
+        async with StandInNode.from_file(GETH_BLOCK) as node:
+            node.extend(3, TRANSACTIONS)
+
+            events: List[HeadEvent] = []
+            async with BlockFetcher(node.url, NodeType.GETH) as fetcher:
+                follower = HeadFollower(
+                    fetcher, EvmChain.ETHEREUM, transformer, start_block=node.head - 2, window=2, poll_interval=0.01
+                )
+                async for event in follower.follow():
+                    events.append(event)
+                    if len(events) == 3:
+                        node.reorg(2)
+                        node.extend(1, TRANSACTIONS)
+                    elif len(events) == 8:
+                        return events
+
+    events = asyncio.run(follow())
+
+    # the whole window is retracted and the chain reconnects to the block before it
+    assert [(e.type, e.block_number) for e in events[3:]] == [
+        (HeadEventType.RETRACT, 17133221),
+        (HeadEventType.RETRACT, 17133220),
+        (HeadEventType.ROWS, 17133220),
+        (HeadEventType.ROWS, 17133221),
+        (HeadEventType.ROWS, 17133222)
+    ]
+
+
+def test_reorg_of_first_block(transformer):
+    async def follow() -> List[HeadEvent]:
+        async with StandInNode.from_file(GETH_BLOCK) as node:
+            node.extend(1, TRANSACTIONS)
+
+            events: List[HeadEvent] = []
+            async with BlockFetcher(node.url, NodeType.GETH) as fetcher:
+                follower = HeadFollower(fetcher, EvmChain.ETHEREUM, transformer, start_block=node.head, poll_interval=0.01)
+                async for event in follower.follow():
+                    events.append(event)
+
+                    if len(events) == 1:
+                        # replace the block started at before anything else is in the window
+                        node.reorg(1)
+                        node.extend(1, TRANSACTIONS)
+                    elif len(events) == 4:
+                        return events
+
+    events = asyncio.run(follow())
+
+    assert [(e.type, e.block_number) for e in events] == [
+        (HeadEventType.ROWS, 17133219),
+        (HeadEventType.RETRACT, 17133219),
+        (HeadEventType.ROWS, 17133219),
+        (HeadEventType.ROWS, 17133220)
+    ]
+    assert events[1].keys == events[0].keys
+    assert events[2].block_hash != events[0].block_hash
+
+
+def test_stop_closes_transformer():
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        transformer = SemanticTransformer(json.loads(file.read()))
+    thread_pool = transformer._get_thread_pool()
+
+    async def follow():
+        async with StandInNode.from_file(GETH_BLOCK) as node:
+            async with BlockFetcher(node.url, NodeType.GETH) as fetcher:
+                events = HeadFollower(fetcher, EvmChain.ETHEREUM, transformer, poll_interval=0.01).follow()
+                await events.__anext__()
+                await events.aclose()
+
+    asyncio.run(follow())
+
+    assert thread_pool._shutdown
+    assert transformer._thread_pool is None
@@ -0,0 +1,55 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+# slow to import and only needed to call contracts, fetch blocks or print tables
+HEAVY_MODULES = ['web3', 'aiohttp', 'pandas']
+# seconds to import what's needed to load a transformer and transform blocks, about 3x what it takes now so only
+# something like another heavy dependency would go over
+IMPORT_BUDGET = 1.5
+
+
+@pytest.mark.parametrize('module', [
+    'semanticabi.SemanticTransformer',
+    'semanticabi.TransformerCache',
+    'semanticabi.BlockPipeline',
+    'semanticabi.Backfill',
+    'semanticabi.sink.ParquetSink'
+])
+def test_lazy_imports(module):
+    # a fresh interpreter so nothing has been imported by other tests
+    loaded = subprocess.run(
+        [sys.executable, '-c', f'import sys, json, {module}; print(json.dumps(sorted(sys.modules)))'],
+        capture_output=True, check=True, text=True
+    )
+    assert [name for name in HEAVY_MODULES if name in json.loads(loaded.stdout)] == []
+
+
+@pytest.mark.parametrize('module', ['semanticabi.SemanticTransformer', 'semanticabi.TransformerCache'])
+def test_import_time(module):
+    loaded = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+        capture_output=True, check=True, text=True
+    )
+    # lines of "import time: self [us] | cumulative | imported package", the module itself including all it imports
+    cumulative_us = next(
+        int(line.split('|')[1])
+        for line in loaded.stderr.splitlines()
+        if line.split('|')[-1].strip() == module
+    )
+    assert cumulative_us / 1e6 < IMPORT_BUDGET
+
+
+def test_transfer_abi():
+    loaded = subprocess.run(
+        [
+            sys.executable, '-c',
+            'import semanticabi.metadata.EthTransaction as t; print(t.transfer_abi.cache_info().currsize);'
+            'print(len(t.TRANSFER_ABI.events) > 0 and t.TRANSFER_DECODER is t.transfer_decoder())'
+        ],
+        capture_output=True, check=True, text=True
+    )
+    # only loaded once used
+    assert loaded.stdout.split() == ['0', 'True']
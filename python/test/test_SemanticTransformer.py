@@ -1,15 +1,20 @@
 import gzip
 import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict
 
 import pytest as pytest
 
-from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.SemanticTransformer import SemanticTransformer, ExecutionMode
 from semanticabi.abi.InvalidAbiException import InvalidAbiException
 from semanticabi.abi.SemanticAbi import TypedSemanticAbi
+from semanticabi.abi.item.SemanticAbiItem import SemanticAbiEvent
 from semanticabi.common.column.DatasetColumn import DatasetColumn
 from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EthLog import EthLog
 from semanticabi.metadata.EvmChain import EvmChain
+from semanticabi.steps.InitStep import InitStep
 
 
 def test_matching_schemas():
@@ -113,3 +118,295 @@ def test_seaport_block_union_schema():
     assert rows[0]['parameters_salt'] is None
     assert rows[1]['parameters_salt'] == '51951570786726798460324975021501917861654789585098516727729696327573800411544'
     assert rows[2]['parameters_salt'] == '51951570786726798460324975021501917861654789585098516727716053568646066475044'
+
+
+def test_transform_by_item():
+    with open('test/resources/contracts/seaport/abis/transform/primary_items_schema_diff_columns.json') as file:
+        semantic_transformer: SemanticTransformer = SemanticTransformer(json.loads(file.read()))
+    with gzip.open('test/resources/contracts/seaport/blocks/19072200.json.gz') as file:
+        block_json = json.loads(file.read())
+
+    rows_by_item = semantic_transformer.transform_by_item(EthBlock(EvmChain.ETHEREUM, block_json))
+    assert rows_by_item.keys() == semantic_transformer.schema_by_item.keys()
+    assert all(len(rows) > 0 for rows in rows_by_item.values())
+
+    # each item's rows are those of the union with only its columns
+    key = lambda row: (row['transactionHash'], row['internalIndex'], row['explodeIndex'])
+    union_rows = {key(row): row for row in semantic_transformer.transform(EthBlock(EvmChain.ETHEREUM, block_json))}
+    assert sum(len(rows) for rows in rows_by_item.values()) == len(union_rows)
+    for signature, rows in rows_by_item.items():
+        names = [column.name for column in semantic_transformer.schema_by_item[signature].columns()]
+        assert len(names) < len(semantic_transformer.schema.columns())
+        assert rows == [{name: union_rows[key(row)][name] for name in names} for row in rows]
+
+
+def test_events_skip_traces():
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        semantic_transformer: SemanticTransformer = SemanticTransformer(json.loads(file.read()))
+    with gzip.open('test/resources/contracts/seaport/blocks/19072200.json.gz') as file:
+        block: EthBlock = EthBlock(EvmChain.ETHEREUM, json.loads(file.read()))
+
+    assert len(semantic_transformer.transform(block)) > 0
+    # traces are never grouped by signature without primary functions
+    assert not any('traces_by_topic' in vars(transaction) for transaction in block.transactions)
+    assert any('logs_by_topic' in vars(transaction) for transaction in block.transactions)
+
+
+@pytest.mark.parametrize('abi_path', [
+    'test/resources/contracts/seaport/abis/transform/primary_items_schema_diff_columns.json',
+    'test/resources/contracts/erc20/abis/transfer_event.json'
+])
+def test_threads(abi_path):
+    with open(abi_path) as file:
+        semantic_transformer: SemanticTransformer = SemanticTransformer(json.loads(file.read()))
+    with gzip.open('test/resources/contracts/seaport/blocks/19072200.json.gz') as file:
+        block_json = json.loads(file.read())
+
+    # same rows in the same order however the transactions are sharded
+    rows = semantic_transformer.transform(EthBlock(EvmChain.ETHEREUM, block_json))
+    rows_by_item = semantic_transformer.transform_by_item(EthBlock(EvmChain.ETHEREUM, block_json))
+    for max_workers in [1, 3, 8]:
+        with ThreadPoolExecutor(max_workers) as executor:
+            assert semantic_transformer.transform(
+                EthBlock(EvmChain.ETHEREUM, block_json), ExecutionMode.THREADS, executor
+            ) == rows
+            assert semantic_transformer.transform_by_item(
+                EthBlock(EvmChain.ETHEREUM, block_json), ExecutionMode.THREADS, executor
+            ) == rows_by_item
+
+    # otherwise threads are from a pool kept across blocks, which isn't pickled
+    for _ in range(2):
+        assert semantic_transformer.transform(EthBlock(EvmChain.ETHEREUM, block_json), ExecutionMode.THREADS) == rows
+    thread_pool = semantic_transformer._thread_pool
+    assert thread_pool is not None
+    assert semantic_transformer._get_thread_pool() is thread_pool
+
+    unpickled: SemanticTransformer = pickle.loads(pickle.dumps(semantic_transformer))
+    assert unpickled._thread_pool is None
+    assert unpickled._thread_pool_lock is not semantic_transformer._thread_pool_lock
+    with unpickled:
+        assert unpickled.transform(EthBlock(EvmChain.ETHEREUM, block_json), ExecutionMode.THREADS) == rows
+    assert unpickled._thread_pool is None
+
+    # closing shuts the pool down, leaving the transformer usable with a new one
+    semantic_transformer.close()
+    assert thread_pool._shutdown
+    assert semantic_transformer.transform(EthBlock(EvmChain.ETHEREUM, block_json), ExecutionMode.THREADS) == rows
+    assert semantic_transformer._thread_pool is not thread_pool
+    semantic_transformer.close()
+
+
+def test_count():
+    with open('test/resources/contracts/seaport/abis/transform/primary_items_schema_equal.json') as file:
+        semantic_transformer: SemanticTransformer = SemanticTransformer(json.loads(file.read()))
+    with gzip.open('test/resources/contracts/seaport/blocks/19072200.json.gz') as file:
+        block: EthBlock = EthBlock(EvmChain.ETHEREUM, json.loads(file.read()))
+
+    counts: Dict[str, int] = semantic_transformer.count(block)
+    rows = semantic_transformer.transform(block)
+    assert sum(counts.values()) == len({(row['transactionHash'], row['internalIndex']) for row in rows})
+
+
+@pytest.mark.parametrize('abi_path, columns', [
+    (
+        'test/resources/contracts/seaport/abis/transform/primary_items_schema_equal.json',
+        ['transactionHash', 'parameters_offerer', 'fulfill_orderHash', 'transfer_tokenId']
+    ),
+    ('test/resources/contracts/seaport/abis/transform/primary_items_schema_diff_columns.json', ['fulfilled']),
+    ('test/resources/contracts/seaport/abis/explode/tuple.json', ['internalIndex', 'explodeIndex']),
+    ('test/resources/contracts/seaport/abis/explode/multiple.json', ['blockNumber']),
+    # expressions using earlier ones and a flattened parameter before it's overwritten
+    ('test/resources/contracts/seaport/abis/expression/expressions.json', ['offerer_expr', 'orderType_expr_use']),
+    ('test/resources/contracts/seaport/abis/expression/expressions.json', ['order_parameters_orderType']),
+    ('test/resources/contracts/seaport/abis/match/event_onlyone_with_exploded.json', ['contractAddress'])
+])
+def test_projection(abi_path, columns):
+    with open(abi_path) as file:
+        abi_json: TypedSemanticAbi = json.loads(file.read())
+
+    transformer: SemanticTransformer = SemanticTransformer(abi_json)
+    projected: SemanticTransformer = SemanticTransformer(abi_json, columns)
+    assert [column.name for column in projected.schema.columns()] \
+        == [column.name for column in transformer.schema.columns() if column.name in columns + ['transform_error']]
+
+    num_rows = 0
+    for block_number in [18937419, 19029959, 19044839, 19072200]:
+        with gzip.open(f'test/resources/contracts/seaport/blocks/{block_number}.json.gz') as file:
+            block_json = json.loads(file.read())
+
+        # projections only decode the parameters of their columns, so an item can fail on a different parameter with
+        # a different message, but fails either way
+        has_error = lambda row: {**row, 'transform_error': row['transform_error'] is not None}
+        expected = [
+            has_error({name: row[name] for name in columns + ['transform_error']})
+            for row in transformer.transform(EthBlock(EvmChain.ETHEREUM, block_json))
+        ]
+        rows = projected.transform(EthBlock(EvmChain.ETHEREUM, block_json))
+        assert [has_error(row) for row in rows] == expected
+        num_rows += len(rows)
+
+    assert num_rows > 0
+
+
+def test_projection_unknown_column():
+    with open('test/resources/contracts/seaport/abis/transform/primary_items_schema_equal.json') as file:
+        abi_json: TypedSemanticAbi = json.loads(file.read())
+
+    with pytest.raises(InvalidAbiException, match='Unknown columns in projection: missing'):
+        SemanticTransformer(abi_json, ['transactionHash', 'missing'])
+
+
+TRANSFER_TO = '0x28C6c06298d514Db089934071355E5743bf21d60'
+
+
+@pytest.mark.parametrize('abi_path, filters, predicate', [
+    # indexed parameters are also checked against the topics
+    (
+        'test/resources/contracts/erc20/abis/transfer_event.json',
+        [('to', '=', TRANSFER_TO)],
+        lambda row: row['to'] == TRANSFER_TO.lower()
+    ),
+    (
+        'test/resources/contracts/erc20/abis/transfer_event.json',
+        [('from', 'in', ['0x894648b0e7c85aa9f4e6c6e70e583105ca95b378', '0x80a64c6d7f12c47b7c66c5b4e20e72bc1fcd5d9e'])],
+        lambda row: row['from'] in ['0x894648b0e7c85aa9f4e6c6e70e583105ca95b378', '0x80a64c6d7f12c47b7c66c5b4e20e72bc1fcd5d9e']
+    ),
+    (
+        'test/resources/contracts/erc20/abis/transfer_event.json',
+        [('value', '>', 10 ** 18), ('to', '!=', TRANSFER_TO)],
+        lambda row: row['value'] is not None and int(row['value']) > 10 ** 18 and row['to'] != TRANSFER_TO.lower()
+    ),
+    # matched columns are filtered after the match
+    (
+        'test/resources/contracts/seaport/abis/transform/primary_items_schema_equal.json',
+        [('transfer_tokenId', '=', '209')],
+        lambda row: row['transfer_tokenId'] == '209'
+    ),
+    # constants are converted to the type of the column, ids are strings
+    (
+        'test/resources/contracts/seaport/abis/transform/primary_items_schema_equal.json',
+        [('transfer_tokenId', '=', 209)],
+        lambda row: row['transfer_tokenId'] == '209'
+    ),
+    (
+        'test/resources/contracts/erc20/abis/transfer_event.json',
+        [('value', 'in', [str(10 ** 18), 2 * 10 ** 18]), ('value', '>=', '1000')],
+        lambda row: row['value'] in [str(10 ** 18), str(2 * 10 ** 18)]
+    ),
+    # and numbers compare as numbers whether the values or constants are strings
+    (
+        'test/resources/contracts/erc20/abis/transfer_event.json',
+        [('value', '>=', '10000000000000000000')],
+        lambda row: row['value'] is not None and int(row['value']) >= 10 ** 19
+    ),
+    # parameters overwritten by expressions are filtered on their final values
+    (
+        'test/resources/contracts/seaport/abis/expression/expressions.json',
+        [('order_parameters_orderType', '=', 5), ('orderType_expr', '<=', 3)],
+        lambda row: row['order_parameters_orderType'] == 5 and row['orderType_expr'] <= 3
+    )
+])
+def test_filters(abi_path, filters, predicate):
+    with open(abi_path) as file:
+        abi_json: TypedSemanticAbi = json.loads(file.read())
+
+    transformer: SemanticTransformer = SemanticTransformer(abi_json)
+    filtered: SemanticTransformer = SemanticTransformer(abi_json, filters=filters)
+
+    num_rows = 0
+    for block_number in [18937419, 19029959, 19044839, 19072200]:
+        with gzip.open(f'test/resources/contracts/seaport/blocks/{block_number}.json.gz') as file:
+            block_json = json.loads(file.read())
+
+        all_rows = transformer.transform(EthBlock(EvmChain.ETHEREUM, block_json))
+        rows = filtered.transform(EthBlock(EvmChain.ETHEREUM, block_json))
+        assert [row for row in rows if row.get('transform_error') is None] \
+            == [row for row in all_rows if row.get('transform_error') is None and predicate(row)]
+        # items that failed to transform are kept with their errors unless their topics ruled them out
+        errors = [row for row in all_rows if row.get('transform_error') is not None]
+        assert all(row in errors for row in rows if row.get('transform_error') is not None)
+        num_rows += len(rows)
+
+    assert num_rows > 0
+
+
+def test_filters_skip_decoding(monkeypatch):
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        abi_json: TypedSemanticAbi = json.loads(file.read())
+    with gzip.open('test/resources/contracts/seaport/blocks/19072200.json.gz') as file:
+        block_json = json.loads(file.read())
+
+    # decode each log individually to count them
+    monkeypatch.setattr(InitStep, '_batch_decoded', lambda self, block: {})
+    decoded: List[EthLog] = []
+    decode = SemanticAbiEvent.decode
+    monkeypatch.setattr(SemanticAbiEvent, 'decode', lambda self, log, *args: decoded.append(log) or decode(self, log, *args))
+
+    rows = SemanticTransformer(abi_json, filters=[('to', '=', TRANSFER_TO)]).transform(EthBlock(EvmChain.ETHEREUM, block_json))
+    assert len(rows) == 12
+    assert len(decoded) == 12
+
+
+def test_filters_keep_errors():
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        abi_json: TypedSemanticAbi = json.loads(file.read())
+    with gzip.open('test/resources/contracts/seaport/blocks/19072200.json.gz') as file:
+        block_json = json.loads(file.read())
+
+    # truncate the data of a transfer to the filtered address so it can't be decoded
+    to_topic = f'0x{"0" * 24}{TRANSFER_TO[2:].lower()}'
+    malformed = next(
+        log for receipt in block_json['receipts'] for log in receipt['logs']
+        if len(log['topics']) == 3 and log['topics'][2] == to_topic
+    )
+    malformed['data'] = '0x12'
+
+    rows = SemanticTransformer(abi_json, filters=[('to', '=', TRANSFER_TO)]).transform(EthBlock(EvmChain.ETHEREUM, block_json))
+    errors = [row for row in rows if row['transform_error'] is not None]
+    assert [row['internalIndex'] for row in errors] == [str(int(malformed['logIndex'], 16))]
+    assert errors[0]['transform_error'] == 'Tried to read 32 bytes, only got 1 bytes.'
+    assert all(row['to'] == TRANSFER_TO.lower() for row in rows if row['transform_error'] is None)
+
+    # without topics to rule them out, every item that failed to decode is kept, the same as without filters
+    unfiltered = SemanticTransformer(abi_json).transform(EthBlock(EvmChain.ETHEREUM, block_json))
+    rows = SemanticTransformer(abi_json, filters=[('value', '>', 10 ** 18)]).transform(EthBlock(EvmChain.ETHEREUM, block_json))
+    assert [row for row in rows if row['transform_error'] is not None] \
+        == [row for row in unfiltered if row['transform_error'] is not None]
+
+
+def test_filters_unknown_column():
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        abi_json: TypedSemanticAbi = json.loads(file.read())
+
+    with pytest.raises(InvalidAbiException, match='Unknown columns in filters: missing = 1'):
+        SemanticTransformer(abi_json, filters=[('missing', '=', 1)])
+
+
+@pytest.mark.parametrize('row_filter', [('to', '=', True), ('value', '>', 'lots'), ('value', 'in', [1, '0x'])])
+def test_filters_wrong_type(row_filter):
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        abi_json: TypedSemanticAbi = json.loads(file.read())
+
+    with pytest.raises(InvalidAbiException, match='does not match the type of column'):
+        SemanticTransformer(abi_json, filters=[row_filter])
+
+
+def test_filters_ordered_strings():
+    with open('test/resources/contracts/seaport/abis/transform/primary_items_schema_equal.json') as file:
+        abi_json: TypedSemanticAbi = json.loads(file.read())
+
+    with pytest.raises(InvalidAbiException, match='can only compare string column'):
+        SemanticTransformer(abi_json, filters=[('transfer_tokenId', '>', '100')])
+
+
+def test_filters_with_projection():
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        abi_json: TypedSemanticAbi = json.loads(file.read())
+    with gzip.open('test/resources/contracts/seaport/blocks/19072200.json.gz') as file:
+        block_json = json.loads(file.read())
+
+    expected = SemanticTransformer(abi_json, filters=[('value', '>', 10 ** 18)]).transform(EthBlock(EvmChain.ETHEREUM, block_json))
+    # filtered columns are still produced for the filter even if not projected
+    rows = SemanticTransformer(abi_json, ['transactionHash'], [('value', '>', 10 ** 18)]).transform(EthBlock(EvmChain.ETHEREUM, block_json))
+    assert [row['transactionHash'] for row in rows] == [row['transactionHash'] for row in expected]
+    assert all('value' not in row for row in rows)
@@ -0,0 +1,89 @@
+import gzip
+import json
+import os
+
+import pytest
+
+from semanticabi.SemanticTransformer import SemanticTransformer
+from semanticabi.TransformerCache import TransformerCache, code_digest, dependency_versions
+from semanticabi.metadata.EthBlock import EthBlock
+from semanticabi.metadata.EvmChain import EvmChain
+
+
+@pytest.fixture(scope='module')
+def block_json():
+    with gzip.open('test/resources/contracts/seaport/blocks/19072200.json.gz') as file:
+        return json.loads(file.read())
+
+
+@pytest.mark.parametrize('abi_path', [
+    'test/resources/contracts/seaport/abis/expression/expressions.json',
+    'test/resources/contracts/seaport/abis/match/event_multiple_with_transfer.json',
+    'test/resources/contracts/erc20/abis/transfer_event.json'
+])
+def test_get(tmp_path, monkeypatch, block_json, abi_path):
+    with open(abi_path) as file:
+        abi_json = json.loads(file.read())
+
+    cache = TransformerCache(str(tmp_path))
+    transformer = cache.get(abi_json)
+    assert os.listdir(tmp_path) == [os.path.basename(cache.path(TransformerCache.digest(abi_json)))]
+
+    # loaded without constructing again
+    def construct(*args, **kwargs):
+        raise Exception('Constructed.')
+    monkeypatch.setattr(SemanticTransformer, '__init__', construct)
+    cached = cache.get(abi_json)
+    assert cached is not transformer
+    assert cached.schema.columns() == transformer.schema.columns()
+    assert cached.transform(EthBlock(EvmChain.ETHEREUM, block_json)) \
+        == transformer.transform(EthBlock(EvmChain.ETHEREUM, block_json))
+
+
+def test_digest():
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        abi_json = json.loads(file.read())
+
+    reordered = json.loads(json.dumps(abi_json, sort_keys=True))
+    assert TransformerCache.digest(abi_json) == TransformerCache.digest(reordered)
+    assert TransformerCache.digest(abi_json) != TransformerCache.digest(abi_json, ['to'])
+    assert TransformerCache.digest(abi_json, filters=[('to', 'in', {'0x1', '0x2'})]) \
+        == TransformerCache.digest(abi_json, filters=[('to', 'in', {'0x2', '0x1'})])
+
+
+def test_rebuild_corrupt(tmp_path):
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        abi_json = json.loads(file.read())
+
+    cache = TransformerCache(str(tmp_path))
+    path = cache.path(TransformerCache.digest(abi_json, ['to']))
+    with open(path, 'wb') as file:
+        file.write(b'partial')
+
+    transformer = cache.get(abi_json, ['to'])
+    assert [column.name for column in transformer.schema.columns()] == ['to', 'transform_error']
+    assert cache.get(abi_json, ['to']).schema.columns() == transformer.schema.columns()
+
+
+def test_path_by_source(tmp_path, monkeypatch):
+    cache = TransformerCache(str(tmp_path))
+    path = cache.path('digest')
+    assert code_digest()[:16] in path
+    assert cache.path('digest') == path
+
+    # entries from other versions of the code are ignored
+    monkeypatch.setattr('semanticabi.TransformerCache.source_digest', lambda: '0' * 64)
+    assert cache.path('digest') != path
+
+
+def test_path_by_dependencies(tmp_path, monkeypatch):
+    cache = TransformerCache(str(tmp_path))
+    path = cache.path('digest')
+    assert set(dependency_versions()) == {'pyarrow', 'eth-abi', 'antlr4-python3-runtime'}
+    assert all(version is not None for version in dependency_versions().values())
+
+    # as are entries built with other versions of dependencies
+    monkeypatch.setattr(
+        'semanticabi.TransformerCache.dependency_versions', lambda: {**dependency_versions(), 'pyarrow': '0.0.0'}
+    )
+    assert cache.path('digest') != path
@@ -0,0 +1,73 @@
+import asyncio
+import json
+
+from semanticabi.Backfill import Backfill, WorkUnit
+from semanticabi.BlockFetcher import BlockFetcher, NodeType
+from semanticabi.WorkScheduler import WorkScheduler, BlockCostModel
+from semanticabi.metadata.EvmChain import EvmChain
+from test.common.StandInNode import StandInNode
+
+
+GETH_BLOCK = 'test/resources/ethereum_traces/17133218_geth.json'
+
+
+def test_pack():
+    units = WorkScheduler.pack(100, [1, 1, 10, 1, 1, 1, 5, 2], 5)
+
+    assert units == [
+        (WorkUnit(102, 103), 10),
+        (WorkUnit(106, 107), 5),
+        (WorkUnit(103, 106), 3),
+        (WorkUnit(100, 102), 2),
+        (WorkUnit(107, 108), 2)
+    ]
+    # units cover the range without gaps
+    assert sorted(b for unit, _ in units for b in unit.blocks) == list(range(100, 108))
+
+
+def test_pack_empty():
+    assert WorkScheduler.pack(100, [], 5) == []
+
+
+def test_schedule():
+    node = StandInNode.from_file(GETH_BLOCK)
+    start = node.head + 1
+    for transactions in [1, 1, 1, 100, 1, 1, 1, 1]:
+        node.extend(1, transactions)
+
+    async def schedule():
+        async with node:
+            async with BlockFetcher(node.url, NodeType.GETH, max_connections=4) as fetcher:
+                scheduler = WorkScheduler(fetcher, BlockCostModel(per_million_gas=0, per_kilobyte=0))
+                costs = await scheduler.estimate(start, start + 8)
+                return costs, await scheduler.schedule(start, start + 8, 6)
+
+    costs, units = asyncio.run(schedule())
+
+    assert costs == [2, 2, 2, 101, 2, 2, 2, 2]
+    assert units == [WorkUnit(start + 3, start + 4), WorkUnit(start, start + 3), WorkUnit(start + 4, start + 7), WorkUnit(start + 7, start + 8)]
+    # headers are fetched without full transactions
+    assert node.calls['eth_getBlockByNumber'] == 16
+
+
+def test_backfill_scheduled(tmp_path):
+    node = StandInNode.from_file(GETH_BLOCK)
+    start = node.head + 1
+    for transactions in [5, 50, 5, 5]:
+        node.extend(1, transactions)
+
+    with open('test/resources/contracts/erc20/abis/transfer_event.json') as file:
+        abi_json = json.loads(file.read())
+
+    async def run():
+        async with node:
+            async with BlockFetcher(node.url, NodeType.GETH, max_connections=4) as fetcher:
+                units = await WorkScheduler(fetcher).schedule(start, start + 4, 60)
+                backfill = Backfill(fetcher, EvmChain.ETHEREUM, abi_json, str(tmp_path), workers=2, processes=0)
+                return units, await backfill.run_units(start, start + 4, units)
+
+    units, manifest = asyncio.run(run())
+
+    assert units[0] == WorkUnit(start + 1, start + 2)
+    assert manifest.units == units
+    assert manifest.remaining == []